@@ -0,0 +1,206 @@
+"""Prefix-indexed autocomplete over previously translated inputs."""
+
+import heapq
+import math
+import os
+import threading
+import time
+import zlib
+from bisect import bisect_left, insort
+from itertools import groupby
+
+from cache import normalize_text
+
+# Ranges longer than this are not scanned; their top entries are cached
+MAX_SCAN = 128
+# Entries kept per cached prefix
+TOP_SIZE = 16
+# Cached prefixes before the cache is reset
+MAX_CACHED_PREFIXES = 16384
+SNAPSHOT_VERSION = b'QTHIST1\n'
+
+
+def normalize_key(text: str) -> str:
+    return normalize_text(text).casefold()
+
+
+def rank_dense_prefixes(keys: list, entries: dict) -> dict:
+    """Top keys of every prefix too dense to scan on each keystroke."""
+    top = {}
+    pending = [(keys, 1)]
+    while pending:
+        group_keys, length = pending.pop()
+        for prefix, group in groupby(group_keys, key=lambda key: key[:length]):
+            group = list(group)
+            if len(group) > MAX_SCAN:
+                top[prefix] = heapq.nlargest(TOP_SIZE, group, key=lambda key: entries[key][1])
+                pending.append((group, length + 1))
+    return top
+
+
+class HistoryIndex:
+    """
+    Sorted array of normalized inputs searched with bisect.
+
+    Ranking is frecency: every use adds 1 to a score that halves every
+    half_life_days. The rank is stored as log2(score) + time / half_life,
+    which orders entries the same way at any moment, so it only changes
+    when an entry is used and cached top lists stay valid.
+    """
+
+    def __init__(self, half_life_days: float = 14.0, max_entries: int = 200000):
+        self.half_life = half_life_days * 86400
+        self.max_entries = max_entries
+        self.keys = []  # Sorted normalized inputs
+        self.entries = {}  # key -> [text, rank, count]
+        self.top = {}  # prefix -> keys with the highest rank, best first
+        self.lock = threading.Lock()
+        self.save_lock = threading.Lock()
+        self.dirty = False
+
+    def __len__(self):
+        return len(self.entries)
+
+    def _rank_after_use(self, rank: float, now: float) -> float:
+        if rank is None:
+            return now / self.half_life
+        score = 2.0 ** (rank - now / self.half_life)
+        return math.log2(score + 1.0) + now / self.half_life
+
+    def record(self, text: str, now: float = None):
+        """Count one use of text (incremental; O(log n) search + list insert)."""
+        text = normalize_text(text)
+        key = text.casefold()
+        if not key:
+            return
+        now = time.time() if now is None else now
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                entry = self.entries[key] = [text, None, 0]
+                insort(self.keys, key)
+            entry[0] = text
+            entry[1] = self._rank_after_use(entry[1], now)
+            entry[2] += 1
+            # Ranks only grow, so cached top lists just need this key moved up
+            for end in range(1, len(key) + 1):
+                top = self.top.get(key[:end])
+                if top is not None:
+                    self._promote(top, key)
+            self.dirty = True
+            if len(self.entries) > self.max_entries * 1.1:
+                self._evict()
+
+    def _promote(self, top: list, key: str):
+        if key in top:
+            top.remove(key)
+        rank = self.entries[key][1]
+        index = 0
+        while index < len(top) and self.entries[top[index]][1] >= rank:
+            index += 1
+        if index < TOP_SIZE:
+            top.insert(index, key)
+            del top[TOP_SIZE:]
+
+    def _evict(self):
+        """Drop the lowest ranked entries down to max_entries."""
+        keep = heapq.nlargest(self.max_entries, self.entries.items(), key=lambda item: item[1][1])
+        self.entries = dict(keep)
+        self.keys = sorted(self.entries)
+        self.top = rank_dense_prefixes(self.keys, self.entries)
+
+    def _range(self, prefix: str):
+        lo = bisect_left(self.keys, prefix)
+        hi = bisect_left(self.keys, prefix + '\U0010ffff', lo)
+        return lo, hi
+
+    def _rank(self, key: str) -> float:
+        return self.entries[key][1]
+
+    def complete(self, prefix: str, limit: int = 5) -> list:
+        """Best completions of prefix as the originally typed texts."""
+        prefix = normalize_key(prefix)
+        if not prefix or limit <= 0:
+            return []
+        with self.lock:
+            top = self.top.get(prefix)
+            if top is None:
+                lo, hi = self._range(prefix)
+                if hi - lo > MAX_SCAN:
+                    # Dense prefix: rank once, then keep it current in record()
+                    if len(self.top) >= MAX_CACHED_PREFIXES:
+                        self.top = {}
+                    top = self.top[prefix] = heapq.nlargest(
+                        TOP_SIZE, self.keys[lo:hi], key=self._rank)
+                else:
+                    top = heapq.nlargest(limit + 1, self.keys[lo:hi], key=self._rank)
+            return [self.entries[key][0] for key in top if key != prefix][:limit]
+
+    def trim(self):
+        """Forget cached top lists (idle trimming); dense prefixes are ranked again on use."""
+        with self.lock:
+            self.top = {}
+
+    def stats(self) -> dict:
+        return {'entries': len(self.entries), 'cached_prefixes': len(self.top)}
+
+    def save(self, path):
+        """Write a compressed snapshot (atomically) if anything changed."""
+        with self.save_lock:
+            with self.lock:
+                if not self.dirty:
+                    return False
+                rows = [f"{rank!r}\t{count}\t{text}" for text, rank, count in self.entries.values()]
+                self.dirty = False
+            data = SNAPSHOT_VERSION + zlib.compress('\n'.join(rows).encode('utf-8'), 6)
+            temp = f"{path}.tmp"
+            with open(temp, 'wb') as f:
+                f.write(data)
+            os.replace(temp, path)
+            return True
+
+    def load(self, path):
+        """Merge a snapshot into the index; returns the number of entries read."""
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+        except FileNotFoundError:
+            return 0
+        if not data.startswith(SNAPSHOT_VERSION):
+            return 0
+        try:
+            text = zlib.decompress(data[len(SNAPSHOT_VERSION):]).decode('utf-8')
+        except (zlib.error, UnicodeDecodeError):
+            return 0
+
+        # Parse outside the lock so typing is never blocked by a load
+        entries = {}
+        for line in text.split('\n'):
+            parts = line.split('\t', 2)
+            if len(parts) == 3:
+                key = normalize_key(parts[2])
+                if key:
+                    entries[key] = [parts[2], float(parts[0]), int(parts[1])]
+        keys = sorted(entries)
+        top = rank_dense_prefixes(keys, entries)
+
+        with self.lock:
+            recorded = self.entries
+            self.entries = entries
+            self.keys = keys
+            self.top = top
+            # Merge anything recorded while the snapshot was loading
+            for key, entry in recorded.items():
+                loaded = entries.get(key)
+                if loaded is not None and loaded[1] >= entry[1]:
+                    continue
+                entries[key] = entry
+                if loaded is None:
+                    insort(keys, key)
+                for end in range(1, len(key) + 1):
+                    cached = top.get(key[:end])
+                    if cached is not None:
+                        self._promote(cached, key)
+            if len(self.entries) > self.max_entries:
+                self._evict()
+        return len(entries)
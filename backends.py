@@ -0,0 +1,1015 @@
+"""Pluggable translation backends used by TranslationService."""
+
+import asyncio
+import http.client
+import json
+import socket
+import ssl
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import deque, namedtuple
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from urllib.parse import urlsplit
+
+from breaker import HALF_OPEN, CircuitBreaker, backoff_delay
+from metrics import metrics
+
+# Same attribute names as googletrans results
+Detected = namedtuple('Detected', ['lang', 'confidence'])
+Translated = namedtuple('Translated', ['text', 'src', 'dest'])
+
+
+class BackendError(Exception):
+    """Raised when a backend cannot complete a request."""
+
+    def __init__(self, message: str = '', status: int = None):
+        super().__init__(message)
+        self.status = status  # HTTP status, if the server answered
+
+
+class CircuitOpenError(BackendError):
+    """Raised without contacting the backend while its circuit is open."""
+
+
+class TranslationBackend(ABC):
+    """Interface every translation engine implements."""
+
+    name = 'base'
+    # True when the a* methods use asyncio natively instead of worker threads
+    supports_async = False
+
+    @abstractmethod
+    def detect(self, text: str) -> Detected:
+        """Detect the language of text."""
+
+    @abstractmethod
+    def translate(self, text: str, dest: str, src: str = 'auto') -> Translated:
+        """Translate text to dest. src='auto' lets the engine detect it."""
+
+    def translate_batch(self, texts: list, dest: str, src: str = 'auto') -> list:
+        """Translate several texts. Backends override this to use one request."""
+        return [self.translate(text, dest=dest, src=src) for text in texts]
+
+    async def adetect(self, text: str) -> Detected:
+        """Async detect(); runs the blocking call in a worker thread by default."""
+        return await asyncio.to_thread(self.detect, text)
+
+    async def atranslate(self, text: str, dest: str, src: str = 'auto') -> Translated:
+        """Async translate(); runs the blocking call in a worker thread by default."""
+        return await asyncio.to_thread(self.translate, text, dest, src)
+
+    async def atranslate_batch(self, texts: list, dest: str, src: str = 'auto') -> list:
+        """Async translate_batch(); runs the blocking call in a worker thread by default."""
+        return await asyncio.to_thread(self.translate_batch, texts, dest, src)
+
+    def warm_up(self):
+        """Load whatever the first request would otherwise wait for."""
+
+    def prewarm(self, max_idle: float = 15.0, open_new: bool = True) -> str:
+        """
+        Have a ready connection waiting for the next request.
+        Returns 'warm', 'refreshed', 'opened', 'none' or 'failed'.
+        """
+        return 'none'
+
+    async def aprewarm(self, max_idle: float = 15.0, open_new: bool = True) -> str:
+        """Async prewarm(); runs the blocking call in a worker thread by default."""
+        return await asyncio.to_thread(self.prewarm, max_idle, open_new)
+
+    def stats(self) -> dict:
+        """Connection counters."""
+        return {}
+
+    def close(self):
+        """Release network resources."""
+
+
+class GoogleBackend(TranslationBackend):
+    """Google Translate through googletrans (one client per thread)."""
+
+    name = 'google'
+
+    def __init__(self, timeout: float = None):
+        self.timeout = timeout
+        self.local = threading.local()
+        self.translators = {}  # Thread -> its client, for close()
+        self.lock = threading.Lock()
+
+    @property
+    def translator(self):
+        translator = getattr(self.local, 'translator', None)
+        if translator is None:
+            from googletrans import Translator
+            translator = Translator(timeout=self.timeout)
+            self.local.translator = translator
+            with self.lock:
+                # Server connections and worker pools come and go: only
+                # threads still running keep their client
+                finished = [thread for thread in self.translators if not thread.is_alive()]
+                stale = [self.translators.pop(thread) for thread in finished]
+                self.translators[threading.current_thread()] = translator
+            for old in stale:
+                self._close_translator(old)
+        return translator
+
+    @staticmethod
+    def _close_translator(translator):
+        client = getattr(translator, 'client', None)  # httpx.Client
+        if client is not None:
+            client.close()
+
+    def warm_up(self):
+        import googletrans  # Slow import; keep it off the first request
+
+    def detect(self, text: str) -> Detected:
+        detected = self.translator.detect(text)
+        if not detected:
+            return Detected('en', 0.0)
+        return Detected(detected.lang.lower(), detected.confidence or 0.0)
+
+    def translate(self, text: str, dest: str, src: str = 'auto') -> Translated:
+        result = self.translator.translate(text, dest=dest, src=src)
+        return Translated(result.text, result.src.lower(), dest)
+
+    def translate_batch(self, texts: list, dest: str, src: str = 'auto') -> list:
+        results = self.translator.translate(list(texts), dest=dest, src=src)
+        return [Translated(r.text, r.src.lower(), dest) for r in results]
+
+    def close(self):
+        with self.lock:
+            translators, self.translators = self.translators, {}
+            self.local = threading.local()
+        for translator in translators.values():
+            self._close_translator(translator)
+
+
+class _DNSCache:
+    """Caches getaddrinfo results for a short time."""
+
+    def __init__(self, ttl: float = 300.0):
+        self.ttl = ttl
+        self.entries = {}
+        self.lock = threading.Lock()
+
+    def resolve(self, host: str, port: int):
+        now = time.monotonic()
+        with self.lock:
+            entry = self.entries.get((host, port))
+            if entry and now - entry[1] < self.ttl:
+                return entry[0]
+        infos = socket.getaddrinfo(host, port, type=socket.SOCK_STREAM)
+        address = infos[0][4][:2]
+        with self.lock:
+            self.entries[(host, port)] = (address, now)
+        return address
+
+    def forget(self, host: str, port: int):
+        with self.lock:
+            self.entries.pop((host, port), None)
+
+
+class _PooledConnection(http.client.HTTPConnection):
+    """HTTP(S) connection that connects to a DNS-cached address."""
+
+    def __init__(self, host, port, dns, connect_timeout, read_timeout, ssl_context=None):
+        super().__init__(host, port, timeout=read_timeout)
+        self.dns = dns
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.ssl_context = ssl_context
+        self.last_used = time.monotonic()
+
+    def connect(self):
+        with metrics.span('backend_connect'):
+            address = self.dns.resolve(self.host, self.port)
+            try:
+                sock = socket.create_connection(address, self.connect_timeout)
+            except OSError:
+                self.dns.forget(self.host, self.port)
+                raise
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            if self.ssl_context is not None:
+                sock = self.ssl_context.wrap_socket(sock, server_hostname=self.host)
+            sock.settimeout(self.read_timeout)
+            self.sock = sock
+
+
+class ConnectionPool:
+    """Keep-alive connection pool for one HTTP(S) origin."""
+
+    def __init__(self, base_url: str, max_size: int = 4,
+                 connect_timeout: float = 3.0, read_timeout: float = 10.0,
+                 idle_timeout: float = 60.0):
+        parts = urlsplit(base_url)
+        self.scheme = parts.scheme or 'http'
+        self.host = parts.hostname
+        self.port = parts.port or (443 if self.scheme == 'https' else 80)
+        self.base_path = parts.path.rstrip('/')
+        self.max_size = max_size
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.idle_timeout = idle_timeout
+        self.ssl_context = ssl.create_default_context() if self.scheme == 'https' else None
+        self.dns = _DNSCache()
+        self.idle = []
+        self.lock = threading.Lock()
+        self.stats = {'connections_opened': 0, 'connections_reused': 0,
+                      'prewarm_opened': 0, 'prewarm_refreshed': 0}
+
+    def _new_connection(self):
+        self.stats['connections_opened'] += 1
+        return _PooledConnection(self.host, self.port, self.dns,
+                                 self.connect_timeout, self.read_timeout,
+                                 self.ssl_context)
+
+    def acquire(self):
+        """Take an idle connection or open a new one. Returns (conn, reused)."""
+        now = time.monotonic()
+        with self.lock:
+            while self.idle:
+                conn = self.idle.pop()
+                if now - conn.last_used < self.idle_timeout:
+                    self.stats['connections_reused'] += 1
+                    return conn, True
+                conn.close()
+        return self._new_connection(), False
+
+    def release(self, conn):
+        """Return a healthy connection to the pool."""
+        conn.last_used = time.monotonic()
+        with self.lock:
+            if len(self.idle) < self.max_size:
+                self.idle.append(conn)
+                return
+        conn.close()
+
+    def request(self, method: str, path: str, body: bytes = None, headers: dict = None):
+        """Send a request and return (status, body bytes)."""
+        headers = dict(headers or {})
+        headers.setdefault('Connection', 'keep-alive')
+        start = time.perf_counter()
+        conn, reused = self.acquire()
+        try:
+            try:
+                conn.request(method, self.base_path + path, body=body, headers=headers)
+                response = conn.getresponse()
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                if not reused:
+                    raise
+                # The server dropped an idle keep-alive connection; retry once
+                conn.close()
+                conn = self._new_connection()
+                reused = False
+                conn.request(method, self.base_path + path, body=body, headers=headers)
+                response = conn.getresponse()
+            data = response.read()
+        except Exception:
+            conn.close()
+            raise
+
+        if response.will_close:
+            conn.close()
+        else:
+            self.release(conn)
+        # Cold requests include connection setup; the gap to warm ones is the penalty
+        metrics.record('backend_request_warm' if reused else 'backend_request_cold',
+                       time.perf_counter() - start)
+        return response.status, data
+
+    def prewarm(self, max_idle: float = 15.0, open_new: bool = True) -> str:
+        """
+        Make sure a usable connection is waiting in the pool.
+        The newest idle connection is left alone if it was used within
+        max_idle seconds, otherwise it is refreshed with a GET /ping. When
+        there is none, a new one is opened unless open_new is False.
+        """
+        now = time.monotonic()
+        while True:
+            with self.lock:
+                if not self.idle:
+                    break
+                conn = self.idle.pop()
+                if now - conn.last_used < max_idle:
+                    self.idle.append(conn)
+                    return 'warm'
+            if now - conn.last_used >= self.idle_timeout:
+                conn.close()
+                continue
+            try:
+                conn.request('GET', self.base_path + '/ping',
+                             headers={'Connection': 'keep-alive'})
+                response = conn.getresponse()
+                response.read()
+            except (OSError, http.client.HTTPException):
+                conn.close()
+                continue
+            if response.will_close:
+                conn.close()
+                continue
+            self.stats['prewarm_refreshed'] += 1
+            self.release(conn)
+            return 'refreshed'
+
+        if not open_new:
+            return 'none'
+        conn = self._new_connection()
+        try:
+            conn.connect()
+        except OSError:
+            conn.close()
+            return 'failed'
+        self.stats['prewarm_opened'] += 1
+        self.release(conn)
+        return 'opened'
+
+    def close(self):
+        """Close every idle connection."""
+        with self.lock:
+            idle, self.idle = self.idle, []
+        for conn in idle:
+            conn.close()
+
+
+class AsyncConnectionPool:
+    """
+    asyncio keep-alive connection pool for one HTTP(S) origin.
+    Many concurrent requests share at most max_size sockets.
+    Must only be used from one event loop.
+    """
+
+    def __init__(self, base_url: str, max_size: int = 64,
+                 connect_timeout: float = 3.0, read_timeout: float = 10.0,
+                 idle_timeout: float = 60.0, dns_ttl: float = 300.0):
+        parts = urlsplit(base_url)
+        self.scheme = parts.scheme or 'http'
+        self.host = parts.hostname
+        self.port = parts.port or (443 if self.scheme == 'https' else 80)
+        self.base_path = parts.path.rstrip('/')
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.idle_timeout = idle_timeout
+        self.dns_ttl = dns_ttl
+        self.ssl_context = ssl.create_default_context() if self.scheme == 'https' else None
+        self.address = None
+        self.resolved_at = 0.0
+        self.idle = []
+        self.semaphore = asyncio.Semaphore(max_size)
+        self.stats = {'connections_opened': 0, 'connections_reused': 0,
+                      'prewarm_opened': 0, 'prewarm_refreshed': 0}
+
+    async def _resolve(self):
+        now = time.monotonic()
+        if self.address is None or now - self.resolved_at > self.dns_ttl:
+            loop = asyncio.get_running_loop()
+            infos = await loop.getaddrinfo(self.host, self.port, type=socket.SOCK_STREAM)
+            self.address = infos[0][4][:2]
+            self.resolved_at = now
+        return self.address
+
+    async def _connect(self):
+        start = time.perf_counter()
+        host, port = await self._resolve()
+        try:
+            reader, writer = await asyncio.wait_for(
+                asyncio.open_connection(
+                    host, port, ssl=self.ssl_context,
+                    server_hostname=self.host if self.ssl_context else None),
+                self.connect_timeout)
+        except OSError:
+            self.address = None
+            raise
+        metrics.record('backend_connect', time.perf_counter() - start)
+        sock = writer.get_extra_info('socket')
+        if sock is not None:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.stats['connections_opened'] += 1
+        return reader, writer
+
+    async def _acquire(self):
+        now = time.monotonic()
+        while self.idle:
+            reader, writer, last_used = self.idle.pop()
+            if now - last_used < self.idle_timeout and not reader.at_eof():
+                self.stats['connections_reused'] += 1
+                return reader, writer, True
+            writer.close()
+        reader, writer = await self._connect()
+        return reader, writer, False
+
+    async def _exchange(self, reader, writer, request: bytes):
+        writer.write(request)
+        await writer.drain()
+
+        status_line = await reader.readline()
+        if not status_line:
+            raise ConnectionResetError('Connection closed by server')
+        status = int(status_line.split()[1])
+
+        headers = {}
+        while True:
+            line = await reader.readline()
+            if line in (b'\r\n', b'\n', b''):
+                break
+            name, _, value = line.decode('latin-1').partition(':')
+            headers[name.strip().lower()] = value.strip()
+
+        if headers.get('transfer-encoding', '').lower() == 'chunked':
+            chunks = []
+            while True:
+                size = int((await reader.readline()).split(b';')[0], 16)
+                if size == 0:
+                    await reader.readline()
+                    break
+                chunks.append(await reader.readexactly(size))
+                await reader.readline()
+            data = b''.join(chunks)
+        else:
+            data = await reader.readexactly(int(headers.get('content-length', 0)))
+
+        keep_alive = headers.get('connection', '').lower() != 'close'
+        return status, data, keep_alive
+
+    def _build_request(self, method: str, path: str, body: bytes = b'',
+                       headers: dict = None) -> bytes:
+        lines = [f"{method} {self.base_path + path} HTTP/1.1",
+                 f"Host: {self.host}",
+                 f"Content-Length: {len(body)}",
+                 "Connection: keep-alive"]
+        lines.extend(f"{k}: {v}" for k, v in (headers or {}).items())
+        return ('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1') + body
+
+    async def request(self, method: str, path: str, body: bytes = b'', headers: dict = None):
+        """Send a request and return (status, body bytes)."""
+        request = self._build_request(method, path, body, headers)
+
+        async with self.semaphore:
+            start = time.perf_counter()
+            reader, writer, reused = await self._acquire()
+            try:
+                try:
+                    status, data, keep_alive = await asyncio.wait_for(
+                        self._exchange(reader, writer, request), self.read_timeout)
+                except (ConnectionResetError, BrokenPipeError, asyncio.IncompleteReadError):
+                    if not reused:
+                        raise
+                    # The server dropped an idle keep-alive connection; retry once
+                    writer.close()
+                    reader, writer = await self._connect()
+                    reused = False
+                    status, data, keep_alive = await asyncio.wait_for(
+                        self._exchange(reader, writer, request), self.read_timeout)
+            except BaseException:
+                # Includes cancellation: the connection state is unknown
+                writer.close()
+                raise
+
+            if keep_alive:
+                self.idle.append((reader, writer, time.monotonic()))
+            else:
+                writer.close()
+            metrics.record('backend_request_warm' if reused else 'backend_request_cold',
+                           time.perf_counter() - start)
+            return status, data
+
+    async def prewarm(self, max_idle: float = 15.0, open_new: bool = True) -> str:
+        """Async counterpart of ConnectionPool.prewarm()."""
+        now = time.monotonic()
+        async with self.semaphore:
+            while self.idle:
+                reader, writer, last_used = self.idle.pop()
+                if now - last_used < max_idle and not reader.at_eof():
+                    self.idle.append((reader, writer, last_used))
+                    return 'warm'
+                if now - last_used >= self.idle_timeout or reader.at_eof():
+                    writer.close()
+                    continue
+                try:
+                    _, _, keep_alive = await asyncio.wait_for(
+                        self._exchange(reader, writer, self._build_request('GET', '/ping')),
+                        self.read_timeout)
+                except (OSError, ValueError, asyncio.TimeoutError, asyncio.IncompleteReadError):
+                    writer.close()
+                    continue
+                except BaseException:
+                    writer.close()
+                    raise
+                if not keep_alive:
+                    writer.close()
+                    continue
+                self.idle.append((reader, writer, time.monotonic()))
+                self.stats['prewarm_refreshed'] += 1
+                return 'refreshed'
+
+            if not open_new:
+                return 'none'
+            try:
+                reader, writer = await self._connect()
+            except (OSError, asyncio.TimeoutError):
+                return 'failed'
+            self.idle.append((reader, writer, time.monotonic()))
+            self.stats['prewarm_opened'] += 1
+            return 'opened'
+
+    def close(self):
+        """Close every idle connection."""
+        idle, self.idle = self.idle, []
+        for _, writer, _ in idle:
+            writer.close()
+
+
+class HttpBackend(TranslationBackend):
+    """
+    JSON-over-HTTP backend (self-hosted engine or fake_server.py).
+
+    Protocol:
+        POST /detect           {"text"}                 -> {"lang", "confidence"}
+        POST /translate        {"text", "src", "dest"}  -> {"text", "src", "dest"}
+        POST /translate_batch  {"texts", "src", "dest"} -> {"results": [...]}
+        GET  /ping                                      -> any (keep-alive refresh)
+    """
+
+    name = 'http'
+    supports_async = True
+
+    def __init__(self, base_url: str, max_connections: int = 4,
+                 connect_timeout: float = 3.0, read_timeout: float = 10.0,
+                 max_async_connections: int = 64):
+        self.base_url = base_url
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.max_async_connections = max_async_connections
+        self.pool = ConnectionPool(base_url, max_size=max_connections,
+                                   connect_timeout=connect_timeout,
+                                   read_timeout=read_timeout)
+        self.async_pool = None  # Created on first use, inside the event loop
+
+    def _post(self, path: str, payload: dict) -> dict:
+        body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        try:
+            status, data = self.pool.request('POST', path, body=body, headers={
+                'Content-Type': 'application/json; charset=utf-8',
+            })
+        except OSError as e:
+            raise BackendError(str(e)) from e
+        return self._parse(status, data)
+
+    def _async_pool(self) -> AsyncConnectionPool:
+        if self.async_pool is None:
+            self.async_pool = AsyncConnectionPool(
+                self.base_url, max_size=self.max_async_connections,
+                connect_timeout=self.connect_timeout, read_timeout=self.read_timeout)
+        return self.async_pool
+
+    async def _apost(self, path: str, payload: dict) -> dict:
+        body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        try:
+            status, data = await self._async_pool().request('POST', path, body=body, headers={
+                'Content-Type': 'application/json; charset=utf-8',
+            })
+        except (OSError, asyncio.TimeoutError, asyncio.IncompleteReadError) as e:
+            raise BackendError(str(e) or type(e).__name__) from e
+        return self._parse(status, data)
+
+    @staticmethod
+    def _parse(status: int, data: bytes) -> dict:
+        if status != 200:
+            raise BackendError(f"HTTP {status}: {data[:200].decode('utf-8', 'replace')}", status)
+        return json.loads(data.decode('utf-8'))
+
+    def detect(self, text: str) -> Detected:
+        data = self._post('/detect', {'text': text})
+        return Detected(data['lang'], data.get('confidence', 0.0))
+
+    def translate(self, text: str, dest: str, src: str = 'auto') -> Translated:
+        data = self._post('/translate', {'text': text, 'src': src, 'dest': dest})
+        return Translated(data['text'], data['src'], data.get('dest', dest))
+
+    def translate_batch(self, texts: list, dest: str, src: str = 'auto') -> list:
+        data = self._post('/translate_batch', {'texts': list(texts), 'src': src, 'dest': dest})
+        return [Translated(r['text'], r['src'], r.get('dest', dest)) for r in data['results']]
+
+    async def adetect(self, text: str) -> Detected:
+        data = await self._apost('/detect', {'text': text})
+        return Detected(data['lang'], data.get('confidence', 0.0))
+
+    async def atranslate(self, text: str, dest: str, src: str = 'auto') -> Translated:
+        data = await self._apost('/translate', {'text': text, 'src': src, 'dest': dest})
+        return Translated(data['text'], data['src'], data.get('dest', dest))
+
+    async def atranslate_batch(self, texts: list, dest: str, src: str = 'auto') -> list:
+        data = await self._apost('/translate_batch', {'texts': list(texts), 'src': src, 'dest': dest})
+        return [Translated(r['text'], r['src'], r.get('dest', dest)) for r in data['results']]
+
+    def prewarm(self, max_idle: float = 15.0, open_new: bool = True) -> str:
+        return self.pool.prewarm(max_idle, open_new)
+
+    async def aprewarm(self, max_idle: float = 15.0, open_new: bool = True) -> str:
+        return await self._async_pool().prewarm(max_idle, open_new)
+
+    def stats(self) -> dict:
+        stats = {f"sync_{k}": v for k, v in self.pool.stats.items()}
+        if self.async_pool is not None:
+            stats.update((f"async_{k}", v) for k, v in self.async_pool.stats.items())
+        return stats
+
+    def close(self):
+        self.pool.close()
+        if self.async_pool is not None:
+            self.async_pool.close()
+
+
+class HedgedBackend(TranslationBackend):
+    """
+    Races slow requests against other backends to cut tail latency.
+
+    Every request goes to the first backend. If it has not answered after
+    the hedge delay (the rolling `percentile` of recent successful calls
+    of that kind, at least min_delay), a duplicate goes to the next
+    backend; the first successful answer wins and the rest are cancelled.
+    A failed call fails over to the next backend right away.
+
+    Hedges spend a budget that grows by max_extra per request, so they add
+    at most that fraction of extra load (plus a small burst). Async losers
+    are cancelled; blocking calls cannot be interrupted, so sync losers
+    finish in a worker thread and their result is dropped.
+    """
+
+    name = 'hedged'
+    # Hedges allowed back to back before the budget runs dry
+    BURST = 5.0
+    # Successful calls needed before the percentile is trusted
+    MIN_SAMPLES = 20
+
+    def __init__(self, backends: list, percentile: float = 90, min_delay: float = 0.03,
+                 max_extra: float = 0.1, initial_delay: float = 1.0, window: int = 200):
+        if not backends:
+            raise ValueError('HedgedBackend needs at least one backend')
+        self.backends = list(backends)
+        self.supports_async = all(backend.supports_async for backend in self.backends)
+        self.percentile = percentile
+        self.min_delay = min_delay
+        self.max_extra = max_extra
+        self.initial_delay = initial_delay
+        self.window = window
+        self.latencies = {}  # call kind -> recent successful call durations
+        self.budget = self.BURST
+        self.lock = threading.Lock()
+        self.executor = None
+        self.counters = {'hedge_requests': 0, 'hedges_sent': 0, 'alternate_wins': 0,
+                         'hedge_budget_skips': 0, 'failovers': 0}
+
+    def hedge_delay(self, kind: str) -> float:
+        """Seconds to wait for a call of this kind before hedging it."""
+        with self.lock:
+            samples = list(self.latencies.get(kind, ()))
+        if len(samples) < self.MIN_SAMPLES:
+            return self.initial_delay
+        samples.sort()
+        value = samples[min(len(samples) - 1, int(len(samples) * self.percentile / 100))]
+        return max(self.min_delay, value)
+
+    def _record(self, kind: str, seconds: float):
+        with self.lock:
+            samples = self.latencies.get(kind)
+            if samples is None:
+                samples = self.latencies[kind] = deque(maxlen=self.window)
+            samples.append(seconds)
+
+    def _start_request(self):
+        with self.lock:
+            self.counters['hedge_requests'] += 1
+            self.budget = min(self.BURST, self.budget + self.max_extra)
+
+    def _take_hedge(self) -> bool:
+        """Spend one hedge from the budget; counts a skip if there is none."""
+        with self.lock:
+            if self.budget >= 1.0:
+                self.budget -= 1.0
+                self.counters['hedges_sent'] += 1
+                return True
+            self.counters['hedge_budget_skips'] += 1
+            return False
+
+    def _count(self, name: str):
+        with self.lock:
+            self.counters[name] += 1
+
+    def _timed(self, kind: str, call, backend):
+        start = time.perf_counter()
+        result = call(backend)
+        self._record(kind, time.perf_counter() - start)
+        return result
+
+    async def _atimed(self, kind: str, call, backend):
+        start = time.perf_counter()
+        result = await call(backend)
+        self._record(kind, time.perf_counter() - start)
+        return result
+
+    def _race(self, kind: str, call):
+        """Run call(backend) with hedging and failover; returns the first success."""
+        if len(self.backends) == 1:
+            return call(self.backends[0])
+        if self.executor is None:
+            with self.lock:
+                if self.executor is None:
+                    self.executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix='hedge')
+        self._start_request()
+        delay = self.hedge_delay(kind)
+        pending = {self.executor.submit(self._timed, kind, call, self.backends[0]): 0}
+        next_index = 1
+        errors = []
+        may_hedge = True
+        try:
+            while pending:
+                hedging = next_index < len(self.backends)
+                done, _ = wait(pending, timeout=delay if hedging and may_hedge else None,
+                               return_when=FIRST_COMPLETED)
+                for future in done:
+                    index = pending.pop(future)
+                    if future.exception() is None:
+                        if index:
+                            self._count('alternate_wins')
+                        return future.result()
+                    errors.append(future.exception())
+                if not hedging:
+                    continue
+                if not pending:
+                    self._count('failovers')
+                elif done:
+                    continue
+                elif not self._take_hedge():
+                    may_hedge = False  # Out of budget: wait, but still fail over
+                    continue
+                pending[self.executor.submit(self._timed, kind, call,
+                                             self.backends[next_index])] = next_index
+                next_index += 1
+        finally:
+            for future in pending:
+                future.cancel()
+        raise errors[0]
+
+    async def _arace(self, kind: str, call):
+        """Async _race(); losing requests are cancelled."""
+        if len(self.backends) == 1:
+            return await call(self.backends[0])
+        self._start_request()
+        delay = self.hedge_delay(kind)
+        pending = {asyncio.ensure_future(self._atimed(kind, call, self.backends[0])): 0}
+        next_index = 1
+        errors = []
+        may_hedge = True
+        try:
+            while pending:
+                hedging = next_index < len(self.backends)
+                done, _ = await asyncio.wait(pending, timeout=delay if hedging and may_hedge else None,
+                                             return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    index = pending.pop(task)
+                    if task.exception() is None:
+                        if index:
+                            self._count('alternate_wins')
+                        return task.result()
+                    errors.append(task.exception())
+                if not hedging:
+                    continue
+                if not pending:
+                    self._count('failovers')
+                elif done:
+                    continue
+                elif not self._take_hedge():
+                    may_hedge = False  # Out of budget: wait, but still fail over
+                    continue
+                pending[asyncio.ensure_future(
+                    self._atimed(kind, call, self.backends[next_index]))] = next_index
+                next_index += 1
+        finally:
+            for task in pending:
+                task.cancel()
+        raise errors[0]
+
+    def detect(self, text: str) -> Detected:
+        return self._race('detect', lambda backend: backend.detect(text))
+
+    def translate(self, text: str, dest: str, src: str = 'auto') -> Translated:
+        return self._race('translate', lambda backend: backend.translate(text, dest, src))
+
+    def translate_batch(self, texts: list, dest: str, src: str = 'auto') -> list:
+        return self._race('batch', lambda backend: backend.translate_batch(texts, dest, src))
+
+    async def adetect(self, text: str) -> Detected:
+        return await self._arace('detect', lambda backend: backend.adetect(text))
+
+    async def atranslate(self, text: str, dest: str, src: str = 'auto') -> Translated:
+        return await self._arace('translate', lambda backend: backend.atranslate(text, dest, src))
+
+    async def atranslate_batch(self, texts: list, dest: str, src: str = 'auto') -> list:
+        return await self._arace('batch',
+                                 lambda backend: backend.atranslate_batch(texts, dest, src))
+
+    def warm_up(self):
+        for backend in self.backends:
+            backend.warm_up()
+
+    def prewarm(self, max_idle: float = 15.0, open_new: bool = True) -> str:
+        # A hedge that has to open a connection first would rarely win
+        results = [backend.prewarm(max_idle, open_new) for backend in self.backends]
+        return results[0]
+
+    async def aprewarm(self, max_idle: float = 15.0, open_new: bool = True) -> str:
+        results = await asyncio.gather(
+            *(backend.aprewarm(max_idle, open_new) for backend in self.backends))
+        return results[0]
+
+    def stats(self) -> dict:
+        with self.lock:
+            stats = dict(self.counters)
+        requests = stats['hedge_requests']
+        stats['hedge_rate'] = stats['hedges_sent'] / requests if requests else 0.0
+        stats['hedge_delay_ms'] = self.hedge_delay('translate') * 1000
+        for index, backend in enumerate(self.backends):
+            stats.update((f"{index}_{k}", v) for k, v in backend.stats().items())
+        return stats
+
+    def close(self):
+        for backend in self.backends:
+            backend.close()
+        if self.executor is not None:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+            self.executor = None
+
+
+class GuardedBackend(TranslationBackend):
+    """
+    Retries failed calls with jittered exponential backoff and trips a
+    CircuitBreaker after repeated failures, so an outage costs a fast
+    CircuitOpenError per request instead of a hanging socket and thread.
+    Client errors (HTTP 4xx other than 429) are neither retried nor
+    counted as failures.
+    """
+
+    name = 'guarded'
+    # Error of requests refused while the circuit is open (shown in the window)
+    OFFLINE_MESSAGE = 'Çevrimdışı: çeviri sunucusuna ulaşılamıyor'
+
+    def __init__(self, backend: TranslationBackend, breaker: CircuitBreaker = None,
+                 retries: int = 2, base_delay: float = 0.2, max_delay: float = 2.0):
+        self.backend = backend
+        self.breaker = breaker or CircuitBreaker()
+        self.supports_async = backend.supports_async
+        self.retries = max(0, retries)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.counters = {'retries': 0}
+
+    @staticmethod
+    def _is_client_error(error: Exception) -> bool:
+        status = getattr(error, 'status', None)
+        return status is not None and 400 <= status < 500 and status != 429
+
+    def _admit(self) -> bool:
+        """Ask the breaker for a call; returns whether it is the half-open probe."""
+        if not self.breaker.allow():
+            raise CircuitOpenError(self.OFFLINE_MESSAGE)
+        return self.breaker.state == HALF_OPEN
+
+    def _failed(self, error: Exception, attempt: int) -> bool:
+        """Record a failed attempt; returns whether to retry it."""
+        if self._is_client_error(error):
+            self.breaker.record_success()  # The server is up, the request was bad
+            return False
+        self.breaker.record_failure()
+        if attempt >= self.retries or self.breaker.is_open:
+            return False
+        self.counters['retries'] += 1
+        return True
+
+    def _call(self, call):
+        attempt = 0
+        while True:
+            probe = self._admit()
+            try:
+                result = call(self.backend)
+            except Exception as e:
+                if not self._failed(e, attempt):
+                    raise
+                time.sleep(backoff_delay(attempt, self.base_delay, self.max_delay))
+                attempt += 1
+                continue
+            except BaseException:
+                if probe:
+                    self.breaker.release_probe()
+                raise
+            self.breaker.record_success()
+            return result
+
+    async def _acall(self, call):
+        attempt = 0
+        while True:
+            probe = self._admit()
+            try:
+                result = await call(self.backend)
+            except Exception as e:
+                if not self._failed(e, attempt):
+                    raise
+                await asyncio.sleep(backoff_delay(attempt, self.base_delay, self.max_delay))
+                attempt += 1
+                continue
+            except BaseException:
+                # Cancelled (e.g. superseded by a newer keystroke): no verdict
+                if probe:
+                    self.breaker.release_probe()
+                raise
+            self.breaker.record_success()
+            return result
+
+    def detect(self, text: str) -> Detected:
+        return self._call(lambda backend: backend.detect(text))
+
+    def translate(self, text: str, dest: str, src: str = 'auto') -> Translated:
+        return self._call(lambda backend: backend.translate(text, dest, src))
+
+    def translate_batch(self, texts: list, dest: str, src: str = 'auto') -> list:
+        return self._call(lambda backend: backend.translate_batch(texts, dest, src))
+
+    async def adetect(self, text: str) -> Detected:
+        return await self._acall(lambda backend: backend.adetect(text))
+
+    async def atranslate(self, text: str, dest: str, src: str = 'auto') -> Translated:
+        return await self._acall(lambda backend: backend.atranslate(text, dest, src))
+
+    async def atranslate_batch(self, texts: list, dest: str, src: str = 'auto') -> list:
+        return await self._acall(lambda backend: backend.atranslate_batch(texts, dest, src))
+
+    def probe(self) -> bool:
+        """Send one small request if a probe is due; returns whether the circuit is closed."""
+        if self.breaker.is_open and self.breaker.retry_in() <= 0:
+            try:
+                self._call(lambda backend: backend.translate('ok', dest='en', src='en'))
+            except Exception:
+                pass
+        return not self.breaker.is_open
+
+    async def aprobe(self) -> bool:
+        """Async probe()."""
+        if self.breaker.is_open and self.breaker.retry_in() <= 0:
+            try:
+                await self._acall(lambda backend: backend.atranslate('ok', dest='en', src='en'))
+            except Exception:
+                pass
+        return not self.breaker.is_open
+
+    def warm_up(self):
+        self.backend.warm_up()
+
+    def prewarm(self, max_idle: float = 15.0, open_new: bool = True) -> str:
+        if self.breaker.is_open:
+            # Instead of opening sockets to an unreachable server, probe when due
+            if self.breaker.retry_in() > 0:
+                return 'none'
+            return 'refreshed' if self.probe() else 'failed'
+        return self.backend.prewarm(max_idle, open_new)
+
+    async def aprewarm(self, max_idle: float = 15.0, open_new: bool = True) -> str:
+        if self.breaker.is_open:
+            if self.breaker.retry_in() > 0:
+                return 'none'
+            return 'refreshed' if await self.aprobe() else 'failed'
+        return await self.backend.aprewarm(max_idle, open_new)
+
+    def stats(self) -> dict:
+        stats = dict(self.backend.stats())
+        stats.update(self.counters)
+        stats.update((f"circuit_{k}", v) for k, v in self.breaker.snapshot().items())
+        return stats
+
+    def close(self):
+        self.backend.close()
+
+
+def create_backend(name: str = 'google', url: str = None,
+                   connect_timeout: float = 3.0, read_timeout: float = 10.0,
+                   hedge_urls=(), hedge_percentile: float = 90,
+                   hedge_min_delay: float = 0.03, hedge_max_extra: float = 0.1) -> TranslationBackend:
+    """
+    Build a backend from its settings name. With hedge_urls, slow requests
+    are also sent to those endpoints ('google' or an http backend URL).
+    """
+    if name == 'http':
+        if not url:
+            raise ValueError("The 'http' backend needs a backend_url")
+        backend = HttpBackend(url, connect_timeout=connect_timeout, read_timeout=read_timeout)
+    else:
+        backend = GoogleBackend(timeout=read_timeout)
+    if not hedge_urls:
+        return backend
+
+    backends = [backend]
+    for hedge_url in hedge_urls:
+        if hedge_url == 'google':
+            backends.append(GoogleBackend(timeout=read_timeout))
+        else:
+            backends.append(HttpBackend(hedge_url, connect_timeout=connect_timeout,
+                                        read_timeout=read_timeout))
+    return HedgedBackend(backends, hedge_percentile, hedge_min_delay, hedge_max_extra)
@@ -0,0 +1,90 @@
+"""
+Autocomplete history benchmark on a synthetic history.
+
+Reports completion latency for short and long prefixes (fresh index and
+after loading the snapshot), incremental record() cost, and the snapshot
+size and save/load times.
+    python benchmarks/bench_autocomplete.py --entries 120000
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from autocomplete import HistoryIndex
+
+
+def percentile(values: list, p: float) -> float:
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * p / 100))]
+
+
+def make_inputs(count: int, seed: int) -> list:
+    """Phrases of 1-4 words from a Zipf-like vocabulary."""
+    rng = random.Random(seed)
+    vocabulary = [''.join(rng.choice('abcçdefgğhıijklmnoöprsştuüvyz') for _ in range(rng.randint(2, 9)))
+                  for _ in range(5000)]
+    weights = [1 / (rank + 1) for rank in range(len(vocabulary))]
+    return [' '.join(rng.choices(vocabulary, weights, k=rng.randint(1, 4))) for _ in range(count)]
+
+
+def time_completions(index: HistoryIndex, prefixes: list) -> list:
+    times = []
+    for prefix in prefixes:
+        start = time.perf_counter()
+        index.complete(prefix, 5)
+        times.append(time.perf_counter() - start)
+    return times
+
+
+def report(name: str, times: list):
+    print(f"{name:<28} p50 {percentile(times, 50) * 1e6:7.1f} µs  "
+          f"p99 {percentile(times, 99) * 1e6:7.1f} µs  max {max(times) * 1e6:7.1f} µs")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Autocomplete benchmark")
+    parser.add_argument('--entries', type=int, default=120000, help="Recorded inputs")
+    parser.add_argument('--lookups', type=int, default=5000)
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+
+    inputs = make_inputs(args.entries, args.seed)
+    index = HistoryIndex(max_entries=max(args.entries, 1))
+    start = time.time() - 86400 * 90
+    times = []
+    for i, text in enumerate(inputs):
+        began = time.perf_counter()
+        index.record(text, start + i * 60)
+        times.append(time.perf_counter() - began)
+    print(f"unique entries               {len(index)}")
+    report("record", times)
+
+    rng = random.Random(args.seed)
+    short = [rng.choice(inputs)[:rng.randint(1, 2)] for _ in range(args.lookups)]
+    long = [rng.choice(inputs)[:rng.randint(3, 12)] for _ in range(args.lookups)]
+    report("complete, 1-2 chars", time_completions(index, short))
+    report("complete, 3-12 chars", time_completions(index, long))
+
+    path = os.path.join(tempfile.mkdtemp(prefix='qt-history-'), 'history_index.bin')
+    began = time.perf_counter()
+    index.save(path)
+    print(f"snapshot                     {os.path.getsize(path) / 1e6:.2f} MB, "
+          f"saved in {(time.perf_counter() - began) * 1000:.0f} ms")
+
+    loaded = HistoryIndex(max_entries=max(args.entries, 1))
+    began = time.perf_counter()
+    loaded.load(path)
+    print(f"load                         {(time.perf_counter() - began) * 1000:.0f} ms")
+    report("after load, 1-2 chars", time_completions(loaded, short))
+    report("after load, 3-12 chars", time_completions(loaded, long))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+translate_many() versus sequential translate() against the local fake server.
+
+Usage:
+    python benchmarks/bench_batch.py [--texts 500] [--latency-ms 30]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backends import HttpBackend
+from cache import TranslationCache
+from fake_server import FakeTranslationServer
+from translator import TranslationService
+
+WORDS = "the quick brown fox jumps over lazy dog güzel bir gün çok teşekkürler".split()
+
+
+def make_texts(count: int) -> list:
+    """Deterministic mix of English and Turkish phrases, with some duplicates."""
+    unique = max(1, count * 3 // 4)
+    texts = []
+    for i in range(count):
+        n = i % unique
+        words = [WORDS[(n * 7 + j * 3) % len(WORDS)] for j in range(3 + n % 5)]
+        texts.append(f"{' '.join(words)} {n}")
+    return texts
+
+
+def make_service(url: str) -> TranslationService:
+    return TranslationService('tr', cache=TranslationCache(persistent=False),
+                              backend=HttpBackend(url, max_connections=8))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Batch translation benchmark")
+    parser.add_argument('--texts', type=int, default=500)
+    parser.add_argument('--latency-ms', type=float, default=30.0)
+    parser.add_argument('--concurrency', type=int, default=4)
+    args = parser.parse_args()
+
+    server = FakeTranslationServer(latency_ms=args.latency_ms)
+    url = server.start()
+    texts = make_texts(args.texts)
+
+    service = make_service(url)
+    server.requests = 0
+    start = time.perf_counter()
+    for text in texts:
+        service.translate(text)
+    sequential = time.perf_counter() - start
+    sequential_requests = server.requests
+
+    service = make_service(url)
+    server.requests = 0
+    start = time.perf_counter()
+    results = service.translate_many(texts, concurrency=args.concurrency)
+    batched = time.perf_counter() - start
+    batched_requests = server.requests
+    failures = sum(1 for r in results if not r['success'])
+
+    print(f"Texts:        {len(texts)} ({len(set(texts))} unique), "
+          f"server latency {args.latency_ms:.0f} ms")
+    print(f"Sequential:   {sequential * 1000:8.1f} ms, {sequential_requests} requests")
+    print(f"translate_many: {batched * 1000:6.1f} ms, {batched_requests} requests, "
+          f"{failures} failures")
+    print(f"Speedup:      {sequential / batched:.1f}x")
+    server.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+Accuracy and latency of the offline language detector on the bundled corpus.
+
+Usage:
+    python benchmarks/bench_detector.py [--threshold 0.9]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import OFFLINE_DETECTION_THRESHOLD
+from detector import LanguageDetector
+from langdata import EVAL_CORPUS
+
+
+def percentile(values: list, p: float) -> float:
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * p / 100))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Offline language detector benchmark")
+    parser.add_argument('--threshold', type=float, default=OFFLINE_DETECTION_THRESHOLD)
+    parser.add_argument('--rounds', type=int, default=200)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    detector = LanguageDetector()
+    build_ms = (time.perf_counter() - start) * 1000
+
+    correct = confident = confident_correct = 0
+    for lang, text in EVAL_CORPUS:
+        result = detector.detect(text)
+        correct += result.lang == lang
+        if result.confidence >= args.threshold:
+            confident += 1
+            confident_correct += result.lang == lang
+        else:
+            print(f"  low confidence: {lang} -> {result.lang} ({result.confidence:.2f}) {text}")
+
+    timings = []
+    for _ in range(args.rounds):
+        for _, text in EVAL_CORPUS:
+            start = time.perf_counter()
+            detector.detect(text)
+            timings.append((time.perf_counter() - start) * 1e6)
+
+    total = len(EVAL_CORPUS)
+    print(f"Samples:                 {total}")
+    print(f"Profile build:           {build_ms:.1f} ms")
+    print(f"Accuracy (top-1):        {correct / total:.1%}")
+    print(f"Answered offline:        {confident / total:.1%} (threshold {args.threshold})")
+    if confident:
+        print(f"Accuracy when offline:   {confident_correct / confident:.1%}")
+    print(f"Latency p50 / p99:       {percentile(timings, 50):.0f} / {percentile(timings, 99):.0f} µs")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+Offline dictionary benchmark on a synthetic word list.
+
+Reports build time, file size, lookup and prefix-completion latency, and
+how much Python heap opening the memory-mapped file costs (it should stay
+tiny however large the dictionary is).
+    python benchmarks/bench_dictionary.py --words 200000
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from dictionary import OfflineDictionary, build_dictionary
+
+LETTERS = 'abcçdefgğhıijklmnoöprsştuüvyz'
+
+
+def make_words(count: int, seed: int) -> list:
+    rng = random.Random(seed)
+    pairs = set()
+    while len(pairs) < count:
+        primary = ''.join(rng.choice(LETTERS) for _ in range(rng.randint(3, 12)))
+        english = ''.join(rng.choice('abcdefghijklmnopqrstuvwxyz') for _ in range(rng.randint(3, 12)))
+        pairs.add((primary, english))
+    return sorted(pairs)
+
+
+def timed_us(fn, items) -> float:
+    start = time.perf_counter()
+    for item in items:
+        fn(item)
+    return (time.perf_counter() - start) / len(items) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Offline dictionary benchmark")
+    parser.add_argument('--words', type=int, default=200000)
+    parser.add_argument('--lookups', type=int, default=20000)
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+
+    pairs = make_words(args.words, args.seed)
+    path = os.path.join(tempfile.mkdtemp(prefix='qt-dict-'), 'dictionary.bin')
+
+    start = time.perf_counter()
+    build_dictionary(pairs, path, 'tr')
+    build_time = time.perf_counter() - start
+
+    tracemalloc.start()
+    dictionary = OfflineDictionary(path)
+    heap = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    rng = random.Random(args.seed)
+    hits = [rng.choice(pairs)[0] for _ in range(args.lookups)]
+    misses = [word + 'qx' for word in hits]
+    prefixes = [word[:3] for word in hits[:2000]]
+
+    print(f"words                 {args.words}")
+    print(f"build time            {build_time:.2f} s")
+    print(f"file size             {os.path.getsize(path) / 1e6:.1f} MB")
+    print(f"heap after open       {heap / 1024:.1f} KB")
+    print(f"lookup (hit)          {timed_us(lambda w: dictionary.lookup(w, 'tr', 'en'), hits):.1f} µs")
+    print(f"lookup (miss)         {timed_us(lambda w: dictionary.lookup(w, 'tr', 'en'), misses):.1f} µs")
+    print(f"complete (10)         {timed_us(lambda p: dictionary.complete(p, 'tr', 'en'), prefixes):.1f} µs")
+    dictionary.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,271 @@
+"""
+End-to-end benchmark against the local fake translation server.
+
+Drives TranslationService directly and a headless TranslatorWindow (needs a
+display; use a virtual one such as Xvfb on CI) through scripted typing
+sessions, and reports:
+- keystroke-to-render latency percentiles
+- backend requests issued per final result
+- single-lookup latency (miss / hit) and bulk throughput
+- memory
+
+Results can be saved as JSON and compared with an earlier run:
+    python benchmarks/bench_e2e.py --output base.json
+    python benchmarks/bench_e2e.py --compare base.json
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from fake_server import DISTRIBUTIONS, FakeTranslationServer
+
+PHRASES = [
+    "good morning",
+    "where is the train station",
+    "bugün hava çok güzel",
+    "thank you very much",
+    "görüşmek üzere",
+    "I forgot my umbrella at home",
+    "see you tomorrow",
+    "çok teşekkür ederim",
+]
+
+# Metrics where a higher value is a regression, checked by --compare
+LOWER_IS_BETTER = [
+    ('window', 'keystroke_to_render_p50_ms'),
+    ('window', 'keystroke_to_render_p95_ms'),
+    ('window', 'requests_per_result'),
+    ('service', 'miss_p50_ms'),
+    ('service', 'miss_p95_ms'),
+    ('service', 'hit_p50_us'),
+    ('memory', 'peak_python_mb'),
+]
+HIGHER_IS_BETTER = [
+    ('bulk', 'translate_many_per_sec'),
+    ('bulk', 'engine_per_sec'),
+]
+
+
+def percentile(values: list, p: float) -> float:
+    values = sorted(values)
+    if not values:
+        return 0.0
+    return values[min(len(values) - 1, int(len(values) * p / 100))]
+
+
+def use_fake_backend(url: str):
+    """Point the app at the fake server through a throwaway config directory."""
+    appdata = tempfile.mkdtemp(prefix='qt-bench-')
+    os.environ['APPDATA'] = appdata
+    os.makedirs(os.path.join(appdata, 'QuickTranslator'), exist_ok=True)
+    settings = {
+        'primary_language': 'tr',
+        'backend': 'http',
+        'backend_url': url,
+        'metrics_enabled': True,
+    }
+    with open(os.path.join(appdata, 'QuickTranslator', 'settings.json'), 'w', encoding='utf-8') as f:
+        json.dump(settings, f)
+
+
+def bench_service(server, rounds: int) -> dict:
+    from cache import TranslationCache
+    from translator import TranslationService
+
+    service = TranslationService('tr', cache=TranslationCache(persistent=False))
+    misses, hits = [], []
+    for i in range(rounds):
+        text = f"{PHRASES[i % len(PHRASES)]} {i}"
+        start = time.perf_counter()
+        service.translate(text)
+        misses.append(time.perf_counter() - start)
+        start = time.perf_counter()
+        service.translate(text)
+        hits.append(time.perf_counter() - start)
+    return {
+        'miss_p50_ms': percentile(misses, 50) * 1000,
+        'miss_p95_ms': percentile(misses, 95) * 1000,
+        'miss_p99_ms': percentile(misses, 99) * 1000,
+        'hit_p50_us': percentile(hits, 50) * 1e6,
+        'hit_p99_us': percentile(hits, 99) * 1e6,
+    }
+
+
+def bench_bulk(server, count: int) -> dict:
+    from cache import TranslationCache
+    from engine import TranslationEngine
+    from translator import TranslationService
+
+    texts = [f"{PHRASES[i % len(PHRASES)]} #{i}" for i in range(count)]
+
+    service = TranslationService('tr', cache=TranslationCache(persistent=False))
+    start = time.perf_counter()
+    results = service.translate_many(texts)
+    many_time = time.perf_counter() - start
+    many_failed = sum(1 for r in results if not r['success'])
+
+    service = TranslationService('tr', cache=TranslationCache(persistent=False))
+    engine = TranslationEngine(service)
+    start = time.perf_counter()
+    results = engine.translate_all(texts).result()
+    engine_time = time.perf_counter() - start
+    engine_failed = sum(1 for r in results if not r['success'])
+    engine.stop()
+
+    return {
+        'texts': count,
+        'translate_many_per_sec': count / many_time,
+        'translate_many_failed': many_failed,
+        'engine_per_sec': count / engine_time,
+        'engine_failed': engine_failed,
+    }
+
+
+def bench_window(server, key_ms: float, pause_ms: int, seed: int) -> dict:
+    import tkinter as tk
+    from metrics import metrics
+    from window import TranslatorWindow
+
+    window = TranslatorWindow()
+    try:
+        root = window.create_window()
+    except tk.TclError as e:
+        return {'skipped': f"No display ({e})"}
+    window.show_window()
+
+    renders = []
+    render_result = window.render_result
+
+    def counting_render(result):
+        renders.append(result)
+        render_result(result)
+
+    window.render_result = counting_render
+
+    rng = random.Random(seed)
+    finals = []
+    requests_before = server.requests
+    t = 0.3
+    for phrase in PHRASES:
+        for i in range(1, len(phrase) + 1):
+            root.after(int(t * 1000), window.search_var.set, phrase[:i])
+            t += rng.uniform(0.5, 1.5) * key_ms / 1000
+        t += pause_ms / 1000
+        root.after(int(t * 1000) - 20,
+                   lambda p=phrase: finals.append((p, window.translated_label.cget('text'))))
+    root.after(int(t * 1000) + 200, root.quit)
+    root.mainloop()
+
+    requests = server.requests - requests_before
+    window.engine.stop()
+    root.destroy()
+
+    latency = metrics.histograms.get('keystroke_to_render')
+    correct = sum(1 for phrase, shown in finals if shown.endswith(phrase))
+    return {
+        'sessions': len(PHRASES),
+        'keystrokes': sum(len(p) for p in PHRASES),
+        'renders': len(renders),
+        'correct_final_results': correct,
+        'requests': requests,
+        'requests_per_result': requests / len(PHRASES),
+        'stale_renders': window.pipeline.stats['stale_renders'],
+        'keystroke_to_render_p50_ms': latency.percentile(50) * 1000 if latency else None,
+        'keystroke_to_render_p95_ms': latency.percentile(95) * 1000 if latency else None,
+        'keystroke_to_render_p99_ms': latency.percentile(99) * 1000 if latency else None,
+    }
+
+
+def memory_report() -> dict:
+    _, peak = tracemalloc.get_traced_memory()
+    report = {'peak_python_mb': peak / 1e6}
+    try:
+        import resource
+        report['max_rss_mb'] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    except ImportError:
+        pass
+    return report
+
+
+def compare(current: dict, baseline: dict, tolerance: float) -> list:
+    """Return regression messages."""
+    regressions = []
+    for checks, worse in ((LOWER_IS_BETTER, lambda new, old: new > old * (1 + tolerance)),
+                          (HIGHER_IS_BETTER, lambda new, old: new < old * (1 - tolerance))):
+        for section, key in checks:
+            new = current.get(section, {}).get(key)
+            old = baseline.get(section, {}).get(key)
+            if new is None or not old:
+                continue
+            marker = 'REGRESSION' if worse(new, old) else 'ok'
+            print(f"  {section}.{key:<32} {old:10.2f} -> {new:10.2f}  {marker}")
+            if marker != 'ok':
+                regressions.append(f"{section}.{key}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="End-to-end benchmark")
+    parser.add_argument('--latency-ms', type=float, default=60.0)
+    parser.add_argument('--jitter-ms', type=float, default=20.0)
+    parser.add_argument('--distribution', choices=DISTRIBUTIONS, default='lognormal')
+    parser.add_argument('--error-rate', type=float, default=0.0)
+    parser.add_argument('--key-interval-ms', type=float, default=120.0)
+    parser.add_argument('--pause-ms', type=int, default=1500)
+    parser.add_argument('--rounds', type=int, default=100)
+    parser.add_argument('--bulk', type=int, default=2000)
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--no-window', action='store_true', help="Skip the Tk typing sessions")
+    parser.add_argument('--output', help="Write results to this JSON file")
+    parser.add_argument('--compare', help="Compare with an earlier JSON result")
+    parser.add_argument('--tolerance', type=float, default=0.10)
+    args = parser.parse_args()
+
+    server = FakeTranslationServer(latency_ms=args.latency_ms, jitter_ms=args.jitter_ms,
+                                   distribution=args.distribution,
+                                   error_rate=args.error_rate, seed=args.seed)
+    url = server.start()
+    use_fake_backend(url)
+    tracemalloc.start()
+
+    results = {
+        'config': vars(args),
+        'service': bench_service(server, args.rounds),
+        'bulk': bench_bulk(server, args.bulk),
+    }
+    if not args.no_window:
+        results['window'] = bench_window(server, args.key_interval_ms, args.pause_ms, args.seed)
+    results['memory'] = memory_report()
+    results['server'] = {'requests': server.requests, 'errors': server.errors}
+    server.stop()
+
+    for section in ('service', 'bulk', 'window', 'memory', 'server'):
+        if section in results:
+            print(f"[{section}]")
+            for key, value in results[section].items():
+                shown = f"{value:.2f}" if isinstance(value, float) else value
+                print(f"  {key:<32} {shown}")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            baseline = json.load(f)
+        print(f"[compare with {args.compare}]")
+        if compare(results, baseline, args.tolerance):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
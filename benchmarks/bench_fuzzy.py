@@ -0,0 +1,102 @@
+"""
+Fuzzy translation memory: lookup latency, recall and memory at scale.
+
+Fills a TranslationMemory with synthetic phrases, then looks up variants
+of remembered phrases (case/punctuation changes, one or two typos) and
+phrases that were never added.
+    python benchmarks/bench_fuzzy.py --entries 100000
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from fuzzy import TranslationMemory
+
+SYLLABLES = ['ka', 'le', 'mi', 'so', 'tu', 'ra', 'ne', 'di', 'po', 'ge', 'lar', 'ler',
+             'in', 'ün', 'ış', 'or', 'en', 'at', 'ba', 'çe', 'şi', 'ğu', 'yo', 'ma']
+LETTERS = 'abcdefghijklmnoprstuvyzçğışöü'
+
+
+def make_vocabulary(size: int, rng: random.Random) -> list:
+    words = set()
+    while len(words) < size:
+        words.add(''.join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4))))
+    return sorted(words)
+
+
+def typo(text: str, rng: random.Random) -> str:
+    i = rng.randrange(len(text))
+    kind = rng.choice(('replace', 'delete', 'insert', 'swap'))
+    if kind == 'replace':
+        return text[:i] + rng.choice(LETTERS) + text[i + 1:]
+    if kind == 'delete':
+        return text[:i] + text[i + 1:]
+    if kind == 'insert':
+        return text[:i] + rng.choice(LETTERS) + text[i:]
+    return text[:i] + text[i + 1:i + 2] + text[i:i + 1] + text[i + 2:]
+
+
+def percentile(values: list, p: float) -> float:
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * p / 100))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fuzzy translation memory benchmark")
+    parser.add_argument('--entries', type=int, default=100000)
+    parser.add_argument('--queries', type=int, default=2000, help="Lookups per kind")
+    parser.add_argument('--min-similarity', type=float, default=0.8)
+    args = parser.parse_args()
+
+    rng = random.Random(1)
+    words = make_vocabulary(20000, rng)
+    phrases = list({' '.join(rng.choices(words, k=rng.randint(1, 6))) for _ in range(args.entries)})
+    result = {'success': True, 'translated': 'x', 'source_lang': 'tr', 'target_lang': 'en'}
+
+    memory = TranslationMemory(max_entries=len(phrases), min_similarity=args.min_similarity)
+    began = time.perf_counter()
+    for phrase in phrases:
+        memory.add(phrase, result)
+    seconds = time.perf_counter() - began
+    # Size measured separately: tracemalloc slows every allocation down
+    traced = TranslationMemory(max_entries=len(phrases))
+    tracemalloc.start()
+    for phrase in phrases:
+        traced.add(phrase, result)
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del traced
+    print(f"{len(memory)} entries added in {seconds:.1f} s "
+          f"({seconds / len(memory) * 1e6:.0f} µs each), {size / 2**20:.0f} MB")
+
+    kinds = {
+        'case/punct': lambda p: '¿' + p.capitalize() + ' ?!',
+        'one typo': lambda p: typo(p, rng),
+        'two typos': lambda p: typo(typo(p, rng), rng),
+        'never added': lambda p: ' '.join(rng.choices(words, k=rng.randint(1, 6))),
+    }
+    print(f"{'query':<12} {'p50 µs':>8} {'p99 µs':>8} {'max µs':>8} {'found':>7} {'right':>7}")
+    for name, make in kinds.items():
+        times, found, right = [], 0, 0
+        for _ in range(args.queries):
+            phrase = rng.choice(phrases)
+            query = make(phrase)
+            started = time.perf_counter()
+            match = memory.match(query)
+            times.append(time.perf_counter() - started)
+            if match is not None:
+                found += 1
+                right += match.text == phrase
+        print(f"{name:<12} {percentile(times, 50) * 1e6:8.0f} {percentile(times, 99) * 1e6:8.0f} "
+              f"{max(times) * 1e6:8.0f} {found / args.queries:7.1%} {right / args.queries:7.1%}")
+
+
+if __name__ == "__main__":
+    main()
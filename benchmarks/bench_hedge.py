@@ -0,0 +1,100 @@
+"""
+Tail latency with and without hedged requests, against two fake servers
+with a long-tailed (lognormal) latency distribution.
+
+Reports p50/p90/p99/max per mode, the extra load and how often the second
+endpoint answered first.
+    python benchmarks/bench_hedge.py --requests 600 --latency-ms 40 --jitter-ms 80
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from backends import HedgedBackend, HttpBackend
+from fake_server import FakeTranslationServer
+
+
+def percentile(values: list, p: float) -> float:
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * p / 100))]
+
+
+def run_sync(backend, requests: int) -> list:
+    times = []
+    for i in range(requests):
+        start = time.perf_counter()
+        backend.translate(f"hello world {i}", dest='tr', src='en')
+        times.append(time.perf_counter() - start)
+    backend.close()
+    return times
+
+
+def run_async(backend, requests: int, concurrency: int) -> list:
+    times = []
+
+    async def worker(offset: int):
+        for i in range(offset, requests, concurrency):
+            start = time.perf_counter()
+            await backend.atranslate(f"hello world {i}", dest='tr', src='en')
+            times.append(time.perf_counter() - start)
+
+    async def main():
+        await asyncio.gather(*(worker(offset) for offset in range(concurrency)))
+        backend.close()  # Async connections must close inside their loop
+
+    asyncio.run(main())
+    return times
+
+
+def report(name: str, times: list, servers: list, requests: int, backend=None):
+    sent = sum(server.requests for server in servers)
+    line = (f"{name:<16} p50 {percentile(times, 50) * 1000:6.1f}  p90 {percentile(times, 90) * 1000:6.1f}  "
+            f"p99 {percentile(times, 99) * 1000:6.1f}  max {max(times) * 1000:6.1f} ms  "
+            f"extra load {(sent - requests) / requests:5.1%}")
+    if backend is not None:
+        stats = backend.stats()
+        line += f"  alternate wins {stats['alternate_wins']}/{stats['hedges_sent']}"
+    print(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Hedged request benchmark")
+    parser.add_argument('--requests', type=int, default=600)
+    parser.add_argument('--latency-ms', type=float, default=40.0)
+    parser.add_argument('--jitter-ms', type=float, default=80.0)
+    parser.add_argument('--max-extra', type=float, default=0.1)
+    parser.add_argument('--concurrency', type=int, default=8, help="Async requests in flight")
+    args = parser.parse_args()
+
+    servers = [FakeTranslationServer(latency_ms=args.latency_ms, jitter_ms=args.jitter_ms,
+                                     distribution='lognormal', seed=seed) for seed in (1, 2)]
+    urls = [server.start() for server in servers]
+
+    def fresh(hedged: bool):
+        for server in servers:
+            server.requests = 0
+        if not hedged:
+            return HttpBackend(urls[0], max_connections=args.concurrency)
+        return HedgedBackend([HttpBackend(url, max_connections=args.concurrency) for url in urls],
+                             max_extra=args.max_extra)
+
+    print(f"{args.requests} requests, lognormal latency median {args.latency_ms:.0f} ms, "
+          f"spread {args.jitter_ms:.0f} ms, hedge budget {args.max_extra:.0%}")
+    for label, runner in (('sync', lambda b: run_sync(b, args.requests)),
+                          ('async', lambda b: run_async(b, args.requests, args.concurrency))):
+        backend = fresh(False)
+        report(f"{label} single", runner(backend), servers, args.requests)
+        backend = fresh(True)
+        report(f"{label} hedged", runner(backend), servers, args.requests, backend)
+    for server in servers:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""
+Translation history: write throughput and full-text search latency.
+
+Fills a fresh history database with synthetic entries through add() (the
+writer thread batches them), then times searches the window would run
+while typing: whole words, word prefixes, two-word queries, misses and
+the empty query (newest entries).
+    python benchmarks/bench_history.py --entries 1000000
+"""
+
+import argparse
+import itertools
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from history import TranslationHistory
+
+SYLLABLES = ['ka', 'le', 'mi', 'so', 'tu', 'ra', 'ne', 'di', 'po', 'ge', 'lar', 'ler',
+             'in', 'ün', 'ış', 'or', 'en', 'at', 'ba', 'çe', 'şi', 'ğu', 'yo', 'ma']
+
+
+def make_vocabulary(size: int, rng: random.Random) -> list:
+    words = set()
+    while len(words) < size:
+        words.add(''.join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4))))
+    return sorted(words)
+
+
+def percentile(values: list, p: float) -> float:
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * p / 100))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="History store benchmark")
+    parser.add_argument('--entries', type=int, default=200000)
+    parser.add_argument('--queries', type=int, default=300, help="Queries per kind")
+    parser.add_argument('--vocabulary', type=int, default=20000)
+    args = parser.parse_args()
+
+    rng = random.Random(1)
+    words = make_vocabulary(args.vocabulary, rng)
+    # Zipf-like word use: a few words are very common, most are rare
+    weights = list(itertools.accumulate(1 / (rank + 1) for rank in range(len(words))))
+
+    def sentence() -> str:
+        return ' '.join(rng.choices(words, cum_weights=weights, k=rng.randint(1, 8)))
+
+    folder = tempfile.mkdtemp()
+    try:
+        history = TranslationHistory(os.path.join(folder, 'history.sqlite3'))
+        result = {'success': True, 'source_lang': 'tr', 'target_lang': 'en'}
+        began = time.perf_counter()
+        add_times = []
+        for _ in range(args.entries):
+            text = sentence()
+            result['translated'] = sentence()
+            started = time.perf_counter()
+            history.add(text, result)
+            add_times.append(time.perf_counter() - started)
+        history.flush()
+        seconds = time.perf_counter() - began
+        size = os.path.getsize(os.path.join(folder, 'history.sqlite3'))
+        print(f"{history.counts['written']} entries written in {seconds:.1f} s "
+              f"({history.counts['written'] / seconds:,.0f}/s), {size / 2**20:.0f} MB, "
+              f"add() p99 {percentile(add_times, 99) * 1e6:.1f} µs, FTS5 {history.fts}")
+
+        kinds = {
+            'common word': lambda: rng.choice(words[:50]),
+            'rare word': lambda: rng.choice(words[len(words) // 2:]),
+            'prefix (2-3)': lambda: rng.choice(words)[:rng.randint(2, 3)],
+            'prefix (4-5)': lambda: rng.choice(words)[:rng.randint(4, 5)],
+            'common prefix': lambda: rng.choice(words[:50])[:4],
+            'two words': lambda: ' '.join(rng.choices(words[:2000], k=2)),
+            'no match': lambda: 'qxz' + rng.choice(words),
+            'empty': lambda: '',
+        }
+        print(f"{'query':<14} {'p50 ms':>8} {'p99 ms':>8} {'max ms':>8} {'results':>8}")
+        for name, make in kinds.items():
+            times, found = [], 0
+            for _ in range(args.queries):
+                query = make()
+                started = time.perf_counter()
+                found += len(history.search(query, 8))
+                times.append(time.perf_counter() - started)
+            print(f"{name:<14} {percentile(times, 50) * 1000:8.2f} {percentile(times, 99) * 1000:8.2f} "
+                  f"{max(times) * 1000:8.2f} {found / args.queries:8.1f}")
+        history.close()
+    finally:
+        shutil.rmtree(folder, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
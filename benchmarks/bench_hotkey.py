@@ -0,0 +1,114 @@
+"""
+Hotkey-to-window latency and idle wakeups of the Tk loop.
+
+Compares the old 100 ms polling loop ('poll') with the event-driven
+dispatcher used now ('event'). A background thread first leaves the app
+idle, then plays the hotkey at random moments so the window opens and
+closes. Needs a display (use xvfb-run on Linux CI).
+    python benchmarks/bench_hotkey.py --presses 40 --idle 5
+"""
+
+import argparse
+import os
+import random
+import sys
+import threading
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+# Interval of the removed polling loop
+POLL_MS = 100
+
+
+def percentile(values: list, p: float) -> float:
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * p / 100))]
+
+
+def run(mode: str, presses: int, idle: float, seed: int) -> dict:
+    from window import TranslatorWindow
+
+    window = TranslatorWindow()
+    root = window.create_window()
+    latencies = []
+    wakeups = [0]
+    pressed = []
+    toggle_window = window.toggle_window
+
+    def toggle():
+        if pressed:
+            latencies.append(time.perf_counter() - pressed.pop())
+        toggle_window()
+
+    if mode == 'poll':
+        flag = [False]
+
+        def check():
+            wakeups[0] += 1
+            if flag[0]:
+                flag[0] = False
+                toggle()
+            root.after(POLL_MS, check)
+
+        def hotkey():
+            pressed.append(time.perf_counter())
+            flag[0] = True
+
+        root.after(POLL_MS, check)
+    else:
+        drain = window.dispatcher._drain
+
+        def counted_drain():
+            wakeups[0] += 1
+            drain()
+
+        window.dispatcher._drain = counted_drain
+
+        def hotkey():
+            pressed.append(time.perf_counter())
+            window.dispatcher.post(toggle)
+
+    result = {}
+
+    def player():
+        time.sleep(0.5)
+        cpu, count, began = time.process_time(), wakeups[0], time.perf_counter()
+        time.sleep(idle)
+        seconds = time.perf_counter() - began
+        result['idle_wakeups_per_sec'] = (wakeups[0] - count) / seconds
+        result['idle_cpu_ms_per_sec'] = (time.process_time() - cpu) * 1000 / seconds
+
+        rng = random.Random(seed)
+        for _ in range(presses):
+            time.sleep(rng.uniform(0.15, 0.4))
+            hotkey()
+        time.sleep(0.3)
+        window.dispatcher.post(root.quit)
+
+    threading.Thread(target=player, daemon=True).start()
+    root.mainloop()
+    root.destroy()
+    result.update(presses=len(latencies), p50=percentile(latencies, 50),
+                  p95=percentile(latencies, 95), max=max(latencies))
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Hotkey latency and idle wakeup benchmark")
+    parser.add_argument('--presses', type=int, default=40)
+    parser.add_argument('--idle', type=float, default=5.0, help="Idle seconds measured")
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+
+    print(f"{'mode':<6} {'p50 ms':>8} {'p95 ms':>8} {'max ms':>8} "
+          f"{'idle wakeups/s':>15} {'idle CPU ms/s':>14}")
+    for mode in ('poll', 'event'):
+        r = run(mode, args.presses, args.idle, args.seed)
+        print(f"{mode:<6} {r['p50'] * 1000:8.2f} {r['p95'] * 1000:8.2f} {r['max'] * 1000:8.2f} "
+              f"{r['idle_wakeups_per_sec']:15.1f} {r['idle_cpu_ms_per_sec']:14.2f}")
+
+
+if __name__ == "__main__":
+    main()
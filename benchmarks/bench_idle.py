@@ -0,0 +1,102 @@
+"""
+Idle memory trimming: resident memory before and after IdleTrimmer.trim()
+and the cost of the first translation afterwards (backend rebuilt).
+
+A session of translations against the fake server (run as a separate
+process, so its threads do not count) fills the memory cache and opens
+connections; then the backend and cache are released, garbage collected
+and handed back to the OS, as the window does after idle_trim_minutes.
+    python benchmarks/bench_idle.py --texts 5000 --cache-entries 5000
+"""
+
+import argparse
+import os
+import socket
+import subprocess
+import sys
+import time
+import urllib.request
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from backends import HttpBackend
+from cache import TranslationCache
+from engine import TranslationEngine
+from memory import IdleTrimmer, rss_bytes
+from translator import TranslationService
+
+
+class BenchService(TranslationService):
+    """Builds an http backend for the fake server instead of the configured one."""
+
+    def __init__(self, url: str, **kwargs):
+        super().__init__('tr', **kwargs)
+        self.url = url
+
+    def build_backend(self):
+        return HttpBackend(self.url, max_connections=16)
+
+
+def start_server(latency_ms: float):
+    """Run fake_server.py in its own process; returns (process, url)."""
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        port = s.getsockname()[1]
+    process = subprocess.Popen([sys.executable, os.path.join(ROOT, 'fake_server.py'),
+                                '--port', str(port), '--latency-ms', str(latency_ms)],
+                               stdout=subprocess.DEVNULL)
+    url = f"http://127.0.0.1:{port}"
+    for _ in range(100):
+        try:
+            urllib.request.urlopen(url + '/ping', timeout=1).read()
+            break
+        except OSError:
+            time.sleep(0.05)
+    return process, url
+
+
+def timed(engine, text: str) -> float:
+    started = time.perf_counter()
+    engine.submit(text).result()
+    return (time.perf_counter() - started) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Idle memory trimming benchmark")
+    parser.add_argument('--texts', type=int, default=5000)
+    parser.add_argument('--cache-entries', type=int, default=5000)
+    parser.add_argument('--floor', type=int, default=64)
+    parser.add_argument('--latency-ms', type=float, default=5.0)
+    args = parser.parse_args()
+
+    server, url = start_server(args.latency_ms)
+    service = BenchService(url, cache=TranslationCache(persistent=False,
+                                                       memory_entries=args.cache_entries))
+    engine = TranslationEngine(service)
+    engine.start()
+    print(f"RSS at start          {rss_bytes() / 2**20:7.1f} MB")
+
+    filler = "The quarterly report covers revenue, hiring and the new office. " * 3
+    for start in range(0, args.texts, 16):
+        # A few at a time, like a long session rather than one burst
+        engine.translate_all([f"{filler}{i}" for i in range(start, min(start + 16, args.texts))]).result()
+    warm = timed(engine, "good morning everyone")
+
+    cached = len(service.cache.memory)
+    trimmer = IdleTrimmer(0)
+    trimmer.add(lambda: engine.release(args.floor).result(timeout=5))
+    stats = trimmer.trim()
+    print(f"RSS before trim       {stats['rss_before_mb']:7.1f} MB  ({cached} cache entries)")
+    print(f"RSS after trim        {stats['rss_after_mb']:7.1f} MB  "
+          f"(trim took {stats['trim_ms']:.1f} ms, {len(service.cache.memory)} entries left)")
+
+    cold = timed(engine, "good evening everyone")
+    print(f"translation warm      {warm:7.1f} ms")
+    print(f"first after trim      {cold:7.1f} ms  (backend and connection rebuilt)")
+    engine.stop()
+    server.terminate()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""
+Long pasted text: one request for the whole text vs. sentence chunks
+translated concurrently (TranslationService.atranslate_long).
+
+The fake server's latency grows with the text length (--ms-per-char), as
+real engines' does. Reports the time until the first sentences can be
+shown and until the whole translation is done, then the cost of editing
+one sentence at a time with stable chunks ('incremental') vs. chunks
+regrouped from scratch on every edit ('regroup').
+    python benchmarks/bench_long_text.py --sentences 40 --latency-ms 60 --ms-per-char 0.5
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from backends import HttpBackend
+from cache import TranslationCache
+from fake_server import FakeTranslationServer
+from translator import TranslationService
+
+SENTENCES = [
+    "The meeting was moved to Thursday afternoon because the room was booked.",
+    "Please send the updated report to Dr. Smith before the end of the week!",
+    "Did anyone check whether the new build fixes the login problem?",
+    "Prices rose by about 3.5 percent compared with last year.",
+    "We will discuss the budget, the schedule and the hiring plan.",
+]
+
+
+def make_text(sentences: int) -> str:
+    return ' '.join(SENTENCES[i % len(SENTENCES)] + f" ({i})" for i in range(sentences))
+
+
+def run(url: str, text: str, concurrency: int) -> dict:
+    service = TranslationService('tr', cache=TranslationCache(persistent=False),
+                                 backend=HttpBackend(url, max_connections=max(1, concurrency)))
+    times = {}
+
+    async def main():
+        started = time.perf_counter()
+
+        def on_part(result):
+            times.setdefault('first', time.perf_counter() - started)
+            times['parts'] = result['progress'][1]
+
+        if concurrency:
+            result = await service.atranslate_long(text, on_part, concurrency=concurrency)
+        else:
+            result = await service.atranslate(text)
+        times['total'] = time.perf_counter() - started
+        times.setdefault('first', times['total'])
+        times['success'] = result['success']
+        service.backend.close()  # Async connections must close inside their loop
+
+    asyncio.run(main())
+    return times
+
+
+def run_edits(url: str, server: FakeTranslationServer, sentences: int, edits: int,
+              incremental: bool) -> dict:
+    service = TranslationService('tr', cache=TranslationCache(persistent=False),
+                                 backend=HttpBackend(url, max_connections=8))
+    parts = [SENTENCES[i % len(SENTENCES)] + f" ({i})" for i in range(sentences)]
+    rng = random.Random(1)
+    times, requests = [], []
+
+    async def main():
+        await service.atranslate_long(' '.join(parts), concurrency=8)
+        for n in range(edits):
+            index = rng.randrange(sentences)
+            parts[index] = parts[index].replace(' ', f" (see note {n} for details) ", 1)
+            if not incremental:
+                service._long_chunks = []
+            server.requests = 0
+            started = time.perf_counter()
+            await service.atranslate_long(' '.join(parts), concurrency=8)
+            times.append(time.perf_counter() - started)
+            requests.append(server.requests)
+        service.backend.close()
+
+    asyncio.run(main())
+    return {'ms': sum(times) / len(times) * 1000, 'requests': sum(requests) / len(requests)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Long text chunking benchmark")
+    parser.add_argument('--sentences', type=int, default=40)
+    parser.add_argument('--latency-ms', type=float, default=60.0)
+    parser.add_argument('--ms-per-char', type=float, default=0.5)
+    parser.add_argument('--edits', type=int, default=20)
+    args = parser.parse_args()
+
+    server = FakeTranslationServer(latency_ms=args.latency_ms, ms_per_char=args.ms_per_char)
+    url = server.start()
+    text = make_text(args.sentences)
+    print(f"{len(text)} characters, {args.sentences} sentences, "
+          f"latency {args.latency_ms:.0f} ms + {args.ms_per_char} ms/char")
+    print(f"{'mode':<14} {'first ms':>9} {'total ms':>9} {'requests':>9}")
+    for concurrency in (0, 1, 2, 4, 8):
+        server.requests = 0
+        r = run(url, text, concurrency)
+        name = 'whole text' if not concurrency else f"chunks x{concurrency}"
+        status = '' if r['success'] else '  (failed)'
+        print(f"{name:<14} {r['first'] * 1000:9.1f} {r['total'] * 1000:9.1f} "
+              f"{server.requests:9d}{status}")
+
+    print(f"\n{args.edits} one-sentence edits")
+    print(f"{'mode':<14} {'ms/edit':>9} {'requests/edit':>14}")
+    for name, incremental in (('regroup', False), ('incremental', True)):
+        r = run_edits(url, server, args.sentences, args.edits, incremental)
+        print(f"{name:<14} {r['ms']:9.1f} {r['requests']:14.1f}")
+    server.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""
+Throughput of the local API (main.py --serve) with many concurrent clients.
+
+Every client walks the same list of texts at the same time, so identical
+requests overlap; with coalescing they cost one backend call each. The
+'unique' workload gives every client its own texts (no overlap) for raw
+throughput.
+    python benchmarks/bench_serve.py --clients 32 --requests 50 --latency-ms 30
+"""
+
+import argparse
+import http.client
+import json
+import os
+import sys
+import threading
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from backends import HttpBackend
+from cache import TranslationCache
+from fake_server import FakeTranslationServer
+from server import TranslationServer
+from translator import TranslationService
+
+
+def percentile(values: list, p: float) -> float:
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * p / 100))]
+
+
+def client(url: str, texts: list, latencies: list, errors: list, start: threading.Barrier):
+    host, port = url.split('//')[1].split(':')
+    conn = http.client.HTTPConnection(host, int(port))
+    start.wait()
+    for text in texts:
+        body = json.dumps({'text': text}).encode('utf-8')
+        began = time.perf_counter()
+        conn.request('POST', '/translate', body=body,
+                     headers={'Content-Type': 'application/json'})
+        response = conn.getresponse()
+        result = json.loads(response.read())
+        latencies.append(time.perf_counter() - began)
+        if response.status != 200 or not result['success']:
+            errors.append(result)
+    conn.close()
+
+
+def run(backend_url: str, fake: FakeTranslationServer, clients: int, requests: int,
+        coalesce: bool, shared: bool) -> dict:
+    service = TranslationService('tr', cache=TranslationCache(persistent=False),
+                                 backend=HttpBackend(backend_url, max_connections=clients))
+    api = TranslationServer(service, coalesce=coalesce)
+    url = api.start()
+    latencies, errors = [], []
+    barrier = threading.Barrier(clients + 1)
+    threads = []
+    for c in range(clients):
+        owner = 'shared' if shared else f"client {c}"
+        texts = [f"hello world {owner} {i}" for i in range(requests)]
+        thread = threading.Thread(target=client, args=(url, texts, latencies, errors, barrier))
+        thread.start()
+        threads.append(thread)
+
+    fake.requests = 0
+    barrier.wait()
+    began = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    seconds = time.perf_counter() - began
+    stats = api.stats()
+    api.stop()
+    service.backend.close()
+    return {
+        'requests': len(latencies),
+        'seconds': seconds,
+        'per_sec': len(latencies) / seconds,
+        'p50': percentile(latencies, 50),
+        'p99': percentile(latencies, 99),
+        'backend_requests': fake.requests,
+        'coalesced': stats['coalescing']['coalesced'],
+        'errors': len(errors),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local API throughput benchmark")
+    parser.add_argument('--clients', type=int, default=32)
+    parser.add_argument('--requests', type=int, default=50, help="Requests per client")
+    parser.add_argument('--latency-ms', type=float, default=30.0)
+    args = parser.parse_args()
+
+    fake = FakeTranslationServer(latency_ms=args.latency_ms)
+    backend_url = fake.start()
+    print(f"{args.clients} clients x {args.requests} requests, "
+          f"backend latency {args.latency_ms:.0f} ms")
+    print(f"{'workload':<10} {'coalesce':<9} {'req/s':>8} {'p50 ms':>8} {'p99 ms':>8} "
+          f"{'backend':>8} {'coalesced':>10} {'errors':>7}")
+    for shared in (True, False):
+        for coalesce in (False, True):
+            r = run(backend_url, fake, args.clients, args.requests, coalesce, shared)
+            print(f"{'shared' if shared else 'unique':<10} {'on' if coalesce else 'off':<9} "
+                  f"{r['per_sec']:8.0f} {r['p50'] * 1000:8.1f} {r['p99'] * 1000:8.1f} "
+                  f"{r['backend_requests']:8d} {r['coalesced']:10d} {r['errors']:7d}")
+    fake.stop()
+
+
+if __name__ == "__main__":
+    main()
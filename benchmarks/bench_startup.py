@@ -0,0 +1,85 @@
+"""
+Startup benchmark: import time and time-to-ready in fresh interpreters.
+
+Every stage runs in a new Python process so nothing is already imported:
+- import main: what runs before the hotkey is registered
+- window object: import main + TranslatorWindow() (no Tk window needed)
+- warm up: the background warm-up (translator stack, backend, detector, engine)
+
+The slowest modules from `python -X importtime` are listed as well.
+    python benchmarks/bench_startup.py --runs 10
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+STAGES = {
+    'import main': "import main",
+    'window object': "import main\nfrom window import TranslatorWindow\nTranslatorWindow()",
+    'warm up': "from window import TranslatorWindow\nTranslatorWindow().warm_up()",
+}
+
+TIMER = """
+import time
+_start = time.perf_counter()
+{code}
+print(time.perf_counter() - _start)
+"""
+
+
+def run_python(args: list, env: dict) -> subprocess.CompletedProcess:
+    return subprocess.run([sys.executable, *args], cwd=ROOT, env=env,
+                          capture_output=True, text=True, check=True)
+
+
+def time_stage(code: str, runs: int, env: dict) -> list:
+    """Seconds for code in fresh interpreters, one per run."""
+    script = TIMER.format(code=code)
+    return [float(run_python(['-c', script], env).stdout.split()[-1]) for _ in range(runs)]
+
+
+def slowest_imports(module: str, env: dict, top: int) -> list:
+    """(cumulative µs, module) of the slowest imports, from -X importtime."""
+    stderr = run_python(['-X', 'importtime', '-c', f'import {module}'], env).stderr
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        rows.append((int(cumulative), name.rstrip()))
+    rows.sort(reverse=True)
+    return rows[:top]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Startup benchmark")
+    parser.add_argument('--runs', type=int, default=7)
+    parser.add_argument('--top', type=int, default=12)
+    args = parser.parse_args()
+
+    # Throwaway config directory so the user's cache and settings are untouched
+    env = dict(os.environ, APPDATA=tempfile.mkdtemp(prefix='qt-startup-'))
+
+    for name, code in STAGES.items():
+        try:
+            times = time_stage(code, args.runs, env)
+        except subprocess.CalledProcessError as e:
+            print(f"{name:<16} failed: {e.stderr.strip().splitlines()[-1]}")
+            continue
+        print(f"{name:<16} median {statistics.median(times) * 1000:7.1f} ms  "
+              f"min {min(times) * 1000:7.1f} ms  max {max(times) * 1000:7.1f} ms")
+
+    for module in ('main', 'translator'):
+        print(f"\nslowest imports under `import {module}` (cumulative):")
+        for micros, name in slowest_imports(module, env, args.top):
+            print(f"  {micros / 1000:7.1f} ms  {name}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""Circuit breaker and retry backoff for backend calls."""
+
+import random
+import threading
+import time
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+# The open period doubles after every failed probe, up to this factor
+MAX_RESET_FACTOR = 32
+
+
+def backoff_delay(attempt: int, base: float, cap: float) -> float:
+    """Seconds to sleep before retry number attempt (0-based): full jitter."""
+    return random.uniform(0, min(cap, base * 2 ** attempt))
+
+
+class CircuitBreaker:
+    """
+    Stops calls to a failing backend.
+    - closed: calls go through; failure_threshold consecutive failures open it
+    - open: calls fail fast until reset_timeout has passed
+    - half_open: one probe call goes through; success closes the circuit,
+      failure opens it again for twice as long
+
+    Listeners are called with the new state on every change (from the
+    thread that caused it).
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 10.0):
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_timeout = reset_timeout
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.open_for = reset_timeout
+        self.probing = False
+        self.lock = threading.Lock()
+        self.listeners = []
+        self.stats = {'opened': 0, 'fast_failures': 0, 'probes': 0}
+
+    def _set_state(self, state: str):
+        # Called with the lock held; returns listeners to notify after releasing it
+        if state == self.state:
+            return ()
+        self.state = state
+        return tuple(self.listeners)
+
+    def _notify(self, listeners, state: str):
+        for listener in listeners:
+            listener(state)
+
+    @property
+    def is_open(self) -> bool:
+        """True while requests are failing fast (open or waiting for a probe)."""
+        return self.state != CLOSED
+
+    def retry_in(self) -> float:
+        """Seconds until the next probe is allowed (0 if closed or due)."""
+        if self.state == CLOSED:
+            return 0.0
+        return max(0.0, self.opened_at + self.open_for - time.monotonic())
+
+    def allow(self) -> bool:
+        """Whether a call may go to the backend now (may start a probe)."""
+        with self.lock:
+            if self.state == CLOSED:
+                return True
+            if self.probing or time.monotonic() - self.opened_at < self.open_for:
+                self.stats['fast_failures'] += 1
+                return False
+            self.probing = True
+            self.stats['probes'] += 1
+            listeners = self._set_state(HALF_OPEN)
+        self._notify(listeners, HALF_OPEN)
+        return True
+
+    def record_success(self):
+        with self.lock:
+            self.failures = 0
+            self.probing = False
+            self.open_for = self.reset_timeout
+            listeners = self._set_state(CLOSED)
+        self._notify(listeners, CLOSED)
+
+    def record_failure(self):
+        with self.lock:
+            self.failures += 1
+            if self.state == CLOSED and self.failures < self.failure_threshold:
+                return
+            if self.state == OPEN:
+                return  # A call that started before the circuit opened
+            if self.probing:
+                self.open_for = min(self.open_for * 2, self.reset_timeout * MAX_RESET_FACTOR)
+            self.probing = False
+            self.opened_at = time.monotonic()
+            if self.state == CLOSED:
+                self.stats['opened'] += 1
+            listeners = self._set_state(OPEN)
+        self._notify(listeners, OPEN)
+
+    def release_probe(self):
+        """A probe ended without an answer either way (e.g. cancelled)."""
+        with self.lock:
+            if self.probing:
+                # Back to open, with the next probe due right away
+                self.probing = False
+                listeners = self._set_state(OPEN)
+            else:
+                listeners = ()
+        self._notify(listeners, OPEN)
+
+    def snapshot(self) -> dict:
+        return dict(self.stats, state=self.state, consecutive_failures=self.failures)
@@ -0,0 +1,246 @@
+"""Headless, streaming translation of large text files with checkpoint/resume."""
+
+import csv
+import io
+import json
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+# lines: every non-empty line, srt: subtitle text lines, csv: one column
+FORMATS = ('lines', 'srt', 'csv')
+# Lines sent to translate_many() at a time
+CHUNK_LINES = 100
+
+
+def split_line(body: str, fmt: str, column: int = 0, delimiter: str = ','):
+    """
+    Split one line (without its line ending) into the text to translate
+    and a function that puts a translation back. Text is None if the line
+    is kept as it is.
+    """
+    stripped = body.strip()
+    if not stripped:
+        return None, None
+    if fmt == 'srt' and (stripped.isdigit() or '-->' in stripped):
+        return None, None
+
+    if fmt == 'csv':
+        row = next(csv.reader([body], delimiter=delimiter))
+        if column >= len(row) or not row[column].strip():
+            return None, None
+
+        def rebuild(translated):
+            row[column] = translated
+            out = io.StringIO()
+            csv.writer(out, delimiter=delimiter, lineterminator='').writerow(row)
+            return out.getvalue()
+        return row[column], rebuild
+
+    start = body.index(stripped[0])
+    lead, trail = body[:start], body[start + len(stripped):]
+    return stripped, lambda translated: lead + translated + trail
+
+
+def translate_chunk(service, lines: list, fmt: str, column: int, delimiter: str,
+                    keep: int = 0):
+    """
+    Translate a list of raw lines (the first `keep` stay as they are).
+
+    Returns:
+        (output text, failed count, first error message or None)
+    """
+    pieces = []
+    texts = []
+    for index, line in enumerate(lines):
+        text = line.decode('utf-8', errors='replace')
+        body = text.rstrip('\r\n')
+        if index < keep:
+            segment, rebuild = None, None
+        else:
+            segment, rebuild = split_line(body, fmt, column, delimiter)
+        pieces.append((body, text[len(body):], rebuild))
+        if segment is not None:
+            texts.append(segment)
+
+    # Inner concurrency 1: parallelism comes from chunks in flight
+    results = iter(service.translate_many(texts, concurrency=1) if texts else ())
+    out = []
+    failed = 0
+    error = None
+    for body, ending, rebuild in pieces:
+        if rebuild is not None:
+            result = next(results)
+            if result['success']:
+                body = rebuild(result['translated'])
+            else:
+                failed += 1
+                error = error or result['error']
+        out.append(body + ending)
+    return ''.join(out), failed, error
+
+
+def read_chunks(src, offset: int, chunk_lines: int):
+    """Yield (lines, end offset) from a binary file, starting at offset."""
+    lines = []
+    for line in src:
+        lines.append(line)
+        offset += len(line)
+        if len(lines) >= chunk_lines:
+            yield lines, offset
+            lines = []
+    if lines:
+        yield lines, offset
+
+
+def load_checkpoint(path: str, input_path: str, output_path: str, options: dict):
+    """Return the saved state if it still matches the input and output files and options."""
+    try:
+        with open(path, encoding='utf-8') as f:
+            state = json.load(f)
+        stat = os.stat(input_path)
+        if (state['input_size'] != stat.st_size or state['input_mtime'] != stat.st_mtime
+                or os.path.getsize(output_path) < state['output_offset']
+                or any(state[name] != value for name, value in options.items())):
+            return None
+        return state
+    except (OSError, ValueError, KeyError):
+        return None
+
+
+def save_checkpoint(path: str, state: dict):
+    temp = f"{path}.tmp"
+    with open(temp, 'w', encoding='utf-8') as f:
+        json.dump(state, f)
+    os.replace(temp, path)
+
+
+def translate_file(service, input_path: str, output_path: str, fmt: str = 'lines',
+                   column: int = 0, delimiter: str = ',', concurrency: int = 4,
+                   chunk_lines: int = CHUNK_LINES, resume: bool = True,
+                   progress=None, skip_lines: int = 0) -> dict:
+    """
+    Stream input_path through service.translate_many() into output_path.
+    At most `concurrency` chunks are in memory; output is written in order
+    and a checkpoint after every chunk lets an interrupted run continue.
+    The first skip_lines lines (e.g. a CSV header) are copied unchanged.
+    The run stops at the first chunk with a failed line (backend down,
+    circuit open): that chunk is not written and the checkpoint stays
+    before it, so running again retries it.
+
+    Returns:
+        dict with lines, failed (lines of the chunk that stopped the run),
+        error, resumed_from, seconds and lines_per_sec
+    """
+    checkpoint_path = f"{output_path}.checkpoint"
+    options = {'format': fmt, 'column': column, 'delimiter': delimiter, 'skip_lines': skip_lines}
+    state = load_checkpoint(checkpoint_path, input_path, output_path, options) if resume else None
+    stat = os.stat(input_path)
+    if state is None:
+        state = dict(options, input_size=stat.st_size, input_mtime=stat.st_mtime,
+                     input_offset=0, output_offset=0, lines=0)
+    resumed_from = state['lines']
+    failed, error = 0, None
+    started = time.perf_counter()
+
+    executor = ThreadPoolExecutor(max_workers=max(1, concurrency), thread_name_prefix='bulk')
+    try:
+        with open(input_path, 'rb') as src, \
+                open(output_path, 'r+b' if state['output_offset'] else 'wb') as dst:
+            src.seek(state['input_offset'])
+            dst.seek(state['output_offset'])
+            dst.truncate()
+
+            in_flight = deque()
+            line_index = state['lines']
+
+            def write_oldest() -> bool:
+                nonlocal failed, error
+                future, end_offset, count = in_flight.popleft()
+                text, failed, error = future.result()
+                if failed:
+                    save_checkpoint(checkpoint_path, state)
+                    return False
+                dst.write(text.encode('utf-8'))
+                dst.flush()
+                state.update(input_offset=end_offset, output_offset=dst.tell(),
+                             lines=state['lines'] + count)
+                save_checkpoint(checkpoint_path, state)
+                if progress:
+                    progress(state['lines'] - resumed_from, time.perf_counter() - started)
+                return True
+
+            for lines, end_offset in read_chunks(src, state['input_offset'], chunk_lines):
+                keep = max(0, skip_lines - line_index)
+                in_flight.append((executor.submit(translate_chunk, service, lines, fmt,
+                                                  column, delimiter, keep),
+                                  end_offset, len(lines)))
+                line_index += len(lines)
+                if len(in_flight) >= concurrency and not write_oldest():
+                    break
+            while in_flight and not failed:
+                write_oldest()
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    if not failed and os.path.exists(checkpoint_path):
+        os.remove(checkpoint_path)
+    seconds = time.perf_counter() - started
+    done = state['lines'] - resumed_from
+    return {
+        'lines': state['lines'],
+        'failed': failed,
+        'error': error,
+        'resumed_from': resumed_from,
+        'seconds': seconds,
+        'lines_per_sec': done / seconds if seconds else 0.0,
+    }
+
+
+def run(args, primary_language: str) -> int:
+    """Run the headless mode from the arguments parsed in main.py; returns an exit code."""
+    from cache import TranslationCache
+    from translator import TranslationService
+
+    if not os.path.exists(args.translate_file):
+        print(f"Dosya bulunamadı: {args.translate_file}", file=sys.stderr)
+        return 2
+    root, ext = os.path.splitext(args.translate_file)
+    output = args.output or f"{root}.translated{ext}"
+    # Keep bulk runs out of the interactive cache on disk
+    service = TranslationService(primary_language, cache=TranslationCache(persistent=False))
+
+    last_report = 0.0
+
+    def progress(lines, seconds):
+        nonlocal last_report
+        if seconds - last_report < 0.5:
+            return
+        last_report = seconds
+        print(f"\r{lines} satır, {lines / seconds:.0f} satır/sn", end='', file=sys.stderr, flush=True)
+
+    try:
+        stats = translate_file(service, args.translate_file, output, args.format,
+                               args.column, args.delimiter, args.concurrency,
+                               args.chunk_lines, not args.no_resume, progress,
+                               args.skip_lines)
+    except KeyboardInterrupt:
+        print("\nDurduruldu; aynı komutla kaldığı yerden devam eder.", file=sys.stderr)
+        return 130
+    finally:
+        # Never built if the run failed early; building it here could raise
+        if service.has_backend:
+            service.backend.close()
+
+    print(file=sys.stderr)
+    if stats['resumed_from']:
+        print(f"{stats['resumed_from']}. satırdan devam edildi", file=sys.stderr)
+    if stats['failed']:
+        print(f"Çeviri hatası: {stats['error']}\n{stats['lines']}. satırda durdu; "
+              f"aynı komutla kaldığı yerden devam eder.", file=sys.stderr)
+        return 1
+    print(f"{stats['lines']} satır → {output}, {stats['lines_per_sec']:.0f} satır/sn",
+          file=sys.stderr)
+    return 0
@@ -0,0 +1,204 @@
+"""Two-tier translation cache: in-memory LRU in front of a SQLite store."""
+
+import json
+import sqlite3
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from pathlib import Path
+
+from config import (
+    get_data_path,
+    CACHE_MEMORY_ENTRIES,
+    CACHE_DISK_ENTRIES,
+    CACHE_MAX_AGE_DAYS,
+)
+from metrics import metrics
+
+# Run disk eviction once every this many writes
+PRUNE_INTERVAL = 200
+
+
+def normalize_text(text: str) -> str:
+    """Normalize text for cache lookups (unicode form and whitespace)."""
+    text = unicodedata.normalize('NFC', text)
+    return ' '.join(text.split())
+
+
+class TranslationCache:
+    """Bounded LRU in memory, backed by a persistent on-disk store."""
+
+    def __init__(self, path: Path = None, persistent: bool = True,
+                 memory_entries: int = CACHE_MEMORY_ENTRIES,
+                 disk_entries: int = CACHE_DISK_ENTRIES,
+                 max_age_days: float = CACHE_MAX_AGE_DAYS):
+        self.memory_entries = memory_entries
+        self.disk_entries = disk_entries
+        self.max_age = max_age_days * 86400
+        self.memory = OrderedDict()
+        self.lock = threading.Lock()
+        self.writes = 0
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.db = None
+
+        if persistent:
+            self.path = path or get_data_path('cache.sqlite3')
+            try:
+                self.db = self._open_db(self.path)
+            except sqlite3.Error:
+                self.db = None  # Fall back to memory only
+
+    @staticmethod
+    def _open_db(path: Path):
+        """Open (and create if needed) the SQLite store."""
+        db = sqlite3.connect(str(path), check_same_thread=False)
+        db.execute('PRAGMA journal_mode=WAL')
+        db.execute('PRAGMA synchronous=NORMAL')
+        db.execute(
+            'CREATE TABLE IF NOT EXISTS translations ('
+            ' key TEXT PRIMARY KEY,'
+            ' value TEXT NOT NULL,'
+            ' created REAL NOT NULL,'
+            ' accessed REAL NOT NULL)'
+        )
+        db.execute(
+            'CREATE INDEX IF NOT EXISTS translations_accessed '
+            'ON translations(accessed)'
+        )
+        db.commit()
+        return db
+
+    @staticmethod
+    def make_key(text: str, primary_language: str, target: str = 'auto') -> str:
+        """Build a cache key from normalized text, primary language and target."""
+        return f"{primary_language}\x1f{target}\x1f{normalize_text(text)}"
+
+    def get(self, key: str):
+        """Return a cached result dict or None."""
+        with metrics.span('cache_lookup'), self.lock:
+            value = self.memory.get(key)
+            if value is not None:
+                self.memory.move_to_end(key)
+                self.hits += 1
+                return dict(value)
+
+            if self.db is not None:
+                value = self._disk_get(key)
+                if value is not None:
+                    self._memory_put(key, value)
+                    self.hits += 1
+                    self.disk_hits += 1
+                    return dict(value)
+
+            self.misses += 1
+            return None
+
+    def peek(self, key: str, disk: bool = False):
+        """Return a cached result without touching stats (disk hits move to memory)."""
+        value = self.memory.get(key)
+        if value is None and disk and self.db is not None:
+            with self.lock:
+                value = self._disk_get(key)
+                if value is not None:
+                    self._memory_put(key, value)
+        return dict(value) if value is not None else None
+
+    def put(self, key: str, result: dict):
+        """Store a successful result in both tiers."""
+        value = dict(result)
+        with self.lock:
+            self._memory_put(key, value)
+            if self.db is not None:
+                self._disk_put(key, value)
+
+    def _memory_put(self, key: str, value: dict):
+        self.memory[key] = value
+        self.memory.move_to_end(key)
+        while len(self.memory) > self.memory_entries:
+            self.memory.popitem(last=False)
+
+    def _disk_get(self, key: str):
+        try:
+            row = self.db.execute(
+                'SELECT value, created FROM translations WHERE key = ?', (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            now = time.time()
+            if now - row[1] > self.max_age:
+                self.db.execute('DELETE FROM translations WHERE key = ?', (key,))
+                self.db.commit()
+                return None
+            self.db.execute(
+                'UPDATE translations SET accessed = ? WHERE key = ?', (now, key)
+            )
+            self.db.commit()
+            return json.loads(row[0])
+        except (sqlite3.Error, ValueError):
+            return None
+
+    def _disk_put(self, key: str, value: dict):
+        now = time.time()
+        try:
+            self.db.execute(
+                'INSERT OR REPLACE INTO translations (key, value, created, accessed) '
+                'VALUES (?, ?, ?, ?)',
+                (key, json.dumps(value, ensure_ascii=False), now, now)
+            )
+            self.db.commit()
+            self.writes += 1
+            if self.writes % PRUNE_INTERVAL == 0:
+                self._prune(now)
+        except sqlite3.Error:
+            pass
+
+    def _prune(self, now: float):
+        """Evict entries that are too old or over the disk size limit."""
+        self.db.execute(
+            'DELETE FROM translations WHERE created < ?', (now - self.max_age,)
+        )
+        count = self.db.execute('SELECT COUNT(*) FROM translations').fetchone()[0]
+        if count > self.disk_entries:
+            self.db.execute(
+                'DELETE FROM translations WHERE key IN ('
+                ' SELECT key FROM translations ORDER BY accessed LIMIT ?)',
+                (count - self.disk_entries,)
+            )
+        self.db.commit()
+
+    def trim(self, floor: int):
+        """Drop least recently used memory entries down to floor and free SQLite's page cache."""
+        with self.lock:
+            while len(self.memory) > max(0, floor):
+                self.memory.popitem(last=False)
+            if self.db is not None:
+                self.db.execute('PRAGMA shrink_memory')
+
+    def clear(self):
+        """Remove every cached entry."""
+        with self.lock:
+            self.memory.clear()
+            if self.db is not None:
+                self.db.execute('DELETE FROM translations')
+                self.db.commit()
+
+    def stats(self) -> dict:
+        """Return hit/miss counters and sizes."""
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'disk_hits': self.disk_hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'memory_entries': len(self.memory),
+        }
+
+    def close(self):
+        """Close the on-disk store."""
+        with self.lock:
+            if self.db is not None:
+                self.db.close()
+                self.db = None
@@ -10,6 +10,54 @@ DEFAULTS = {
     "primary_language": "tr",  # User's primary language
     "window_width": 600,
     "window_height": 60,
+    "adaptive_debounce": True,  # Debounce from typing cadence and latency
+    "debounce_ms": 400,  # Fixed delay when adaptive_debounce is off
+    "debounce_min_ms": 80,
+    "debounce_max_ms": 800,
+    "speculative_prefetch": False,  # Translate likely inputs while typing
+    "prefetch_budget_per_minute": 30,
+    "autocomplete_suggestions": 5,  # Completions from history under the input (0 = off)
+    "autocomplete_max_entries": 200000,
+    "history_enabled": True,  # Keep every translation in a searchable history (Ctrl+F)
+    "history_search_results": 8,
+    "fuzzy_memory_entries": 2000,  # Past inputs searched for near duplicates (0 = off)
+    "fuzzy_min_similarity": 0.85,  # Show a remembered translation this similar while waiting
+    "fuzzy_skip_similarity": 0,  # Use it instead of the network at or above this (0 = never)
+    "long_text_chars": 300,  # Inputs this long are translated in sentence chunks (0 = off)
+    "long_text_chunk_chars": 200,
+    "long_text_concurrency": 4,
+    "translation_mode": "single",  # detect | single | speculative
+    "offline_detection": True,  # Detect language locally when confident
+    "offline_detection_threshold": 0.9,
+    "offline_dictionary": True,  # Answer single words from the offline dictionary if installed
+    "dictionary_path": "",  # Defaults to dictionary_<primary>_en.bin next to settings.json
+    "backend": "google",  # google | http
+    "backend_url": "",  # Base URL for the http backend
+    "backend_connect_timeout": 3.0,
+    "backend_read_timeout": 10.0,
+    "retry_attempts": 2,  # Retries of a failed backend call (jittered exponential backoff)
+    "retry_base_ms": 200,
+    "retry_max_ms": 2000,
+    "breaker_failure_threshold": 5,  # Consecutive failures before going offline
+    "breaker_reset_seconds": 10,  # Offline this long before a probe (doubles while probes fail)
+    "hedge_urls": [],  # Extra endpoints ('google' or http backend URLs) for slow requests
+    "hedge_percentile": 90,  # Hedge once a request is slower than this latency percentile
+    "hedge_min_delay_ms": 30,
+    "hedge_max_extra": 0.1,  # Max fraction of extra requests spent on hedges
+    "prewarm_on_hotkey": True,  # Open/refresh a backend connection when the hotkey is pressed
+    "keep_alive_interval": 30,  # Seconds between idle connection refreshes (0 = off)
+    "keep_alive_budget_per_hour": 60,  # Max refresh requests per hour
+    "batch_max_chars": 4500,  # Backend character limit per request
+    "batch_max_items": 50,
+    "batch_concurrency": 4,
+    "server_port": 8766,  # Port of the local API (python main.py --serve)
+    "metrics_enabled": False,  # Per-stage latency histograms
+    "metrics_export_interval": 30,  # Seconds between metrics file exports
+    "cache_memory_entries": 512,  # In-memory LRU size
+    "cache_disk_entries": 20000,  # Persistent cache size
+    "cache_max_age_days": 30,
+    "idle_trim_minutes": 10,  # Free memory after the window is hidden this long (0 = off)
+    "idle_cache_floor": 64,  # In-memory cache entries kept when trimming
 }
 
 # Colors (Dark Theme)
@@ -20,6 +68,7 @@ COLORS = {
     "text": "#ffffff",
     "text_secondary": "#a0a0a0",
     "accent": "#4285f4",  # Google Blue
+    "warning": "#f4b400",
     "border": "#4a4a4a",
 }
 
@@ -31,6 +80,10 @@ def get_config_path() -> Path:
     config_dir.mkdir(parents=True, exist_ok=True)
     return config_dir / 'settings.json'
 
+def get_data_path(filename: str) -> Path:
+    """Get the path of a data file next to the config file."""
+    return get_config_path().parent / filename
+
 def load_settings() -> dict:
     """Load settings from config file."""
     config_path = get_config_path()
@@ -62,3 +115,51 @@ HOTKEY = SETTINGS.get('hotkey', DEFAULTS['hotkey'])
 PRIMARY_LANGUAGE = SETTINGS.get('primary_language', DEFAULTS['primary_language'])
 WINDOW_WIDTH = SETTINGS.get('window_width', DEFAULTS['window_width'])
 WINDOW_HEIGHT = SETTINGS.get('window_height', DEFAULTS['window_height'])
+ADAPTIVE_DEBOUNCE = SETTINGS.get('adaptive_debounce', DEFAULTS['adaptive_debounce'])
+DEBOUNCE_MS = SETTINGS.get('debounce_ms', DEFAULTS['debounce_ms'])
+DEBOUNCE_MIN_MS = SETTINGS.get('debounce_min_ms', DEFAULTS['debounce_min_ms'])
+DEBOUNCE_MAX_MS = SETTINGS.get('debounce_max_ms', DEFAULTS['debounce_max_ms'])
+SPECULATIVE_PREFETCH = SETTINGS.get('speculative_prefetch', DEFAULTS['speculative_prefetch'])
+PREFETCH_BUDGET_PER_MINUTE = SETTINGS.get('prefetch_budget_per_minute', DEFAULTS['prefetch_budget_per_minute'])
+AUTOCOMPLETE_SUGGESTIONS = SETTINGS.get('autocomplete_suggestions', DEFAULTS['autocomplete_suggestions'])
+AUTOCOMPLETE_MAX_ENTRIES = SETTINGS.get('autocomplete_max_entries', DEFAULTS['autocomplete_max_entries'])
+HISTORY_ENABLED = SETTINGS.get('history_enabled', DEFAULTS['history_enabled'])
+HISTORY_SEARCH_RESULTS = SETTINGS.get('history_search_results', DEFAULTS['history_search_results'])
+FUZZY_MEMORY_ENTRIES = SETTINGS.get('fuzzy_memory_entries', DEFAULTS['fuzzy_memory_entries'])
+FUZZY_MIN_SIMILARITY = SETTINGS.get('fuzzy_min_similarity', DEFAULTS['fuzzy_min_similarity'])
+FUZZY_SKIP_SIMILARITY = SETTINGS.get('fuzzy_skip_similarity', DEFAULTS['fuzzy_skip_similarity'])
+LONG_TEXT_CHARS = SETTINGS.get('long_text_chars', DEFAULTS['long_text_chars'])
+LONG_TEXT_CHUNK_CHARS = SETTINGS.get('long_text_chunk_chars', DEFAULTS['long_text_chunk_chars'])
+LONG_TEXT_CONCURRENCY = SETTINGS.get('long_text_concurrency', DEFAULTS['long_text_concurrency'])
+TRANSLATION_MODE = SETTINGS.get('translation_mode', DEFAULTS['translation_mode'])
+OFFLINE_DETECTION = SETTINGS.get('offline_detection', DEFAULTS['offline_detection'])
+OFFLINE_DETECTION_THRESHOLD = SETTINGS.get('offline_detection_threshold', DEFAULTS['offline_detection_threshold'])
+OFFLINE_DICTIONARY = SETTINGS.get('offline_dictionary', DEFAULTS['offline_dictionary'])
+DICTIONARY_PATH = SETTINGS.get('dictionary_path', DEFAULTS['dictionary_path'])
+BACKEND = SETTINGS.get('backend', DEFAULTS['backend'])
+BACKEND_URL = SETTINGS.get('backend_url', DEFAULTS['backend_url'])
+BACKEND_CONNECT_TIMEOUT = SETTINGS.get('backend_connect_timeout', DEFAULTS['backend_connect_timeout'])
+BACKEND_READ_TIMEOUT = SETTINGS.get('backend_read_timeout', DEFAULTS['backend_read_timeout'])
+RETRY_ATTEMPTS = SETTINGS.get('retry_attempts', DEFAULTS['retry_attempts'])
+RETRY_BASE_MS = SETTINGS.get('retry_base_ms', DEFAULTS['retry_base_ms'])
+RETRY_MAX_MS = SETTINGS.get('retry_max_ms', DEFAULTS['retry_max_ms'])
+BREAKER_FAILURE_THRESHOLD = SETTINGS.get('breaker_failure_threshold', DEFAULTS['breaker_failure_threshold'])
+BREAKER_RESET_SECONDS = SETTINGS.get('breaker_reset_seconds', DEFAULTS['breaker_reset_seconds'])
+HEDGE_URLS = SETTINGS.get('hedge_urls', DEFAULTS['hedge_urls'])
+HEDGE_PERCENTILE = SETTINGS.get('hedge_percentile', DEFAULTS['hedge_percentile'])
+HEDGE_MIN_DELAY_MS = SETTINGS.get('hedge_min_delay_ms', DEFAULTS['hedge_min_delay_ms'])
+HEDGE_MAX_EXTRA = SETTINGS.get('hedge_max_extra', DEFAULTS['hedge_max_extra'])
+PREWARM_ON_HOTKEY = SETTINGS.get('prewarm_on_hotkey', DEFAULTS['prewarm_on_hotkey'])
+KEEP_ALIVE_INTERVAL = SETTINGS.get('keep_alive_interval', DEFAULTS['keep_alive_interval'])
+KEEP_ALIVE_BUDGET_PER_HOUR = SETTINGS.get('keep_alive_budget_per_hour', DEFAULTS['keep_alive_budget_per_hour'])
+BATCH_MAX_CHARS = SETTINGS.get('batch_max_chars', DEFAULTS['batch_max_chars'])
+BATCH_MAX_ITEMS = SETTINGS.get('batch_max_items', DEFAULTS['batch_max_items'])
+BATCH_CONCURRENCY = SETTINGS.get('batch_concurrency', DEFAULTS['batch_concurrency'])
+SERVER_PORT = SETTINGS.get('server_port', DEFAULTS['server_port'])
+METRICS_ENABLED = SETTINGS.get('metrics_enabled', DEFAULTS['metrics_enabled'])
+METRICS_EXPORT_INTERVAL = SETTINGS.get('metrics_export_interval', DEFAULTS['metrics_export_interval'])
+CACHE_MEMORY_ENTRIES = SETTINGS.get('cache_memory_entries', DEFAULTS['cache_memory_entries'])
+CACHE_DISK_ENTRIES = SETTINGS.get('cache_disk_entries', DEFAULTS['cache_disk_entries'])
+CACHE_MAX_AGE_DAYS = SETTINGS.get('cache_max_age_days', DEFAULTS['cache_max_age_days'])
+IDLE_TRIM_MINUTES = SETTINGS.get('idle_trim_minutes', DEFAULTS['idle_trim_minutes'])
+IDLE_CACHE_FLOOR = SETTINGS.get('idle_cache_floor', DEFAULTS['idle_cache_floor'])
@@ -0,0 +1,228 @@
+"""Offline language detection: Unicode script fast path + character n-grams."""
+
+import math
+from collections import Counter
+
+from backends import Detected
+from langdata import TRAINING_TEXT
+
+# Only look at the start of long inputs
+MAX_CHARS = 160
+NGRAM_ORDERS = (1, 2, 3)
+# Softens naive Bayes scores, whose n-grams are far from independent
+TEMPERATURE = 4.0
+
+# Log-score penalty for each letter a language does not use
+FOREIGN_LETTER_PENALTY = 8.0
+
+# Non-ASCII letters of each Latin-script language's alphabet
+ALPHABETS = {
+    'en': '',
+    'tr': 'çğıöşüâîû',
+    'de': 'äöüß',
+    'fr': 'àâæçéèêëîïôœùûüÿ',
+    'es': 'áéíñóúü',
+    'it': 'àèéìíîòóùú',
+    'pt': 'áâãàçéêíóôõú',
+    'nl': 'éèëïöü',
+    'pl': 'ąćęłńóśźż',
+    'sv': 'åäöé',
+    'da': 'æøåé',
+    'no': 'æøåéèóô',
+    'fi': 'äöå',
+    'cs': 'áčďéěíňóřšťúůýž',
+    'hu': 'áéíóöőúüű',
+    'ro': 'ăâîșțşţ',
+    'ms': '',
+}
+
+# Confidence of a script-based guess without distinguishing letters: below
+# the offline detection threshold, so the network decides
+AMBIGUOUS_CONFIDENCE = 0.6
+
+# Cyrillic letters that only some of the languages using the script have
+# (Bulgarian has no letter of its own, but lacks the Russian ones)
+UKRAINIAN_CHARS = set('іїєґ')
+RUSSIAN_CHARS = set('ыэё')
+BELARUSIAN_CHARS = set('ў')
+SERBIAN_CHARS = set('ћђ')
+MACEDONIAN_CHARS = set('ѓќѕ')
+SOUTH_SLAVIC_CHARS = set('јљњџ')  # Serbian and Macedonian
+
+# Arabic-script letters: Urdu and Persian additions, and Arabic forms
+# those two languages replace (ي ك) or rarely use (ة ى)
+URDU_CHARS = set('ٹڈڑںےۓھ')
+PERSIAN_CHARS = set('پچژگکی')
+ARABIC_CHARS = set('يكةى')
+
+# Frequent characters that differ between simplified and traditional Chinese
+SIMPLIFIED_CHARS = set('这们说语国对会来个时后还开关学么体为点长见话车门问间电东马书头实现里')
+TRADITIONAL_CHARS = set('這們說語國對會來個時後還開關學麼體為點長見話車門問間電東馬書頭實現裡')
+# Chinese characters of the lists above that modern Japanese does not use:
+# kanji-only Japanese (東京, 日本語) has none of them
+NON_JAPANESE_CHARS = set('这们说语对么为长见话车门问间电东马书头实现还开关时'
+                         '這們說國對會來學麼體點實關裡')
+
+
+def _script(char: str) -> str:
+    """Return a coarse script name for a letter."""
+    code = ord(char)
+    if code < 0x250:
+        return 'latin'
+    if 0x370 <= code <= 0x3FF:
+        return 'greek'
+    if 0x400 <= code <= 0x4FF:
+        return 'cyrillic'
+    if 0x600 <= code <= 0x6FF or 0x750 <= code <= 0x77F:
+        return 'arabic'
+    if 0x3040 <= code <= 0x30FF:
+        return 'kana'
+    if 0xAC00 <= code <= 0xD7AF or 0x1100 <= code <= 0x11FF or 0x3130 <= code <= 0x318F:
+        return 'hangul'
+    if 0x4E00 <= code <= 0x9FFF or 0x3400 <= code <= 0x4DBF:
+        return 'han'
+    return 'other'
+
+
+def _ngrams(text: str):
+    """Yield the character n-grams of every word in text."""
+    for word in text.lower().split():
+        word = ''.join(c for c in word if c.isalpha())
+        if not word:
+            continue
+        padded = f" {word} "
+        for n in NGRAM_ORDERS:
+            for i in range(len(padded) - n + 1):
+                gram = padded[i:i + n]
+                if gram != ' ':
+                    yield gram
+
+
+class LanguageDetector:
+    """Detects the language of short texts without network access."""
+
+    def __init__(self, training: dict = None):
+        training = training or TRAINING_TEXT
+        self.languages = sorted(training)
+        self.floors = []
+        self.alphabets = [set(ALPHABETS.get(lang, '')) for lang in self.languages]
+        # ngram -> list of (language index, log probability above the floor)
+        self.index = {}
+
+        for idx, lang in enumerate(self.languages):
+            counts = Counter(_ngrams(training[lang]))
+            total = sum(counts.values())
+            vocabulary = len(counts) + 1
+            floor = math.log(1 / (total + vocabulary))
+            self.floors.append(floor)
+            for gram, count in counts.items():
+                bonus = math.log((count + 1) / (total + vocabulary)) - floor
+                self.index.setdefault(gram, []).append((idx, bonus))
+
+    def detect(self, text: str) -> Detected:
+        """Return the detected language code and a 0..1 confidence."""
+        text = text[:MAX_CHARS]
+        scripts = Counter(_script(c) for c in text if c.isalpha())
+        if not scripts:
+            return Detected('', 0.0)
+
+        script, count = scripts.most_common(1)[0]
+        share = count / sum(scripts.values())
+
+        if script == 'latin':
+            lang, confidence = self._detect_latin(text)
+            return Detected(lang, confidence * share)
+        if scripts.get('kana'):
+            return Detected('ja', 0.99)
+        if script == 'hangul':
+            return Detected('ko', 0.99 * share)
+        if script == 'greek':
+            return Detected('el', 0.99 * share)
+        if script == 'arabic':
+            return self._detect_arabic(text, share)
+        if script == 'cyrillic':
+            return self._detect_cyrillic(text.lower(), share)
+        if script == 'han':
+            return self._detect_chinese(text, share)
+        return Detected('', 0.0)
+
+    def support(self, text: str, lang: str) -> float:
+        """Posterior of lang relative to the best language, 0..1, for Latin text.
+
+        Texts in other scripts return 1.0: the n-gram model has no say there.
+        """
+        scores = self._latin_scores(text[:MAX_CHARS])
+        if scores is None or lang not in self.languages:
+            return 1.0
+        return math.exp(scores[self.languages.index(lang)] - max(scores))
+
+    def _latin_scores(self, text: str):
+        floors = self.floors
+        scores = [0.0] * len(floors)
+        grams = 0
+        index = self.index
+        for gram in _ngrams(text):
+            grams += 1
+            for idx, bonus in index.get(gram, ()):
+                scores[idx] += bonus
+        if not grams:
+            return None
+
+        foreign = {c for c in text.lower() if c.isalpha() and not c.isascii()}
+        if foreign:
+            for idx, alphabet in enumerate(self.alphabets):
+                scores[idx] -= FOREIGN_LETTER_PENALTY * len(foreign - alphabet)
+
+        # Log scores softened by TEMPERATURE
+        return [(s + f * grams) / TEMPERATURE for s, f in zip(scores, floors)]
+
+    def _detect_latin(self, text: str):
+        scores = self._latin_scores(text)
+        if scores is None:
+            return '', 0.0
+        # Posterior of the best language
+        best = max(range(len(scores)), key=scores.__getitem__)
+        top = scores[best]
+        total = sum(math.exp(s - top) for s in scores)
+        return self.languages[best], 1 / total
+
+    @staticmethod
+    def _detect_cyrillic(text: str, share: float) -> Detected:
+        letters = set(text)
+        uk = len(letters & UKRAINIAN_CHARS)
+        ru = len(letters & RUSSIAN_CHARS)
+        if letters & SERBIAN_CHARS:
+            return Detected('sr', 0.95 * share)
+        if letters & MACEDONIAN_CHARS:
+            return Detected('mk', 0.95 * share)
+        if letters & SOUTH_SLAVIC_CHARS:
+            return Detected('sr', AMBIGUOUS_CONFIDENCE * share)
+        if letters & BELARUSIAN_CHARS:
+            return Detected('be', 0.95 * share)
+        if uk > ru:
+            return Detected('uk', 0.95 * share)
+        if ru > uk:
+            return Detected('ru', 0.95 * share)
+        # Bulgarian, or Russian without ы/э/ё
+        return Detected('bg' if 'ъ' in letters else 'ru', AMBIGUOUS_CONFIDENCE * share)
+
+    @staticmethod
+    def _detect_arabic(text: str, share: float) -> Detected:
+        letters = set(text)
+        if letters & URDU_CHARS:
+            return Detected('ur', 0.95 * share)
+        if letters & PERSIAN_CHARS and not letters & ARABIC_CHARS:
+            return Detected('fa', 0.95 * share)
+        if letters & ARABIC_CHARS and not letters & PERSIAN_CHARS:
+            return Detected('ar', 0.95 * share)
+        return Detected('ar', AMBIGUOUS_CONFIDENCE * share)
+
+    @staticmethod
+    def _detect_chinese(text: str, share: float) -> Detected:
+        # Kana was checked before: only Chinese-only characters rule out Japanese
+        simplified = sum(1 for c in text if c in SIMPLIFIED_CHARS)
+        traditional = sum(1 for c in text if c in TRADITIONAL_CHARS)
+        lang = 'zh-tw' if traditional > simplified else 'zh-cn'
+        if simplified == traditional or not any(c in NON_JAPANESE_CHARS for c in text):
+            return Detected(lang, AMBIGUOUS_CONFIDENCE * share)
+        return Detected(lang, 0.95 * share)
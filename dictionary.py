@@ -0,0 +1,266 @@
+"""
+Offline bilingual word dictionary in a compact, memory-mapped file.
+
+Each direction (e.g. tr→en and en→tr) is a byte-level trie over the UTF-8
+encoded headwords, stored as flat arrays so lookups read only the few
+nodes they visit straight from the mapped file:
+
+    header   MAGIC (includes the format version), section count
+    section  src, dest, offsets and sizes of the three arrays below
+    nodes    <IIB  value offset (NO_VALUE if none), first edge, edge count
+    edges    one label byte per edge, sorted within a node
+    values   <H length + UTF-8 translation, per headword
+
+Nodes are stored breadth-first, so edge k always leads to node k + 1 and
+child indexes need not be stored.
+
+Build one from a tab-separated word list (primary word, English word;
+repeated headwords become alternatives):
+    python dictionary.py words.tsv --primary tr
+"""
+
+import argparse
+import mmap
+import struct
+import unicodedata
+from collections import deque
+from pathlib import Path
+
+MAGIC = b'QTDICT\x00\x02'
+HEADER = struct.Struct('<8sH')
+SECTION = struct.Struct('<8s8sIIIIII')
+NODE = struct.Struct('<IIB')
+VALUE_LENGTH = struct.Struct('<H')
+NO_VALUE = 0xFFFFFFFF
+
+# Characters allowed inside a single word besides letters
+WORD_JOINERS = "-'’"
+
+
+def dictionary_path(primary_language: str) -> Path:
+    """Default location of the dictionary for a primary language."""
+    from config import get_data_path
+    return get_data_path(f'dictionary_{primary_language}_en.bin')
+
+
+def normalize_word(word: str, lang: str) -> str:
+    """Lookup form of a word: NFC, lowercase (Turkish-aware) and trimmed."""
+    word = unicodedata.normalize('NFC', word.strip())
+    if lang in ('tr', 'az'):
+        word = word.replace('I', 'ı').replace('İ', 'i')
+    return word.lower()
+
+
+def is_single_word(text: str) -> bool:
+    """True for one token made of letters (and inner hyphens/apostrophes)."""
+    text = text.strip()
+    return bool(text) and text[0].isalpha() and all(
+        c.isalpha() or c in WORD_JOINERS for c in text)
+
+
+class _Section:
+    """One translation direction inside the mapped file."""
+
+    def __init__(self, buffer, nodes: int, node_count: int, edges: int,
+                 edge_count: int, values: int):
+        self.buffer = buffer
+        self.nodes = nodes
+        self.node_count = node_count
+        self.edges = edges
+        self.edge_count = edge_count
+        self.values = values
+
+    def _node(self, index: int):
+        return NODE.unpack_from(self.buffer, self.nodes + index * NODE.size)
+
+    def _child(self, index: int, label: int):
+        _, first, count = self._node(index)
+        start = self.edges + first
+        edge = self.buffer.find(bytes((label,)), start, start + count)
+        if edge < 0:
+            return None
+        return edge - self.edges + 1
+
+    def _find(self, key: bytes):
+        index = 0
+        for label in key:
+            index = self._child(index, label)
+            if index is None:
+                return None
+        return index
+
+    def _value(self, offset: int) -> str:
+        start = self.values + offset
+        (length,) = VALUE_LENGTH.unpack_from(self.buffer, start)
+        start += VALUE_LENGTH.size
+        return bytes(self.buffer[start:start + length]).decode('utf-8')
+
+    def get(self, key: str):
+        index = self._find(key.encode('utf-8'))
+        if index is None:
+            return None
+        offset = self._node(index)[0]
+        return None if offset == NO_VALUE else self._value(offset)
+
+    def complete(self, prefix: str, limit: int) -> list:
+        """Up to limit (headword, translation) pairs starting with prefix, in byte order."""
+        key = prefix.encode('utf-8')
+        index = self._find(key)
+        if index is None:
+            return []
+        found = []
+        stack = [(index, key)]
+        while stack and len(found) < limit:
+            index, word = stack.pop()
+            offset, first, count = self._node(index)
+            if offset != NO_VALUE:
+                found.append((word.decode('utf-8'), self._value(offset)))
+            # Reversed so the smallest label is visited first
+            labels = self.buffer[self.edges + first:self.edges + first + count]
+            for offset in range(count - 1, -1, -1):
+                stack.append((first + offset + 1, word + labels[offset:offset + 1]))
+        return found
+
+
+class OfflineDictionary:
+    """Read-only dictionary backed by a memory-mapped file."""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.file = open(self.path, 'rb')
+        try:
+            self.buffer = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+            self.sections = self._read_sections()
+        except (ValueError, OSError, struct.error):
+            self.file.close()
+            raise
+
+    def _read_sections(self) -> dict:
+        magic, count = HEADER.unpack_from(self.buffer, 0)
+        if magic != MAGIC:
+            raise ValueError(f"Not a dictionary file: {self.path}")
+        sections = {}
+        for i in range(count):
+            src, dest, *layout = SECTION.unpack_from(self.buffer, HEADER.size + i * SECTION.size)
+            direction = (src.rstrip(b'\x00').decode('ascii'), dest.rstrip(b'\x00').decode('ascii'))
+            nodes, node_count, edges, edge_count, values, _ = layout
+            sections[direction] = _Section(self.buffer, nodes, node_count,
+                                           edges, edge_count, values)
+        return sections
+
+    @property
+    def directions(self) -> list:
+        return list(self.sections)
+
+    def lookup(self, word: str, src: str, dest: str):
+        """Translation of a single word, or None."""
+        section = self.sections.get((src, dest))
+        if section is None:
+            return None
+        return section.get(normalize_word(word, src))
+
+    def complete(self, prefix: str, src: str, dest: str, limit: int = 10) -> list:
+        """Headwords starting with prefix, with their translations."""
+        section = self.sections.get((src, dest))
+        if section is None:
+            return []
+        return section.complete(normalize_word(prefix, src), limit)
+
+    def close(self):
+        self.buffer.close()
+        self.file.close()
+
+
+def _serialize(entries: dict):
+    """Flatten {headword: translation} into (nodes, edges, values) bytes."""
+    trie = [{}, None]  # [children by label byte, translation]
+    for word, translation in entries.items():
+        node = trie
+        for label in word.encode('utf-8'):
+            node = node[0].setdefault(label, [{}, None])
+        node[1] = translation
+
+    nodes, edges, values = bytearray(), bytearray(), bytearray()
+    queue = deque([trie])
+    while queue:
+        children, translation = queue.popleft()
+        if translation is None:
+            value_offset = NO_VALUE
+        else:
+            value_offset = len(values)
+            data = translation[:0x3FFF].encode('utf-8')  # Fits the <H length
+            values += VALUE_LENGTH.pack(len(data)) + data
+        labels = sorted(children)
+        nodes += NODE.pack(value_offset, len(edges), len(labels))
+        edges += bytes(labels)
+        queue.extend(children[label] for label in labels)
+    return nodes, edges, values
+
+
+def build_dictionary(pairs, output, primary_language: str) -> dict:
+    """
+    Write a dictionary file from (primary word, English word) pairs.
+    Returns the number of headwords per direction.
+    """
+    forward, backward = (primary_language, 'en'), ('en', primary_language)
+    directions = {forward: {}, backward: {}}
+    for primary_word, english_word in pairs:
+        primary_word, english_word = primary_word.strip(), english_word.strip()
+        if not primary_word or not english_word:
+            continue
+        for direction, source, target in ((forward, primary_word, english_word),
+                                          (backward, english_word, primary_word)):
+            alternatives = directions[direction].setdefault(normalize_word(source, direction[0]), [])
+            if target not in alternatives:
+                alternatives.append(target)
+
+    sections = []
+    for (src, dest), entries in directions.items():
+        flat = {word: ', '.join(alternatives) for word, alternatives in entries.items()}
+        sections.append((src, dest, *_serialize(flat)))
+
+    offset = HEADER.size + SECTION.size * len(sections)
+    header = bytearray(HEADER.pack(MAGIC, len(sections)))
+    for src, dest, nodes, edges, values in sections:
+        header += SECTION.pack(src.encode('ascii'), dest.encode('ascii'),
+                               offset, len(nodes) // NODE.size,
+                               offset + len(nodes), len(edges),
+                               offset + len(nodes) + len(edges), len(values))
+        offset += len(nodes) + len(edges) + len(values)
+
+    with open(output, 'wb') as f:
+        f.write(header)
+        for _, _, nodes, edges, values in sections:
+            f.write(nodes)
+            f.write(edges)
+            f.write(values)
+    return {f"{src}-{dest}": len(entries) for (src, dest), entries in directions.items()}
+
+
+def read_word_list(path):
+    """Yield (primary word, English word) pairs from a tab-separated file."""
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            if not line.strip() or line.startswith('#'):
+                continue
+            parts = line.rstrip('\n').split('\t')
+            if len(parts) >= 2:
+                yield parts[0], parts[1]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the offline word dictionary")
+    parser.add_argument('word_list', help="TSV file: primary language word <TAB> English word")
+    parser.add_argument('--primary', default='tr', help="Primary language code")
+    parser.add_argument('--output', help="Output file (default: next to settings.json)")
+    args = parser.parse_args()
+
+    output = args.output or dictionary_path(args.primary)
+    counts = build_dictionary(read_word_list(args.word_list), output, args.primary)
+    print(f"Wrote {output} ({Path(output).stat().st_size / 1e6:.1f} MB)")
+    for direction, count in counts.items():
+        print(f"  {direction}: {count} headwords")
+
+
+if __name__ == "__main__":
+    main()
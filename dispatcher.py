@@ -0,0 +1,60 @@
+"""Marshals callbacks from worker threads onto the Tk main loop."""
+
+import sys
+import threading
+from collections import deque
+
+
+class TkDispatcher:
+    """
+    Queue of callbacks for the Tk thread. Any thread may post(); at most one
+    root.after(0, ...) is pending at a time and it drains the whole queue.
+
+    With a threaded Tcl (the default build) a root.after() from another
+    thread is handed to the Tk thread through Tcl's thread notifier, which
+    wakes mainloop() at once. The Tk loop can block while idle and still
+    react to hotkeys and the tray without any polling timer.
+
+    Between attach() and mainloop() other threads cannot schedule on the
+    root, so attach() leaves one drain pending that runs everything posted
+    until then as soon as mainloop() starts.
+    """
+
+    def __init__(self, root=None):
+        self.root = root
+        self.callbacks = deque()
+        self.lock = threading.Lock()
+        self.scheduled = False
+
+    def attach(self, root):
+        """Set the Tk root (on the Tk thread, before mainloop()); posts run once the loop starts."""
+        with self.lock:
+            self.root = root
+            self.scheduled = True
+        root.after(0, self._drain)
+
+    def post(self, callback):
+        """Run callback on the Tk thread as soon as possible."""
+        self.callbacks.append(callback)
+        with self.lock:
+            if self.scheduled or self.root is None:
+                return
+            self.scheduled = True
+        try:
+            self.root.after(0, self._drain)
+        except RuntimeError:
+            # Tk loop has ended: nothing will run these any more
+            self.callbacks.clear()
+            with self.lock:
+                self.scheduled = False
+
+    def _drain(self):
+        with self.lock:
+            self.scheduled = False
+        while self.callbacks:
+            callback = self.callbacks.popleft()
+            try:
+                callback()
+            except Exception:
+                # Reported like any Tk callback error; the rest still run
+                self.root.report_callback_exception(*sys.exc_info())
@@ -0,0 +1,178 @@
+"""asyncio translation engine running on a dedicated event-loop thread."""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from metrics import metrics
+from translator import TranslationService, make_error
+
+# Upper bound on concurrently running translations in translate_all()
+MAX_IN_FLIGHT = 2000
+# A connection used within this many seconds is not refreshed by prewarm()
+PREWARM_MAX_IDLE = 15.0
+
+
+class TranslationEngine:
+    """
+    Owns one background event loop. Other threads submit work with submit(),
+    which returns a thread-safe concurrent.futures.Future; cancelling that
+    future cancels the request inside the loop.
+
+    Backends with native async support run thousands of requests on the
+    loop itself; blocking backends run on a small, bounded thread pool.
+    """
+
+    def __init__(self, service: TranslationService, timeout: float = 15.0,
+                 max_blocking: int = 4):
+        self.service = service
+        self.timeout = timeout
+        self.executor = ThreadPoolExecutor(max_workers=max_blocking,
+                                           thread_name_prefix='translate')
+        self.loop = None
+        self.thread = None
+        self.ready = threading.Event()
+        self.keep_alive = None
+        self.stats = {'submitted': 0, 'completed': 0, 'cancelled': 0, 'timeouts': 0, 'errors': 0,
+                      'keep_alive_refreshes': 0, 'keep_alive_budget_skips': 0}
+
+    def start(self):
+        """Start the event-loop thread (idempotent)."""
+        if self.thread is not None:
+            return
+        self.thread = threading.Thread(target=self._run, name='translation-engine', daemon=True)
+        self.thread.start()
+        self.ready.wait()
+
+    def _run(self):
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        self.loop.set_default_executor(self.executor)
+        self.ready.set()
+        self.loop.run_forever()
+        # Let pending work (e.g. the keep-alive task) finish cancelling
+        tasks = asyncio.all_tasks(self.loop)
+        for task in tasks:
+            task.cancel()
+        self.loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+
+    def stop(self):
+        """Stop the loop and wait for the thread to exit."""
+        if self.loop is None:
+            return
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join(timeout=2)
+        self.executor.shutdown(wait=False, cancel_futures=True)
+        self.loop = None
+        self.thread = None
+        self.keep_alive = None
+        self.ready.clear()
+
+    def run(self, coro):
+        """Schedule a coroutine on the engine loop; returns a concurrent Future."""
+        self.start()
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def submit(self, text: str, timeout: float = None, on_part=None):
+        """
+        Translate text on the engine; returns a concurrent Future of the result dict.
+        For long texts on an async backend, on_part(result) is called from the
+        engine thread with every longer translated prefix.
+        """
+        self.stats['submitted'] += 1
+        return self.run(self.translate(text, timeout, on_part))
+
+    async def translate(self, text: str, timeout: float = None, on_part=None) -> dict:
+        """Translate one text with a timeout (coroutine, runs on the loop)."""
+        try:
+            if self.service.is_long(text):
+                # Chunks are timed out one by one; the whole text may take longer.
+                # Blocking backends run each chunk on the executor via to_thread
+                result = await self.service.atranslate_long(
+                    text, on_part, timeout=timeout or self.timeout)
+            else:
+                result = await asyncio.wait_for(self._translate(text), timeout or self.timeout)
+        except asyncio.TimeoutError:
+            self.stats['timeouts'] += 1
+            return make_error('Request timed out')
+        except asyncio.CancelledError:
+            self.stats['cancelled'] += 1
+            raise
+        except Exception as e:
+            # E.g. a misconfigured backend: the caller still needs a result
+            self.stats['errors'] += 1
+            return make_error(str(e) or type(e).__name__)
+        self.stats['completed'] += 1
+        return result
+
+    async def _translate(self, text: str) -> dict:
+        if self.service.backend.supports_async:
+            return await self.service.atranslate(text)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, self.service.translate, text)
+
+    def lookup(self, texts: list):
+        """Cached results (memory or disk, no network) of texts off the caller's thread; returns a Future of a list."""
+        return self.run(self._lookup(texts))
+
+    async def _lookup(self, texts: list) -> list:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self.executor, lambda: [self.service.cached(text, disk=True) for text in texts])
+
+    def translate_all(self, texts: list, timeout: float = None):
+        """Translate every text concurrently; returns a concurrent Future of a list."""
+        return self.run(self._translate_all(texts, timeout))
+
+    async def _translate_all(self, texts: list, timeout: float = None) -> list:
+        limit = asyncio.Semaphore(MAX_IN_FLIGHT)
+
+        async def one(text):
+            async with limit:
+                return await self.translate(text, timeout)
+
+        return await asyncio.gather(*(one(text) for text in texts))
+
+    def prewarm(self, max_idle: float = PREWARM_MAX_IDLE, open_new: bool = True):
+        """Open or refresh a backend connection in the background; returns a Future."""
+        return self.run(self._prewarm(max_idle, open_new))
+
+    async def _prewarm(self, max_idle: float, open_new: bool) -> str:
+        if not open_new and not self.service.has_backend:
+            return 'none'  # Released while idle; not worth rebuilding to refresh nothing
+        backend = self.service.backend
+        with metrics.span('prewarm'):
+            if backend.supports_async:
+                return await backend.aprewarm(max_idle, open_new)
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self.executor, backend.prewarm, max_idle, open_new)
+
+    def release(self, cache_floor: int):
+        """Run service.release() on the loop (async connections belong to it); returns a Future."""
+        return self.run(self._release(cache_floor))
+
+    async def _release(self, cache_floor: int):
+        self.service.release(cache_floor)
+
+    def start_keep_alive(self, interval: float, budget_per_hour: int):
+        """Refresh the idle backend connection every interval seconds, within a budget."""
+        if interval <= 0 or budget_per_hour <= 0 or self.keep_alive is not None:
+            return
+        self.keep_alive = self.run(self._keep_alive(interval, budget_per_hour))
+
+    async def _keep_alive(self, interval: float, budget_per_hour: int):
+        tokens = float(budget_per_hour)
+        last_refill = time.monotonic()
+        while True:
+            await asyncio.sleep(interval)
+            now = time.monotonic()
+            tokens = min(budget_per_hour, tokens + (now - last_refill) * budget_per_hour / 3600)
+            last_refill = now
+            if tokens < 1:
+                self.stats['keep_alive_budget_skips'] += 1
+                continue
+            # Only refresh connections that exist; never open new ones while idle
+            if await self._prewarm(interval, open_new=False) == 'refreshed':
+                tokens -= 1
+                self.stats['keep_alive_refreshes'] += 1
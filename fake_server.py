@@ -0,0 +1,204 @@
+"""
+Local stand-in translation server speaking the HttpBackend protocol.
+Used to measure latency and throughput offline, without Google.
+
+Usage:
+    python fake_server.py --port 8765 --latency-ms 80
+    python fake_server.py --latency-ms 80 --jitter-ms 40 --distribution lognormal --error-rate 0.02
+"""
+
+import argparse
+import json
+import math
+import random
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Letters that mark text as Turkish (good enough for a stand-in)
+TURKISH_CHARS = set('çğışöüÇĞİŞÖÜ')
+
+
+def fake_detect(text: str) -> str:
+    """Tiny deterministic detector: Turkish if it has Turkish letters."""
+    return 'tr' if any(c in TURKISH_CHARS for c in text) else 'en'
+
+
+def fake_translate(text: str, src: str, dest: str) -> dict:
+    """Deterministic fake translation."""
+    if src == 'auto':
+        src = fake_detect(text)
+    return {'text': f"[{src}→{dest}] {text}", 'src': src, 'dest': dest}
+
+
+class FakeTranslationHandler(BaseHTTPRequestHandler):
+    """Request handler for /detect, /translate, /translate_batch and /ping."""
+
+    protocol_version = 'HTTP/1.1'  # Keep-alive
+    disable_nagle_algorithm = True
+
+    def setup(self):
+        # Idle keep-alive connections are dropped after this many seconds
+        self.timeout = self.server.idle_timeout
+        super().setup()
+        if self.server.connect_ms:
+            # Stand-in for TLS/session setup on a new connection
+            time.sleep(self.server.connect_ms / 1000)
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        if self.path == '/ping':
+            with self.server.lock:
+                self.server.pings += 1
+            self.send_json(200, {'ok': True})
+        else:
+            self.send_json(404, {'error': 'Not found'})
+
+    def do_POST(self):
+        length = int(self.headers.get('Content-Length', 0))
+        try:
+            payload = json.loads(self.rfile.read(length).decode('utf-8'))
+        except ValueError:
+            self.send_json(400, {'error': 'Invalid JSON'})
+            return
+
+        texts = payload.get('texts') or [payload.get('text') or '']
+        if not self.server.simulate(sum(len(text) for text in texts)):
+            self.send_json(503, {'error': 'Simulated failure'})
+            return
+
+        if self.path == '/detect':
+            self.send_json(200, {'lang': fake_detect(payload['text']), 'confidence': 1.0})
+        elif self.path == '/translate':
+            self.send_json(200, fake_translate(
+                payload['text'], payload.get('src', 'auto'), payload['dest']))
+        elif self.path == '/translate_batch':
+            results = [fake_translate(text, payload.get('src', 'auto'), payload['dest'])
+                       for text in payload['texts']]
+            self.send_json(200, {'results': results})
+        else:
+            self.send_json(404, {'error': 'Not found'})
+
+    def send_json(self, status: int, data: dict):
+        body = json.dumps(data, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+# Simulated latency distributions
+DISTRIBUTIONS = ('fixed', 'uniform', 'lognormal')
+
+
+class FakeTranslationServer(ThreadingHTTPServer):
+    """
+    Threaded fake server with simulated latency and errors.
+    - fixed: always latency_ms
+    - uniform: latency_ms ± jitter_ms
+    - lognormal: median latency_ms, spread from jitter_ms (long tail)
+    connect_ms delays the first response on every new connection,
+    idle_timeout closes keep-alive connections that stay idle that long and
+    ms_per_char adds latency in proportion to the text length.
+    """
+
+    daemon_threads = True
+    request_queue_size = 128  # Many clients connect at once
+
+    def __init__(self, host: str = '127.0.0.1', port: int = 0, latency_ms: float = 0.0,
+                 jitter_ms: float = 0.0, distribution: str = 'fixed',
+                 error_rate: float = 0.0, seed: int = None,
+                 connect_ms: float = 0.0, idle_timeout: float = None,
+                 ms_per_char: float = 0.0):
+        super().__init__((host, port), FakeTranslationHandler)
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.distribution = distribution if distribution in DISTRIBUTIONS else 'fixed'
+        self.error_rate = error_rate
+        self.connect_ms = connect_ms
+        self.idle_timeout = idle_timeout
+        self.ms_per_char = ms_per_char
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+        self.requests = 0
+        self.errors = 0
+        self.pings = 0
+        self.thread = None
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def handle_error(self, request, client_address):
+        # Clients hang up on cancelled requests; that is not an error here
+        if isinstance(sys.exc_info()[1], ConnectionError):
+            return
+        super().handle_error(request, client_address)
+
+    def sample_latency(self) -> float:
+        """Draw one latency in seconds."""
+        if self.distribution == 'uniform':
+            ms = self.random.uniform(self.latency_ms - self.jitter_ms,
+                                     self.latency_ms + self.jitter_ms)
+        elif self.distribution == 'lognormal' and self.latency_ms > 0:
+            sigma = math.log1p(self.jitter_ms / self.latency_ms)
+            ms = self.random.lognormvariate(math.log(self.latency_ms), sigma)
+        else:
+            ms = self.latency_ms
+        return max(0.0, ms) / 1000
+
+    def simulate(self, chars: int = 0) -> bool:
+        """Count the request and sleep; returns False if it should fail."""
+        with self.lock:
+            self.requests += 1
+            latency = self.sample_latency() + chars * self.ms_per_char / 1000
+            failed = self.random.random() < self.error_rate
+            if failed:
+                self.errors += 1
+        if latency:
+            time.sleep(latency)
+        return not failed
+
+    def start(self) -> str:
+        """Serve in a background thread and return the base URL."""
+        self.thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self.thread.start()
+        return self.url
+
+    def stop(self):
+        """Stop serving."""
+        self.shutdown()
+        self.server_close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--latency-ms', type=float, default=0.0)
+    parser.add_argument('--jitter-ms', type=float, default=0.0)
+    parser.add_argument('--distribution', choices=DISTRIBUTIONS, default='fixed')
+    parser.add_argument('--error-rate', type=float, default=0.0)
+    parser.add_argument('--seed', type=int, default=None)
+    parser.add_argument('--connect-ms', type=float, default=0.0)
+    parser.add_argument('--idle-timeout', type=float, default=None)
+    parser.add_argument('--ms-per-char', type=float, default=0.0)
+    args = parser.parse_args()
+
+    server = FakeTranslationServer(args.host, args.port, args.latency_ms, args.jitter_ms,
+                                   args.distribution, args.error_rate, args.seed,
+                                   args.connect_ms, args.idle_timeout, args.ms_per_char)
+    print(f"Fake translation server: {server.url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
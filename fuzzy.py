@@ -0,0 +1,220 @@
+"""Fuzzy translation memory: near-duplicate lookup of past inputs."""
+
+import random
+import re
+import threading
+from collections import Counter, OrderedDict, namedtuple
+
+from cache import normalize_text
+
+Match = namedtuple('Match', ['similarity', 'text', 'translated', 'source_lang', 'target_lang'])
+
+WORD_PATTERN = re.compile(r"\w+")
+# MinHash signature: BANDS bands of ROWS hashes; two texts share a band
+# with probability J^ROWS (J = Jaccard similarity of their trigram sets)
+BANDS = 8
+ROWS = 3
+# Entries kept per band bucket (newest first)
+BUCKET_SIZE = 4
+# Candidates scored by edit distance per lookup
+MAX_CANDIDATES = 16
+# Keys up to this long are also indexed by their single-character
+# deletions: one typo changes most of a short key's trigrams
+SHORT_CHARS = 20
+# XOR with a random mask reorders hash values like a permutation would and
+# is far cheaper in Python than (a*h + b) mod p
+_rng = random.Random(0x51A7)
+MASKS = [_rng.getrandbits(63) for _ in range(BANDS * ROWS)]
+
+
+def normalize_key(text: str) -> str:
+    """Lowercase words only: punctuation and spacing differences disappear."""
+    return ' '.join(WORD_PATTERN.findall(normalize_text(text).casefold()))
+
+
+def trigrams(key: str) -> set:
+    """Character trigrams of key, with a space added at each end."""
+    padded = f" {key} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def deletions(key: str) -> set:
+    """Every string one character deletion away from key."""
+    return {key[:i] + key[i + 1:] for i in range(len(key))}
+
+
+def signature(grams: set) -> list:
+    """One bucket key per band from the MinHash of a trigram set."""
+    hashes = set(map(hash, grams))
+    mins = [min(map(mask.__xor__, hashes)) for mask in MASKS]
+    return [hash((band,) + tuple(mins[band * ROWS:(band + 1) * ROWS])) for band in range(BANDS)]
+
+
+def bounded_distance(a: str, b: str, limit: int) -> int:
+    """Levenshtein distance of a and b, or limit + 1 if it is larger."""
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    # A typo usually leaves long equal ends; only the middle needs the table
+    start = 0
+    while start < len(a) and start < len(b) and a[start] == b[start]:
+        start += 1
+    end_a, end_b = len(a), len(b)
+    while end_a > start and end_b > start and a[end_a - 1] == b[end_b - 1]:
+        end_a -= 1
+        end_b -= 1
+    return _banded(a[start:end_a], b[start:end_b], limit)
+
+
+def _banded(a: str, b: str, limit: int) -> int:
+    if len(a) > len(b):
+        a, b = b, a
+    if not a:
+        return len(b) if len(b) <= limit else limit + 1
+    over = limit + 1
+    previous = [j if j <= limit else over for j in range(len(b) + 1)]
+    for i, char in enumerate(a, 1):
+        current = [over] * (len(b) + 1)
+        lo = max(1, i - limit)
+        hi = min(len(b), i + limit)
+        if i <= limit:
+            current[0] = i
+        best = current[0]
+        for j in range(lo, hi + 1):
+            cost = previous[j - 1] + (char != b[j - 1])
+            if previous[j] + 1 < cost:
+                cost = previous[j] + 1
+            if current[j - 1] + 1 < cost:
+                cost = current[j - 1] + 1
+            current[j] = cost if cost < over else over
+            if cost < best:
+                best = cost
+        if best > limit:
+            return over
+        previous = current
+    return previous[-1]
+
+
+class TranslationMemory:
+    """
+    Past inputs and their translations, searched for near duplicates.
+
+    Texts are compared after normalize_key(), so case, punctuation and
+    spacing never matter (similarity 1.0). Otherwise candidates come from
+    MinHash LSH over character trigrams: every band bucket remembers only
+    the BUCKET_SIZE newest entries that hashed to it, and a lookup scores
+    only the MAX_CANDIDATES that share the most bands with the query, so
+    its cost does not grow with the memory. Short keys are also found
+    through their single deletions (a replaced, added, dropped or swapped
+    character leaves a deletion in common). Each candidate is scored by
+    edit distance, bounded by min_similarity:
+        similarity = 1 - distance / max(len(a), len(b))
+    """
+
+    def __init__(self, max_entries: int = 20000, min_similarity: float = 0.8,
+                 max_chars: int = 120):
+        self.max_entries = max_entries
+        self.min_similarity = min_similarity
+        self.max_chars = max_chars
+        self.entries = OrderedDict()  # key -> (text, translated, source_lang, target_lang, buckets)
+        self.buckets = {}  # band bucket -> newest keys in it (at most BUCKET_SIZE)
+        self.deletions = {}  # deletion of a short key -> newest such key
+        self.lock = threading.Lock()
+        self.stats = {'lookups': 0, 'exact': 0, 'fuzzy': 0, 'candidates': 0}
+
+    def __len__(self):
+        return len(self.entries)
+
+    def add(self, text: str, result: dict):
+        """Remember a successful translation of text (not glosses, partial or fuzzy results)."""
+        if (not result.get('success') or result.get('offline') or 'progress' in result
+                or 'fuzzy' in result):
+            return
+        key = normalize_key(text)
+        if not key or len(key) > self.max_chars:
+            return
+        buckets = signature(trigrams(key))
+        with self.lock:
+            self._remove(key)
+            self.entries[key] = (normalize_text(text), result['translated'],
+                                 result['source_lang'], result['target_lang'], buckets)
+            for bucket in buckets:
+                self.buckets[bucket] = (key,) + self.buckets.get(bucket, ())[:BUCKET_SIZE - 1]
+            if len(key) <= SHORT_CHARS:
+                for deletion in deletions(key):
+                    self.deletions[deletion] = key
+            while len(self.entries) > self.max_entries:
+                self._remove(next(iter(self.entries)))
+
+    def _remove(self, key: str):
+        entry = self.entries.pop(key, None)
+        if entry is None:
+            return
+        for bucket in entry[4]:
+            keys = self.buckets.get(bucket, ())
+            if key in keys:
+                keys = tuple(other for other in keys if other != key)
+                if keys:
+                    self.buckets[bucket] = keys
+                else:
+                    del self.buckets[bucket]
+        if len(key) <= SHORT_CHARS:
+            for deletion in deletions(key):
+                if self.deletions.get(deletion) == key:
+                    del self.deletions[deletion]
+
+    def match(self, text: str, min_similarity: float = None):
+        """
+        Most similar remembered input at or above min_similarity, or None.
+
+        Returns:
+            Match(similarity, remembered text, translated, source_lang, target_lang)
+        """
+        key = normalize_key(text)
+        if not key or len(key) > self.max_chars:
+            return None
+        threshold = self.min_similarity if min_similarity is None else min_similarity
+        self.stats['lookups'] += 1
+        entry = self.entries.get(key)
+        if entry is not None:
+            self.stats['exact'] += 1
+            return Match(1.0, *entry[:4])
+
+        grams = trigrams(key)
+        buckets = signature(grams)
+        with self.lock:
+            shared = Counter(candidate for bucket in buckets for candidate in self.buckets.get(bucket, ()))
+            # Sharing more bands means more similar: check those first, and only a few
+            close = [candidate for candidate, _ in shared.most_common(MAX_CANDIDATES)]
+            if len(key) <= SHORT_CHARS + 1:
+                variants = deletions(key)
+                close = [candidate for candidate in (self.deletions.get(key),
+                                                     *map(self.deletions.get, variants),
+                                                     *filter(self.entries.__contains__, variants))
+                         if candidate is not None] + close
+            found = [(candidate, self.entries[candidate]) for candidate in dict.fromkeys(close)]
+        self.stats['candidates'] += len(found)
+        best = None  # (similarity, entry)
+        for candidate, entry in found:
+            longest = max(len(key), len(candidate))
+            # Only a closer candidate than the best so far can win
+            floor = threshold if best is None else max(threshold, best[0])
+            limit = int(longest * (1 - floor) + 1e-9)
+            # One edit removes at most three trigrams: cheap rejects first
+            if abs(len(key) - len(candidate)) > limit or len(grams ^ trigrams(candidate)) > 6 * limit:
+                continue
+            distance = bounded_distance(key, candidate, limit)
+            if distance > limit:
+                continue
+            similarity = 1 - distance / longest
+            if best is None or similarity > best[0]:
+                best = (similarity, entry)
+        if best is None:
+            return None
+        self.stats['fuzzy'] += 1
+        return Match(best[0], *best[1][:4])
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.buckets.clear()
+            self.deletions.clear()
@@ -0,0 +1,224 @@
+"""Persistent translation history with a full-text index (SQLite FTS5)."""
+
+import queue
+import re
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+from cache import normalize_text
+from config import get_data_path
+
+HISTORY_FILE = 'history.sqlite3'
+# Search terms: runs of letters/digits (quotes and operators never reach FTS5)
+TERM_PATTERN = re.compile(r"\w+")
+# Rows fetched per wanted result, to fill the list after dropping repeats
+OVERFETCH = 4
+
+INSERT = ('INSERT INTO entries (created, source, translated, source_lang, target_lang) '
+          'VALUES (?, ?, ?, ?, ?)')
+
+
+class TranslationHistory:
+    """
+    Append-only store of every translation shown in the window.
+
+    add() only queues the entry; one writer thread inserts queued entries
+    in batches, each in a single transaction. search_async() queues a
+    search for the same thread, which runs only the newest one queued. The entries table is indexed
+    by an external-content FTS5 table over source and translation (kept in
+    sync by a trigger), so search() only reads the index and the newest
+    matching rows. Without FTS5 in the SQLite build, search() falls back
+    to a LIKE scan from the newest entry.
+
+    FTS5 reads whole-word matches newest first and stops at the limit, but
+    collects every match of a prefix before sorting. So whole words are
+    searched first, and only the last word (the one being typed) is
+    searched as a prefix when that finds too few entries.
+    """
+
+    def __init__(self, path: Path = None):
+        self.path = path or get_data_path(HISTORY_FILE)
+        self.queue = queue.Queue()
+        self.lock = threading.Lock()
+        self.last = None
+        self.fts = True
+        self.writer = None
+        self.counts = {'queued': 0, 'written': 0, 'write_errors': 0, 'searches': 0,
+                       'search_errors': 0}
+        try:
+            self.db = self._open_db()
+        except sqlite3.Error:
+            self.db = None  # History off; translating still works
+            return
+        self.writer = threading.Thread(target=self._write_loop, name='history-writer', daemon=True)
+        self.writer.start()
+
+    def _connect(self):
+        db = sqlite3.connect(str(self.path), check_same_thread=False)
+        db.execute('PRAGMA journal_mode=WAL')
+        db.execute('PRAGMA synchronous=NORMAL')
+        return db
+
+    def _open_db(self):
+        """Open (and create if needed) the store; used for reads only."""
+        db = self._connect()
+        db.execute(
+            'CREATE TABLE IF NOT EXISTS entries ('
+            ' id INTEGER PRIMARY KEY,'
+            ' created REAL NOT NULL,'
+            ' source TEXT NOT NULL,'
+            ' translated TEXT NOT NULL,'
+            ' source_lang TEXT,'
+            ' target_lang TEXT)'
+        )
+        try:
+            db.execute(
+                "CREATE VIRTUAL TABLE IF NOT EXISTS entries_fts USING fts5("
+                " source, translated, created UNINDEXED, source_lang UNINDEXED,"
+                " target_lang UNINDEXED, content='entries', content_rowid='id',"
+                " tokenize='unicode61 remove_diacritics 2', prefix='2 3')"
+            )
+            db.execute(
+                'CREATE TRIGGER IF NOT EXISTS entries_ai AFTER INSERT ON entries BEGIN'
+                ' INSERT INTO entries_fts (rowid, source, translated, created, source_lang,'
+                ' target_lang) VALUES (new.id, new.source, new.translated, new.created,'
+                ' new.source_lang, new.target_lang);'
+                ' END'
+            )
+        except sqlite3.OperationalError:
+            self.fts = False  # SQLite built without FTS5
+        db.commit()
+        return db
+
+    def add(self, text: str, result: dict):
+        """Queue a successful translation (returns at once; no disk access)."""
+        if self.db is None or not result.get('success') or result.get('offline'):
+            return
+        text = normalize_text(text)
+        entry = (time.time(), text, result['translated'],
+                 result.get('source_lang'), result.get('target_lang'))
+        if not text or entry[1:3] == self.last:
+            return
+        self.last = entry[1:3]
+        self.counts['queued'] += 1
+        self.queue.put(entry)
+
+    def _write_loop(self):
+        db = self._connect()
+        while True:
+            batch = [self.queue.get()]
+            while True:
+                try:
+                    batch.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+            rows = [entry for entry in batch if isinstance(entry, tuple)]
+            searches = [entry for entry in batch if callable(entry)]
+            try:
+                if rows:
+                    try:
+                        with db:
+                            db.executemany(INSERT, rows)
+                        self.counts['written'] += len(rows)
+                    except Exception:
+                        self.counts['write_errors'] += 1
+                if searches:
+                    try:
+                        searches[-1]()  # Older ones are already outdated
+                    except Exception:
+                        # A failing search or callback must not stop the writer
+                        self.counts['search_errors'] += 1
+            finally:
+                for _ in batch:
+                    self.queue.task_done()
+            if None in batch:
+                break  # close() was called
+        db.close()
+
+    def flush(self):
+        """Wait until every queued entry is written."""
+        if self.writer is not None:
+            self.queue.join()
+
+    def search(self, text: str, limit: int = 8) -> list:
+        """
+        Newest entries whose source or translation contains every word of
+        text, ignoring case and diacritics. The last word may also match as
+        a prefix if whole words find fewer than limit entries. Repeats of the same
+        translation are listed once. Empty text lists the newest entries.
+
+        Returns:
+            list of dicts with text, translated, source_lang, target_lang, created
+        """
+        if self.db is None or limit <= 0:
+            return []
+        terms = TERM_PATTERN.findall(text)
+        wanted = limit * OVERFETCH
+        with self.lock:
+            self.counts['searches'] += 1
+            try:
+                if not terms:
+                    rows = self.db.execute(
+                        'SELECT source, translated, source_lang, target_lang, created '
+                        'FROM entries ORDER BY id DESC LIMIT ?', (wanted,)).fetchall()
+                elif self.fts:
+                    # '"good" "morn"', then '"good" "morn"*'
+                    query = ' '.join(f'"{term}"' for term in terms)
+                    rows = self._match(query, wanted)
+                    if len(rows) < wanted:
+                        rows = self._match(query + '*', wanted)
+                else:
+                    rows = self.db.execute(
+                        'SELECT source, translated, source_lang, target_lang, created FROM entries '
+                        'WHERE ' + ' AND '.join(["(source || ' ' || translated) LIKE ?"] * len(terms))
+                        + ' ORDER BY id DESC LIMIT ?',
+                        tuple(f"%{term}%" for term in terms) + (wanted,)).fetchall()
+            except sqlite3.Error:
+                return []
+
+        entries = []
+        seen = set()
+        for source, translated, source_lang, target_lang, created in rows:
+            key = (source.casefold(), translated)
+            if key in seen:
+                continue
+            seen.add(key)
+            entries.append({'text': source, 'translated': translated, 'source_lang': source_lang,
+                            'target_lang': target_lang, 'created': created})
+            if len(entries) == limit:
+                break
+        return entries
+
+    def search_async(self, text: str, limit: int, callback):
+        """Run search() on the writer thread and call callback(entries) there."""
+        if self.writer is None:
+            callback([])
+            return
+        self.queue.put(lambda: callback(self.search(text, limit)))
+
+    def _match(self, query: str, limit: int) -> list:
+        return self.db.execute(
+            'SELECT source, translated, source_lang, target_lang, created FROM entries_fts '
+            'WHERE entries_fts MATCH ? ORDER BY rowid DESC LIMIT ?', (query, limit)).fetchall()
+
+    def trim(self):
+        """Free the read connection's page cache (idle trimming)."""
+        with self.lock:
+            if self.db is not None:
+                self.db.execute('PRAGMA shrink_memory')
+
+    def stats(self) -> dict:
+        return dict(self.counts, pending=self.queue.qsize(), fts=self.fts)
+
+    def close(self):
+        """Write what is queued and close the store."""
+        if self.writer is not None:
+            self.queue.put(None)
+            self.writer.join(timeout=5)
+            self.writer = None
+        with self.lock:
+            if self.db is not None:
+                self.db.close()
+                self.db = None
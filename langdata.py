@@ -0,0 +1,327 @@
+"""
+Bundled text for the offline language detector.
+
+TRAINING_TEXT builds the character n-gram profiles of languages written in
+Latin script. EVAL_CORPUS is a separate set of samples used only by
+benchmarks/bench_detector.py.
+"""
+
+TRAINING_TEXT = {
+    'en': (
+        "The quick brown fox jumps over the lazy dog. I would like to know "
+        "what you think about this. Where is the nearest train station? "
+        "Thank you very much for your help, it was really kind of you. "
+        "We have been working on this project for three weeks and there is "
+        "still a lot to do. Could you please send me the report by the end "
+        "of the day? The weather is nice today, so they went out for a walk "
+        "with their children. She said that the meeting would be moved to "
+        "next Thursday afternoon. This is the best book that I have ever "
+        "read. How much does it cost? Which one should I choose? Everything "
+        "happens for a reason, and nothing is impossible if you try hard "
+        "enough. The government announced new measures to support small "
+        "businesses during the winter."
+    ),
+    'tr': (
+        "Bugün hava çok güzel, dışarı çıkıp biraz yürüyüş yapalım mı? "
+        "Bu konuda ne düşündüğünü öğrenmek istiyorum. En yakın tren istasyonu "
+        "nerede? Yardımın için çok teşekkür ederim, gerçekten çok naziksin. "
+        "Üç haftadır bu proje üzerinde çalışıyoruz ve hâlâ yapılacak çok iş "
+        "var. Raporu gün sonuna kadar bana gönderebilir misin? Toplantının "
+        "gelecek perşembe öğleden sonraya ertelendiğini söyledi. Bu şimdiye "
+        "kadar okuduğum en güzel kitap. Bunun fiyatı ne kadar? Hangisini "
+        "seçmeliyim? Her şeyin bir sebebi vardır ve yeterince çalışırsan "
+        "hiçbir şey imkânsız değildir. Hükümet kış boyunca küçük işletmeleri "
+        "desteklemek için yeni önlemler açıkladı. Çocuklar bahçede oynuyor, "
+        "annesi ise mutfakta yemek hazırlıyordu. Lütfen kapıyı kapatır mısınız?"
+    ),
+    'de': (
+        "Der schnelle braune Fuchs springt über den faulen Hund. Ich möchte "
+        "gerne wissen, was du darüber denkst. Wo ist der nächste Bahnhof? "
+        "Vielen Dank für deine Hilfe, das war wirklich sehr nett von dir. "
+        "Wir arbeiten seit drei Wochen an diesem Projekt und es gibt noch "
+        "viel zu tun. Könnten Sie mir bitte den Bericht bis zum Ende des "
+        "Tages schicken? Das Wetter ist heute schön, deshalb sind sie mit "
+        "ihren Kindern spazieren gegangen. Sie sagte, dass die Besprechung "
+        "auf nächsten Donnerstagnachmittag verschoben wird. Das ist das beste "
+        "Buch, das ich je gelesen habe. Wie viel kostet das? Welches soll ich "
+        "nehmen? Alles geschieht aus einem Grund, und nichts ist unmöglich, "
+        "wenn man sich genug anstrengt. Die Regierung kündigte neue "
+        "Maßnahmen zur Unterstützung kleiner Unternehmen im Winter an."
+    ),
+    'fr': (
+        "Le renard brun rapide saute par-dessus le chien paresseux. "
+        "J'aimerais savoir ce que tu en penses. Où se trouve la gare la plus "
+        "proche ? Merci beaucoup pour ton aide, c'était vraiment gentil de "
+        "ta part. Nous travaillons sur ce projet depuis trois semaines et il "
+        "reste encore beaucoup à faire. Pourriez-vous m'envoyer le rapport "
+        "avant la fin de la journée ? Il fait beau aujourd'hui, alors ils "
+        "sont sortis se promener avec leurs enfants. Elle a dit que la "
+        "réunion serait déplacée à jeudi prochain après-midi. C'est le "
+        "meilleur livre que j'aie jamais lu. Combien ça coûte ? Lequel "
+        "dois-je choisir ? Tout arrive pour une raison, et rien n'est "
+        "impossible si l'on fait assez d'efforts. Le gouvernement a annoncé "
+        "de nouvelles mesures pour soutenir les petites entreprises pendant "
+        "l'hiver."
+    ),
+    'es': (
+        "El rápido zorro marrón salta sobre el perro perezoso. Me gustaría "
+        "saber qué piensas sobre esto. ¿Dónde está la estación de tren más "
+        "cercana? Muchas gracias por tu ayuda, fue muy amable de tu parte. "
+        "Llevamos tres semanas trabajando en este proyecto y todavía queda "
+        "mucho por hacer. ¿Podrías enviarme el informe antes del final del "
+        "día? Hoy hace buen tiempo, así que salieron a pasear con sus hijos. "
+        "Ella dijo que la reunión se trasladaría al próximo jueves por la "
+        "tarde. Este es el mejor libro que he leído nunca. ¿Cuánto cuesta? "
+        "¿Cuál debería elegir? Todo pasa por una razón, y nada es imposible "
+        "si te esfuerzas lo suficiente. El gobierno anunció nuevas medidas "
+        "para apoyar a las pequeñas empresas durante el invierno."
+    ),
+    'it': (
+        "La veloce volpe marrone salta sopra il cane pigro. Vorrei sapere "
+        "cosa ne pensi. Dov'è la stazione ferroviaria più vicina? Grazie "
+        "mille per il tuo aiuto, sei stato davvero gentile. Lavoriamo a "
+        "questo progetto da tre settimane e c'è ancora molto da fare. "
+        "Potresti inviarmi il rapporto entro la fine della giornata? Oggi il "
+        "tempo è bello, quindi sono usciti a fare una passeggiata con i loro "
+        "figli. Ha detto che la riunione sarebbe stata spostata a giovedì "
+        "prossimo pomeriggio. Questo è il libro più bello che abbia mai "
+        "letto. Quanto costa? Quale dovrei scegliere? Tutto succede per un "
+        "motivo, e niente è impossibile se ci si impegna abbastanza. Il "
+        "governo ha annunciato nuove misure per sostenere le piccole imprese "
+        "durante l'inverno."
+    ),
+    'pt': (
+        "A rápida raposa marrom salta sobre o cão preguiçoso. Gostaria de "
+        "saber o que você acha disso. Onde fica a estação de trem mais "
+        "próxima? Muito obrigado pela sua ajuda, foi muito gentil da sua "
+        "parte. Estamos trabalhando neste projeto há três semanas e ainda há "
+        "muito a fazer. Você poderia me enviar o relatório até o final do "
+        "dia? O tempo está bom hoje, então eles saíram para passear com os "
+        "filhos. Ela disse que a reunião seria transferida para a próxima "
+        "quinta-feira à tarde. Este é o melhor livro que eu já li. Quanto "
+        "custa? Qual devo escolher? Tudo acontece por uma razão, e nada é "
+        "impossível se você se esforçar o suficiente. O governo anunciou "
+        "novas medidas para apoiar as pequenas empresas durante o inverno. "
+        "Não sei se ele vai conseguir chegar a tempo."
+    ),
+    'nl': (
+        "De snelle bruine vos springt over de luie hond. Ik zou graag willen "
+        "weten wat je hiervan vindt. Waar is het dichtstbijzijnde "
+        "treinstation? Heel erg bedankt voor je hulp, dat was echt aardig "
+        "van je. We werken al drie weken aan dit project en er is nog veel "
+        "te doen. Kunt u mij het rapport voor het einde van de dag sturen? "
+        "Het is mooi weer vandaag, dus zijn ze met hun kinderen gaan "
+        "wandelen. Ze zei dat de vergadering naar volgende donderdagmiddag "
+        "wordt verplaatst. Dit is het beste boek dat ik ooit heb gelezen. "
+        "Hoeveel kost het? Welke moet ik kiezen? Alles gebeurt met een "
+        "reden, en niets is onmogelijk als je je best doet. De regering "
+        "kondigde nieuwe maatregelen aan om kleine bedrijven in de winter "
+        "te ondersteunen. Het meisje heeft een nieuwe fiets gekregen."
+    ),
+    'pl': (
+        "Szybki brązowy lis przeskakuje nad leniwym psem. Chciałbym "
+        "wiedzieć, co o tym myślisz. Gdzie jest najbliższa stacja kolejowa? "
+        "Dziękuję bardzo za pomoc, to było naprawdę miłe z twojej strony. "
+        "Pracujemy nad tym projektem od trzech tygodni i wciąż jest dużo do "
+        "zrobienia. Czy mógłbyś przesłać mi raport do końca dnia? Dzisiaj "
+        "jest ładna pogoda, więc poszli na spacer ze swoimi dziećmi. "
+        "Powiedziała, że spotkanie zostanie przeniesione na przyszły "
+        "czwartek po południu. To najlepsza książka, jaką kiedykolwiek "
+        "przeczytałem. Ile to kosztuje? Którą powinienem wybrać? Wszystko "
+        "dzieje się z jakiegoś powodu i nic nie jest niemożliwe, jeśli "
+        "wystarczająco się postarasz. Rząd ogłosił nowe środki wsparcia dla "
+        "małych firm w okresie zimowym."
+    ),
+    'sv': (
+        "Den snabba bruna räven hoppar över den lata hunden. Jag skulle "
+        "vilja veta vad du tycker om det här. Var ligger närmaste "
+        "tågstation? Tack så mycket för din hjälp, det var verkligen snällt "
+        "av dig. Vi har arbetat med det här projektet i tre veckor och det "
+        "finns fortfarande mycket kvar att göra. Kan du skicka rapporten "
+        "till mig innan dagens slut? Vädret är fint idag, så de gick ut på "
+        "en promenad med sina barn. Hon sa att mötet skulle flyttas till "
+        "nästa torsdag eftermiddag. Det här är den bästa bok jag någonsin "
+        "har läst. Hur mycket kostar det? Vilken ska jag välja? Allt händer "
+        "av en anledning, och ingenting är omöjligt om man anstränger sig "
+        "tillräckligt. Regeringen meddelade nya åtgärder för att stödja "
+        "små företag under vintern."
+    ),
+    'da': (
+        "Den hurtige brune ræv springer over den dovne hund. Jeg vil gerne "
+        "vide, hvad du synes om det. Hvor er den nærmeste togstation? "
+        "Mange tak for din hjælp, det var virkelig sødt af dig. Vi har "
+        "arbejdet på dette projekt i tre uger, og der er stadig meget at "
+        "gøre. Kan du sende mig rapporten inden dagens udgang? Vejret er "
+        "dejligt i dag, så de gik en tur med deres børn. Hun sagde, at mødet "
+        "ville blive flyttet til næste torsdag eftermiddag. Det er den bedste "
+        "bog, jeg nogensinde har læst. Hvor meget koster det? Hvilken skal "
+        "jeg vælge? Alt sker af en grund, og intet er umuligt, hvis man "
+        "anstrenger sig nok. Regeringen annoncerede nye tiltag for at støtte "
+        "små virksomheder i løbet af vinteren."
+    ),
+    'no': (
+        "Den raske brune reven hopper over den late hunden. Jeg vil gjerne "
+        "vite hva du synes om dette. Hvor er nærmeste togstasjon? Tusen takk "
+        "for hjelpen, det var veldig snilt av deg. Vi har jobbet med dette "
+        "prosjektet i tre uker, og det er fortsatt mye som gjenstår. Kan du "
+        "sende meg rapporten før dagen er omme? Været er fint i dag, så de "
+        "gikk en tur med barna sine. Hun sa at møtet ville bli flyttet til "
+        "neste torsdag ettermiddag. Dette er den beste boken jeg noen gang "
+        "har lest. Hvor mye koster det? Hvilken skal jeg velge? Alt skjer av "
+        "en grunn, og ingenting er umulig hvis man anstrenger seg nok. "
+        "Regjeringen kunngjorde nye tiltak for å støtte små bedrifter "
+        "gjennom vinteren. Jeg skal ikke gå hjem ennå."
+    ),
+    'fi': (
+        "Nopea ruskea kettu hyppää laiskan koiran yli. Haluaisin tietää, "
+        "mitä mieltä olet tästä. Missä on lähin rautatieasema? Kiitos "
+        "paljon avustasi, se oli todella ystävällistä. Olemme työskennelleet "
+        "tämän projektin parissa kolme viikkoa, ja tekemistä on vielä "
+        "paljon. Voisitko lähettää minulle raportin päivän loppuun "
+        "mennessä? Tänään on kaunis sää, joten he lähtivät kävelylle "
+        "lastensa kanssa. Hän sanoi, että kokous siirretään ensi torstaille "
+        "iltapäivällä. Tämä on paras kirja, jonka olen koskaan lukenut. "
+        "Paljonko se maksaa? Kumpi minun pitäisi valita? Kaikella on "
+        "tarkoituksensa, eikä mikään ole mahdotonta, jos yrittää tarpeeksi. "
+        "Hallitus ilmoitti uusista toimista pienten yritysten tukemiseksi "
+        "talven aikana."
+    ),
+    'cs': (
+        "Rychlá hnědá liška skáče přes líného psa. Rád bych věděl, co si o "
+        "tom myslíš. Kde je nejbližší vlakové nádraží? Moc děkuji za tvou "
+        "pomoc, bylo to od tebe opravdu milé. Na tomto projektu pracujeme "
+        "už tři týdny a stále je co dělat. Mohl bys mi poslat zprávu do "
+        "konce dne? Dnes je hezké počasí, a tak se šli projít se svými "
+        "dětmi. Řekla, že schůzka bude přesunuta na příští čtvrtek "
+        "odpoledne. Tohle je nejlepší kniha, jakou jsem kdy četl. Kolik to "
+        "stojí? Kterou si mám vybrat? Všechno se děje z nějakého důvodu a "
+        "nic není nemožné, když se dostatečně snažíš. Vláda oznámila nová "
+        "opatření na podporu malých podniků během zimy."
+    ),
+    'hu': (
+        "A gyors barna róka átugrik a lusta kutya felett. Szeretném tudni, "
+        "mit gondolsz erről. Hol van a legközelebbi vasútállomás? Nagyon "
+        "köszönöm a segítségedet, igazán kedves volt tőled. Három hete "
+        "dolgozunk ezen a projekten, és még sok a tennivaló. Elküldenéd "
+        "nekem a jelentést a nap végéig? Ma szép idő van, ezért elmentek "
+        "sétálni a gyerekeikkel. Azt mondta, hogy a megbeszélést jövő "
+        "csütörtök délutánra teszik át. Ez a legjobb könyv, amit valaha "
+        "olvastam. Mennyibe kerül? Melyiket válasszam? Mindennek oka van, "
+        "és semmi sem lehetetlen, ha eléggé igyekszel. A kormány új "
+        "intézkedéseket jelentett be a kisvállalkozások téli támogatására."
+    ),
+    'ro': (
+        "Vulpea maro și rapidă sare peste câinele leneș. Aș vrea să știu ce "
+        "crezi despre asta. Unde este cea mai apropiată gară? Mulțumesc "
+        "foarte mult pentru ajutor, a fost foarte drăguț din partea ta. "
+        "Lucrăm la acest proiect de trei săptămâni și mai sunt multe de "
+        "făcut. Ai putea să-mi trimiți raportul până la sfârșitul zilei? "
+        "Astăzi este vreme frumoasă, așa că au ieșit la plimbare cu copiii "
+        "lor. Ea a spus că ședința va fi mutată joia viitoare după-amiază. "
+        "Aceasta este cea mai bună carte pe care am citit-o vreodată. Cât "
+        "costă? Pe care ar trebui să o aleg? Totul se întâmplă cu un motiv "
+        "și nimic nu este imposibil dacă te străduiești destul. Guvernul a "
+        "anunțat noi măsuri pentru a sprijini firmele mici pe timpul iernii."
+    ),
+    'ms': (
+        "Musang coklat yang pantas melompat ke atas anjing yang malas. Saya "
+        "ingin tahu apa pendapat anda tentang perkara ini. Di manakah stesen "
+        "kereta api yang terdekat? Terima kasih banyak atas bantuan anda, "
+        "anda sangat baik hati. Kami telah mengusahakan projek ini selama "
+        "tiga minggu dan masih banyak lagi yang perlu dilakukan. Bolehkah "
+        "anda menghantar laporan itu kepada saya sebelum hujung hari? Cuaca "
+        "hari ini baik, jadi mereka keluar berjalan-jalan bersama anak-anak "
+        "mereka. Dia berkata bahawa mesyuarat itu akan dipindahkan ke "
+        "petang Khamis depan. Ini ialah buku terbaik yang pernah saya baca. "
+        "Berapakah harganya? Yang mana satu patut saya pilih? Semuanya "
+        "berlaku bersebab, dan tiada yang mustahil jika kita berusaha "
+        "bersungguh-sungguh. Kerajaan mengumumkan langkah baharu untuk "
+        "membantu perniagaan kecil sepanjang musim sejuk."
+    ),
+}
+
+# (language code, sample) pairs that do not appear in TRAINING_TEXT
+EVAL_CORPUS = [
+    ('en', "I forgot my umbrella at home this morning."),
+    ('en', "Please let me know when you are available for a call."),
+    ('en', "The children are playing in the garden."),
+    ('en', "Good morning, how are you?"),
+    ('tr', "Bu akşam sinemaya gitmek ister misin?"),
+    ('tr', "Şemsiyemi bu sabah evde unuttum."),
+    ('tr', "Müsait olduğunda bana haber ver lütfen."),
+    ('tr', "Günaydın, nasılsın?"),
+    ('de', "Ich habe heute Morgen meinen Regenschirm zu Hause vergessen."),
+    ('de', "Bitte sag mir Bescheid, wenn du Zeit für ein Gespräch hast."),
+    ('de', "Die Kinder spielen im Garten."),
+    ('de', "Guten Morgen, wie geht es dir?"),
+    ('fr', "J'ai oublié mon parapluie à la maison ce matin."),
+    ('fr', "Dis-moi quand tu seras disponible pour un appel."),
+    ('fr', "Les enfants jouent dans le jardin."),
+    ('fr', "Bonjour, comment allez-vous ?"),
+    ('es', "Esta mañana olvidé mi paraguas en casa."),
+    ('es', "Avísame cuando estés disponible para una llamada."),
+    ('es', "Los niños están jugando en el jardín."),
+    ('es', "Buenos días, ¿cómo estás?"),
+    ('it', "Stamattina ho dimenticato l'ombrello a casa."),
+    ('it', "Fammi sapere quando sei disponibile per una chiamata."),
+    ('it', "I bambini stanno giocando in giardino."),
+    ('it', "Buongiorno, come stai?"),
+    ('pt', "Esqueci o meu guarda-chuva em casa esta manhã."),
+    ('pt', "Avise-me quando estiver disponível para uma chamada."),
+    ('pt', "As crianças estão brincando no jardim."),
+    ('pt', "Bom dia, como você está?"),
+    ('nl', "Ik ben vanochtend mijn paraplu thuis vergeten."),
+    ('nl', "Laat me weten wanneer je tijd hebt voor een gesprek."),
+    ('nl', "De kinderen spelen in de tuin."),
+    ('nl', "Goedemorgen, hoe gaat het met je?"),
+    ('pl', "Zapomniałem dziś rano parasola z domu."),
+    ('pl', "Daj mi znać, kiedy będziesz dostępny na rozmowę."),
+    ('pl', "Dzieci bawią się w ogrodzie."),
+    ('pl', "Dzień dobry, jak się masz?"),
+    ('sv', "Jag glömde mitt paraply hemma i morse."),
+    ('sv', "Säg till när du har tid för ett samtal."),
+    ('sv', "Barnen leker i trädgården."),
+    ('sv', "God morgon, hur mår du?"),
+    ('da', "Jeg glemte min paraply derhjemme i morges."),
+    ('da', "Sig til, når du har tid til en samtale."),
+    ('da', "Børnene leger i haven."),
+    ('da', "Godmorgen, hvordan har du det?"),
+    ('no', "Jeg glemte paraplyen min hjemme i morges."),
+    ('no', "Si ifra når du har tid til en samtale."),
+    ('no', "Barna leker i hagen."),
+    ('no', "God morgen, hvordan har du det i dag?"),
+    ('fi', "Unohdin sateenvarjoni kotiin tänä aamuna."),
+    ('fi', "Kerro minulle, kun sinulla on aikaa puhelulle."),
+    ('fi', "Lapset leikkivät puutarhassa."),
+    ('fi', "Hyvää huomenta, mitä kuuluu?"),
+    ('cs', "Dnes ráno jsem zapomněl deštník doma."),
+    ('cs', "Dej mi vědět, až budeš mít čas na hovor."),
+    ('cs', "Děti si hrají na zahradě."),
+    ('cs', "Dobré ráno, jak se máš?"),
+    ('hu', "Ma reggel otthon felejtettem az esernyőmet."),
+    ('hu', "Szólj, ha ráérsz egy hívásra."),
+    ('hu', "A gyerekek a kertben játszanak."),
+    ('hu', "Jó reggelt, hogy vagy?"),
+    ('ro', "Mi-am uitat umbrela acasă în dimineața asta."),
+    ('ro', "Anunță-mă când ești disponibil pentru un apel."),
+    ('ro', "Copiii se joacă în grădină."),
+    ('ro', "Bună dimineața, ce mai faci?"),
+    ('ms', "Saya terlupa payung saya di rumah pagi tadi."),
+    ('ms', "Beritahu saya apabila anda ada masa untuk panggilan."),
+    ('ms', "Kanak-kanak sedang bermain di taman."),
+    ('ms', "Selamat pagi, apa khabar?"),
+    ('ru', "Сегодня утром я забыл зонтик дома."),
+    ('ru', "Дети играют в саду."),
+    ('uk', "Сьогодні вранці я забув парасольку вдома."),
+    ('uk', "Діти граються в саду."),
+    ('bg', "Децата играят в градината."),
+    ('fa', "امروز صبح چترم را در خانه جا گذاشتم."),
+    ('ja', "東京"),
+    ('ja', "日本語"),
+    ('el', "Ξέχασα την ομπρέλα μου στο σπίτι σήμερα το πρωί."),
+    ('ar', "نسيت مظلتي في المنزل هذا الصباح."),
+    ('ja', "今朝、傘を家に忘れました。"),
+    ('ko', "오늘 아침에 우산을 집에 두고 왔어요."),
+    ('zh-cn', "我今天早上把伞忘在家里了。这个问题很难说。"),
+    ('zh-tw', "我今天早上把傘忘在家裡了。這個問題很難說。"),
+]
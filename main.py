@@ -1,28 +1,46 @@
 """Quick Translator - Main entry point."""
 
+import argparse
 import sys
 import threading
-import keyboard
-from PIL import Image, ImageDraw
-import pystray
 
-from window import TranslatorWindow
-from config import COLORS, load_settings, get_config_path
-from setup_wizard import SetupWizard
+from config import COLORS, PREWARM_ON_HOTKEY, SERVER_PORT, SETTINGS, get_config_path, get_data_path
+from metrics import metrics
+
+# Pre-rendered tray icon, created on first run
+TRAY_ICON_FILE = 'tray_icon.png'
 
 
 class QuickTranslator:
     """Main application class with system tray support."""
     
     def __init__(self, settings: dict):
+        from window import TranslatorWindow
         self.settings = settings
         self.hotkey = settings.get('hotkey', 'ctrl+space')
         self.window = TranslatorWindow()
         self.tray = None
-        self.should_toggle = False
+        
+    def load_icon_image(self):
+        """Load the cached tray icon, rendering it once if missing."""
+        from PIL import Image
+        path = get_data_path(TRAY_ICON_FILE)
+        try:
+            image = Image.open(path)
+            image.load()
+            return image
+        except OSError:
+            pass
+        image = self.create_icon_image()
+        try:
+            image.save(path)
+        except OSError:
+            pass
+        return image
         
     def create_icon_image(self):
         """Create a simple translator icon."""
+        from PIL import Image, ImageDraw
         size = 64
         image = Image.new('RGBA', (size, size), (0, 0, 0, 0))
         draw = ImageDraw.Draw(image)
@@ -40,17 +58,26 @@ class QuickTranslator:
         """Handle tray menu click."""
         item_str = str(item)
         if "Göster" in item_str:
-            self.should_toggle = True
+            self.window.dispatcher.post(self.window.toggle_window)
+        elif "İstatistikler" in item_str:
+            self.window.dispatcher.post(self.window.show_stats)
         elif "Çıkış" in item_str:
             self.quit()
             
     def setup_tray(self):
-        """Setup system tray icon."""
-        icon_image = self.create_icon_image()
+        """Setup system tray icon on a background thread."""
+        tray_thread = threading.Thread(target=self.run_tray, daemon=True)
+        tray_thread.start()
+        
+    def run_tray(self):
+        """Build and run the tray icon (blocks until it is stopped)."""
+        import pystray
+        icon_image = self.load_icon_image()
         hotkey_display = self.hotkey.upper().replace('+', ' + ')
         
         menu = pystray.Menu(
             pystray.MenuItem(f"Göster ({hotkey_display})", self.on_tray_click),
+            pystray.MenuItem("İstatistikler", self.on_tray_click),
             pystray.MenuItem("Çıkış", self.on_tray_click)
         )
         
@@ -60,30 +87,30 @@ class QuickTranslator:
             f"Quick Translator - {hotkey_display}",
             menu
         )
-        
-        tray_thread = threading.Thread(target=self.tray.run, daemon=True)
-        tray_thread.start()
+        self.tray.run()
         
     def register_hotkey(self):
         """Register global hotkey."""
+        import keyboard
         keyboard.add_hotkey(self.hotkey, self.on_hotkey)
         
     def on_hotkey(self):
         """Handle hotkey press."""
-        self.should_toggle = True
-        
-    def check_toggle(self):
-        """Check if we should toggle the window."""
-        if self.should_toggle:
-            self.should_toggle = False
-            self.window.toggle_window()
-        self.window.root.after(100, self.check_toggle)
+        metrics.mark('hotkey')
+        # Wakes the Tk loop right away; nothing polls for hotkeys
+        self.window.dispatcher.post(self.window.toggle_window)
+        if PREWARM_ON_HOTKEY:
+            # Connect while the window fades in, not after the first keystroke
+            self.window.prewarm()
         
     def quit(self):
         """Quit the application."""
+        import keyboard
         keyboard.unhook_all_hotkeys()
         if self.tray:
             self.tray.stop()
+        if self.window.saved_history is not None:
+            self.window.saved_history.close()  # Writes queued entries
         if self.window.root:
             self.window.root.quit()
         sys.exit(0)
@@ -99,20 +126,57 @@ class QuickTranslator:
         print("  Çıkmak için: System tray'den 'Çıkış' seçin")
         print("=" * 50)
         
+        # Hotkey first; everything slow happens after it is live
+        self.register_hotkey()
         root = self.window.create_window()
+        threading.Thread(target=self.window.warm_up, name='warm-up', daemon=True).start()
         self.setup_tray()
-        self.register_hotkey()
-        root.after(100, self.check_toggle)
+        metrics.start_exporter()
+        metrics.record_since('startup', 'startup_to_ready')
         root.mainloop()
 
 
 def main():
     """Entry point."""
+    metrics.mark('startup')
+    parser = argparse.ArgumentParser(description="Quick Translator")
+    # Kept in sync with bulk.FORMATS and bulk.CHUNK_LINES; bulk is only imported to run
+    group = parser.add_argument_group('headless file translation')
+    group.add_argument('--translate-file', metavar='INPUT',
+                       help="Translate a text file without opening the GUI")
+    group.add_argument('-o', '--output', help="Output file (default: NAME.translated.EXT)")
+    group.add_argument('--format', choices=('lines', 'srt', 'csv'), default='lines')
+    group.add_argument('--column', type=int, default=0, help="CSV column to translate (0-based)")
+    group.add_argument('--delimiter', default=',', help="CSV delimiter")
+    group.add_argument('--concurrency', type=int, default=4, help="Chunks translated in parallel")
+    group.add_argument('--skip-lines', type=int, default=0,
+                       help="Copy the first N lines unchanged (e.g. 1 for a CSV header)")
+    group.add_argument('--chunk-lines', type=int, default=100)
+    group.add_argument('--no-resume', action='store_true', help="Ignore an existing checkpoint")
+    group = parser.add_argument_group('local translation API')
+    group.add_argument('--serve', action='store_true',
+                       help="Serve translations over HTTP instead of opening the GUI")
+    group.add_argument('--host', default='127.0.0.1')
+    group.add_argument('--port', type=int, default=SERVER_PORT)
+    group.add_argument('--no-coalesce', action='store_true',
+                       help="Send identical concurrent requests separately")
+    args = parser.parse_args()
+    # Settings were read once, when config was imported
+    if args.translate_file:
+        # Headless mode: no GUI, no setup wizard
+        import bulk
+        sys.exit(bulk.run(args, SETTINGS.get('primary_language', 'tr')))
+    if args.serve:
+        # Imported here: http.server is too slow to load for the GUI path
+        import server
+        sys.exit(server.run(args, SETTINGS.get('primary_language', 'tr')))
+    
     # Check if first run (no config exists)
     config_path = get_config_path()
     
     if not config_path.exists():
         # Run setup wizard
+        from setup_wizard import SetupWizard
         wizard = SetupWizard()
         settings = wizard.run()
         
@@ -121,7 +185,7 @@ def main():
             print("Kurulum iptal edildi.")
             sys.exit(0)
     else:
-        settings = load_settings()
+        settings = SETTINGS
     
     # Start main application
     app = QuickTranslator(settings)
@@ -0,0 +1,131 @@
+"""Resident memory measurement and idle trimming for the tray process."""
+
+import ctypes
+import gc
+import os
+import threading
+import time
+
+# Windows API (None elsewhere)
+windll = getattr(ctypes, 'windll', None)
+
+
+class PROCESS_MEMORY_COUNTERS(ctypes.Structure):
+    _fields_ = [
+        ('cb', ctypes.c_ulong),
+        ('PageFaultCount', ctypes.c_ulong),
+        ('PeakWorkingSetSize', ctypes.c_size_t),
+        ('WorkingSetSize', ctypes.c_size_t),
+        ('QuotaPeakPagedPoolUsage', ctypes.c_size_t),
+        ('QuotaPagedPoolUsage', ctypes.c_size_t),
+        ('QuotaPeakNonPagedPoolUsage', ctypes.c_size_t),
+        ('QuotaNonPagedPoolUsage', ctypes.c_size_t),
+        ('PagefileUsage', ctypes.c_size_t),
+        ('PeakPagefileUsage', ctypes.c_size_t),
+    ]
+
+
+def rss_bytes():
+    """Resident set size (working set on Windows) of this process, or None."""
+    if windll is not None:
+        counters = PROCESS_MEMORY_COUNTERS()
+        counters.cb = ctypes.sizeof(counters)
+        if windll.psapi.GetProcessMemoryInfo(windll.kernel32.GetCurrentProcess(),
+                                             ctypes.byref(counters), counters.cb):
+            return counters.WorkingSetSize
+        return None
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def release_process_memory():
+    """Collect garbage and hand freed pages back to the OS."""
+    gc.collect()
+    if windll is not None:
+        # Pages come back on demand (mostly soft faults) when the window opens
+        windll.psapi.EmptyWorkingSet(windll.kernel32.GetCurrentProcess())
+        return
+    try:
+        libc = ctypes.CDLL(None)
+        malloc_trim = libc.malloc_trim
+    except (OSError, AttributeError):
+        return  # Not glibc
+    malloc_trim(0)
+
+
+class IdleTrimmer:
+    """
+    Frees memory once the window has been hidden for idle_seconds.
+    schedule() is called on hide and cancel() on show; when the timer
+    fires, trim() runs every release function (in order, on the timer
+    thread), then collects garbage and returns freed pages to the OS.
+    Whatever the release functions drop must be rebuilt on next use.
+    A trim that is already running stops before its next release once
+    cancel() is called; cancel() does not wait for it, since whatever was
+    released is rebuilt lazily.
+    """
+
+    def __init__(self, idle_seconds: float):
+        self.idle_seconds = idle_seconds
+        self.releases = []
+        self.timer = None
+        self.lock = threading.Lock()
+        # Bumped by schedule() and cancel(); a timer trim only runs for its own
+        self.generation = 0
+        self.stats = {'trims': 0, 'trim_errors': 0, 'trims_aborted': 0, 'rss_before_mb': 0.0,
+                      'rss_after_mb': 0.0, 'trim_ms': 0.0}
+
+    def add(self, release):
+        """Register a function called on every trim."""
+        self.releases.append(release)
+
+    def schedule(self):
+        """Start (or restart) the idle countdown."""
+        if self.idle_seconds <= 0:
+            return
+        with self.lock:
+            self.generation += 1
+            if self.timer is not None:
+                self.timer.cancel()
+            self.timer = threading.Timer(self.idle_seconds, self.trim, args=(self.generation,))
+            self.timer.daemon = True
+            self.timer.start()
+
+    def cancel(self):
+        """Stop the countdown (the window is shown again) and any trim in progress."""
+        with self.lock:
+            self.generation += 1
+            if self.timer is not None:
+                self.timer.cancel()
+                self.timer = None
+
+    def trim(self, generation: int = None) -> dict:
+        """
+        Release everything now; returns the stats with RSS before and after.
+        With a generation (timer trims), stops as soon as it is no longer current.
+        """
+        with self.lock:
+            if generation is not None and generation != self.generation:
+                return dict(self.stats)
+            self.timer = None
+        started = time.perf_counter()
+        before = rss_bytes()
+        for release in self.releases:
+            if generation is not None and generation != self.generation:
+                self.stats['trims_aborted'] += 1
+                return dict(self.stats)
+            try:
+                release()
+            except Exception:
+                self.stats['trim_errors'] += 1
+        release_process_memory()
+        after = rss_bytes()
+        self.stats['trims'] += 1
+        self.stats['trim_ms'] = (time.perf_counter() - started) * 1000
+        if before is not None and after is not None:
+            self.stats['rss_before_mb'] = before / 2**20
+            self.stats['rss_after_mb'] = after / 2**20
+        return dict(self.stats)
@@ -0,0 +1,237 @@
+"""Per-stage latency instrumentation with HDR-style histograms."""
+
+import json
+import threading
+import time
+
+from config import get_data_path, METRICS_ENABLED, METRICS_EXPORT_INTERVAL
+
+# Linear sub-buckets per power of two (max relative error ~1/16)
+SUB_BUCKETS = 16
+
+
+class Histogram:
+    """Log-linear histogram of durations, recorded in microseconds."""
+
+    def __init__(self):
+        self.counts = {}
+        self.count = 0
+        self.total = 0.0
+        self.min = None
+        self.max = None
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def _bucket(micros: int) -> int:
+        if micros < SUB_BUCKETS:
+            return micros
+        shift = micros.bit_length() - 5  # Keep the top 5 bits
+        return (shift << 4) + (micros >> shift)
+
+    @staticmethod
+    def _bucket_value(bucket: int) -> int:
+        """Upper bound (µs) of a bucket."""
+        if bucket < SUB_BUCKETS * 2:
+            return bucket
+        shift = (bucket >> 4) - 1
+        mantissa = (bucket & 0xF) | 0x10
+        return ((mantissa + 1) << shift) - 1
+
+    def record(self, seconds: float):
+        micros = max(0, int(seconds * 1e6))
+        bucket = self._bucket(micros)
+        with self.lock:
+            self.counts[bucket] = self.counts.get(bucket, 0) + 1
+            self.count += 1
+            self.total += seconds
+            if self.min is None or seconds < self.min:
+                self.min = seconds
+            if self.max is None or seconds > self.max:
+                self.max = seconds
+
+    def percentile(self, p: float) -> float:
+        """Approximate percentile in seconds."""
+        with self.lock:
+            if not self.count:
+                return 0.0
+            rank = max(1, int(self.count * p / 100 + 0.5))
+            seen = 0
+            for bucket in sorted(self.counts):
+                seen += self.counts[bucket]
+                if seen >= rank:
+                    return min(self._bucket_value(bucket) / 1e6, self.max)
+            return self.max
+
+    def snapshot(self) -> dict:
+        return {
+            'count': self.count,
+            'sum': self.total,
+            'min': self.min or 0.0,
+            'max': self.max or 0.0,
+            'p50': self.percentile(50),
+            'p95': self.percentile(95),
+            'p99': self.percentile(99),
+        }
+
+
+class _Span:
+    """Context manager that records its duration."""
+
+    __slots__ = ('metrics', 'name', 'start')
+
+    def __init__(self, metrics, name):
+        self.metrics = metrics
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.metrics.record(self.name, time.perf_counter() - self.start)
+        return False
+
+
+class _NullSpan:
+    """Shared no-op span used while metrics are disabled."""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+NULL_SPAN = _NullSpan()
+
+
+class Metrics:
+    """
+    Registry of latency histograms and counter groups.
+    - span(name): times a block
+    - mark(name) / record_since(mark, name): times across callbacks and threads
+    - add_stats(group, fn): exports a dict of counters returned by fn()
+    Everything is a cheap no-op while disabled.
+    """
+
+    def __init__(self, enabled: bool = False):
+        self.enabled = enabled
+        self.histograms = {}
+        self.marks = {}
+        self.stats_sources = {}
+        self.lock = threading.Lock()
+        self.exporter = None
+
+    def span(self, name: str):
+        if not self.enabled:
+            return NULL_SPAN
+        return _Span(self, name)
+
+    def record(self, name: str, seconds: float):
+        if not self.enabled:
+            return
+        histogram = self.histograms.get(name)
+        if histogram is None:
+            with self.lock:
+                histogram = self.histograms.setdefault(name, Histogram())
+        histogram.record(seconds)
+
+    def mark(self, name: str):
+        if self.enabled:
+            self.marks[name] = time.perf_counter()
+
+    def record_since(self, mark: str, name: str, clear: bool = False):
+        """Record the time since mark() was called, if it was."""
+        if not self.enabled:
+            return
+        started = self.marks.pop(mark, None) if clear else self.marks.get(mark)
+        if started is not None:
+            self.record(name, time.perf_counter() - started)
+
+    def add_stats(self, group: str, source):
+        """Register a callable returning a dict of counters."""
+        self.stats_sources[group] = source
+
+    def snapshot(self) -> dict:
+        stats = {}
+        for group, source in list(self.stats_sources.items()):
+            try:
+                stats[group] = source()
+            except Exception:
+                continue
+        return {
+            'timestamp': time.time(),
+            'latency': {name: h.snapshot() for name, h in sorted(self.histograms.items())},
+            'stats': stats,
+        }
+
+    def summary(self) -> str:
+        """Human readable summary for the tray window."""
+        snapshot = self.snapshot()
+        lines = []
+        for name, h in snapshot['latency'].items():
+            lines.append(f"{name:<24} n={h['count']:<6} p50 {h['p50'] * 1000:7.1f} ms  "
+                         f"p95 {h['p95'] * 1000:7.1f} ms  p99 {h['p99'] * 1000:7.1f} ms")
+        for group, values in snapshot['stats'].items():
+            shown = ', '.join(f"{k}={_format(v)}" for k, v in values.items()
+                              if isinstance(v, (int, float)) and not isinstance(v, bool))
+            lines.append(f"{group}: {shown}")
+        return '\n'.join(lines)
+
+    def to_prometheus(self, snapshot: dict = None) -> str:
+        """Prometheus text exposition format."""
+        snapshot = snapshot or self.snapshot()
+        lines = []
+        for name, h in snapshot['latency'].items():
+            metric = f"quicktranslator_{_metric_name(name)}_seconds"
+            lines.append(f"# TYPE {metric} summary")
+            for quantile, key in (('0.5', 'p50'), ('0.95', 'p95'), ('0.99', 'p99')):
+                lines.append(f'{metric}{{quantile="{quantile}"}} {h[key]:.6f}')
+            lines.append(f"{metric}_sum {h['sum']:.6f}")
+            lines.append(f"{metric}_count {h['count']}")
+        for group, values in snapshot['stats'].items():
+            for key, value in values.items():
+                if isinstance(value, (int, float)) and not isinstance(value, bool):
+                    lines.append(f"quicktranslator_{_metric_name(group)}_{_metric_name(key)} {value}")
+        return '\n'.join(lines) + '\n'
+
+    def export(self):
+        """Write metrics.json and metrics.prom to the config directory."""
+        snapshot = self.snapshot()
+        json_path = get_data_path('metrics.json')
+        with open(json_path, 'w', encoding='utf-8') as f:
+            json.dump(snapshot, f, indent=2)
+        with open(get_data_path('metrics.prom'), 'w', encoding='utf-8') as f:
+            f.write(self.to_prometheus(snapshot))
+
+    def start_exporter(self, interval: float = METRICS_EXPORT_INTERVAL):
+        """Export periodically from a daemon thread (only while enabled)."""
+        if not self.enabled or self.exporter is not None:
+            return
+
+        def run():
+            while True:
+                time.sleep(interval)
+                try:
+                    self.export()
+                except OSError:
+                    pass
+
+        self.exporter = threading.Thread(target=run, name='metrics-export', daemon=True)
+        self.exporter.start()
+
+
+def _metric_name(name: str) -> str:
+    return ''.join(c if c.isalnum() else '_' for c in name.lower())
+
+
+def _format(value) -> str:
+    if isinstance(value, float):
+        return f"{value:.3g}"
+    return str(value)
+
+
+# Process-wide registry
+metrics = Metrics(enabled=METRICS_ENABLED)
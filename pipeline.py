@@ -0,0 +1,94 @@
+"""Latest-wins request pipeline for translations typed into the window."""
+
+import threading
+
+
+class RequestPipeline:
+    """
+    Sends translation requests through the asyncio engine.
+    Every submit gets a new generation number and supersedes the previous
+    request: it is cancelled inside the engine (before it is sent or while
+    in flight) and only the newest generation is ever delivered.
+    """
+
+    def __init__(self, engine, deliver):
+        """
+        Args:
+            engine: TranslationEngine that runs the requests
+            deliver: called from the engine thread as deliver(generation, result)
+        """
+        self.engine = engine
+        self.deliver = deliver
+        self.lock = threading.RLock()
+        self.generation = 0
+        self.current = None
+        # Set while no request is in flight; background work waits on it
+        self.idle = threading.Event()
+        self.idle.set()
+        self.stats = {
+            'submitted': 0,
+            'cancelled': 0,  # Superseded before completing
+            'discarded': 0,  # Completed after being superseded
+            'stale_renders': 0,  # Reached the UI after being superseded
+        }
+
+    @property
+    def busy(self) -> bool:
+        """A request is in flight."""
+        current = self.current
+        return current is not None and not current.done()
+
+    def submit(self, text: str) -> int:
+        """Translate text, superseding any earlier request."""
+        with self.lock:
+            self.generation += 1
+            generation = self.generation
+            self.stats['submitted'] += 1
+            self._cancel_current()
+            future = self.engine.submit(
+                text, on_part=lambda result: self._part(generation, result))
+            self.current = future
+            self.idle.clear()
+        future.add_done_callback(self._settle)
+        future.add_done_callback(lambda f: self._done(generation, f))
+        return generation
+
+    def cancel(self) -> int:
+        """Supersede the pending request, if any; returns the new generation."""
+        with self.lock:
+            self.generation += 1
+            self._cancel_current()
+            return self.generation
+
+    def _cancel_current(self):
+        if self.current is not None and self.current.cancel():
+            self.stats['cancelled'] += 1
+        self.current = None
+        self.idle.set()
+
+    def _settle(self, future):
+        # Reentrant lock: cancel() runs this callback on the calling thread
+        with self.lock:
+            if self.current is future:
+                self.current = None
+                self.idle.set()
+
+    def is_current(self, generation: int) -> bool:
+        """Check whether a generation is still the latest one."""
+        return generation == self.generation
+
+    def record_stale(self):
+        """Count a result that reached the UI after being superseded."""
+        self.stats['stale_renders'] += 1
+
+    def _part(self, generation: int, result: dict):
+        if self.is_current(generation):
+            self.deliver(generation, result)
+
+    def _done(self, generation: int, future):
+        if future.cancelled():
+            return
+        if not self.is_current(generation):
+            self.stats['discarded'] += 1
+            return
+        self.deliver(generation, future.result())
@@ -0,0 +1,130 @@
+"""Speculative prefetch of likely final inputs while the user is typing."""
+
+import threading
+import time
+from collections import Counter, OrderedDict
+
+# How many candidates to keep queued; older ones are replaced by newer input
+MAX_CANDIDATES = 3
+# Number of history completions to try for each input
+HISTORY_COMPLETIONS = 2
+# Prefetched texts remembered for the hit rate, least recently added dropped first
+MAX_PREFETCHED = 200
+
+
+class SpeculativePrefetcher:
+    """
+    Quietly translates likely final inputs so the real lookup hits the cache.
+    Candidates are the completed-word prefix of the input and completions
+    from earlier lookups. Requests only go out when the main pipeline is
+    idle and the per-minute budget allows it.
+    """
+
+    def __init__(self, engine, idle: threading.Event = None, budget_per_minute: int = 30,
+                 history_size: int = 1000):
+        """
+        Args:
+            engine: TranslationEngine that sends the speculative requests
+            idle: set while no real request is in flight (RequestPipeline.idle)
+        """
+        self.engine = engine
+        self.service = engine.service
+        if idle is None:
+            idle = threading.Event()
+            idle.set()
+        self.idle = idle
+        self.budget_per_minute = budget_per_minute
+        self.tokens = float(budget_per_minute)
+        self.last_refill = time.monotonic()
+        self.history = Counter()
+        self.history_size = history_size
+        self.candidates = []
+        self.prefetched = OrderedDict()
+        self.condition = threading.Condition()
+        self.worker = None
+        self.stats = {
+            'requests': 0,  # Speculative translations sent
+            'budget_skips': 0,  # Candidates dropped by the budget
+            'lookups': 0,  # Final lookups seen
+            'hits': 0,  # Final lookups that were prefetched
+        }
+
+    def on_input(self, text: str):
+        """Called on every edit with the raw input text."""
+        candidates = []
+        stripped = text.strip()
+        if text.endswith(' ') and stripped:
+            candidates.append(stripped)
+        if stripped:
+            completions = [t for t in self.history if t.startswith(stripped) and t != stripped]
+            completions.sort(key=self.history.__getitem__, reverse=True)
+            candidates.extend(completions[:HISTORY_COMPLETIONS])
+
+        candidates = [c for c in candidates
+                      if not self.service.is_long(c) and self.service.cached(c) is None]
+        if not candidates:
+            return
+
+        with self.condition:
+            self.candidates = candidates[:MAX_CANDIDATES]
+            self.condition.notify()
+            if self.worker is None:
+                self.worker = threading.Thread(target=self._run, daemon=True)
+                self.worker.start()
+
+    def on_lookup(self, text: str):
+        """Called for every final lookup; records history and hit rate."""
+        self.stats['lookups'] += 1
+        with self.condition:
+            if self.prefetched.pop(text, False):
+                self.stats['hits'] += 1
+
+        self.history[text] += 1
+        if len(self.history) > self.history_size:
+            # Forget the rarest half
+            for key, _ in self.history.most_common()[self.history_size // 2:]:
+                del self.history[key]
+
+    def hit_rate(self) -> float:
+        """Share of speculative requests that a final lookup used."""
+        if not self.stats['requests']:
+            return 0.0
+        return self.stats['hits'] / self.stats['requests']
+
+    def _take_token(self) -> bool:
+        now = time.monotonic()
+        self.tokens = min(self.budget_per_minute,
+                          self.tokens + (now - self.last_refill) * self.budget_per_minute / 60)
+        self.last_refill = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return True
+        return False
+
+    def _run(self):
+        """Worker loop: one speculative request at a time, lowest priority."""
+        while True:
+            with self.condition:
+                while not self.candidates:
+                    self.condition.wait()
+                text = self.candidates.pop(0)
+
+            # Yield to real requests
+            self.idle.wait()
+
+            if self.service.cached(text) is not None:
+                continue
+            if not self._take_token():
+                self.stats['budget_skips'] += 1
+                continue
+
+            self.stats['requests'] += 1
+            try:
+                result = self.engine.submit(text).result()
+            except Exception:
+                continue
+            if result['success']:
+                with self.condition:
+                    self.prefetched[text] = True
+                    if len(self.prefetched) > MAX_PREFETCHED:
+                        self.prefetched.popitem(last=False)
@@ -0,0 +1,96 @@
+"""Adaptive debounce for the search input."""
+
+import time
+from collections import deque
+
+# Inter-keystroke gaps longer than this are pauses, not typing cadence
+MAX_TYPING_GAP = 1.5
+# Wait this much longer than the usual gap before assuming a pause
+GAP_FACTOR = 1.3
+# Backend latency (seconds) above which the debounce starts backing off
+SLOW_LATENCY = 0.5
+
+
+def percentile(values, p: float) -> float:
+    """Nearest-rank percentile of a non-empty sequence."""
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * p / 100))]
+
+
+class AdaptiveDebouncer:
+    """
+    Chooses the debounce delay from the user's typing cadence and the
+    measured backend latency.
+    - Fires once the pause is longer than the usual gap between keystrokes
+    - Fires immediately when the result is already cached
+    - Waits longer when the backend is slow, so fewer requests are wasted
+    """
+
+    def __init__(self, min_delay: int = 80, max_delay: int = 800,
+                 default_delay: int = 400, window: int = 30):
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.default_delay = default_delay
+        self.intervals = deque(maxlen=window)
+        self.latencies = deque(maxlen=window)
+        self.last_keystroke = None
+        # (delay ms, outcome) for tuning: 'fired', 'superseded' or 'cached'
+        self.decisions = deque(maxlen=500)
+        self.pending_delay = None
+
+    def on_keystroke(self, now: float = None):
+        """Record a keystroke; supersedes a pending timer if there is one."""
+        now = time.monotonic() if now is None else now
+        if self.last_keystroke is not None:
+            gap = now - self.last_keystroke
+            if gap < MAX_TYPING_GAP:
+                self.intervals.append(gap)
+        self.last_keystroke = now
+
+        if self.pending_delay is not None:
+            self.decisions.append((self.pending_delay, 'superseded'))
+            self.pending_delay = None
+
+    def record_latency(self, seconds: float):
+        """Record how long a backend request took."""
+        self.latencies.append(seconds)
+
+    def next_delay(self, cached: bool = False) -> int:
+        """Return the delay in ms before the next request should fire."""
+        if cached:
+            self.decisions.append((0, 'cached'))
+            return 0
+
+        if len(self.intervals) < 5:
+            delay = self.default_delay
+        else:
+            delay = percentile(self.intervals, 90) * GAP_FACTOR * 1000
+
+        if self.latencies:
+            latency = percentile(self.latencies, 50)
+            if latency > SLOW_LATENCY:
+                delay += (latency - SLOW_LATENCY) * 500
+
+        delay = int(max(self.min_delay, min(self.max_delay, delay)))
+        self.pending_delay = delay
+        return delay
+
+    def on_fire(self):
+        """Record that the pending timer fired."""
+        if self.pending_delay is not None:
+            self.decisions.append((self.pending_delay, 'fired'))
+            self.pending_delay = None
+
+    def stats(self) -> dict:
+        """Summary of chosen delays and their outcomes."""
+        outcomes = {'fired': 0, 'superseded': 0, 'cached': 0}
+        for _, outcome in self.decisions:
+            outcomes[outcome] += 1
+        delays = [d for d, outcome in self.decisions if outcome != 'cached']
+        return {
+            'decisions': len(self.decisions),
+            'outcomes': outcomes,
+            'delay_p50_ms': percentile(delays, 50) if delays else None,
+            'typing_gap_p90_ms': percentile(self.intervals, 90) * 1000 if self.intervals else None,
+            'latency_p50_ms': percentile(self.latencies, 50) * 1000 if self.latencies else None,
+        }
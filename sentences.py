@@ -0,0 +1,126 @@
+"""Sentence splitting and chunking for long inputs."""
+
+import re
+from difflib import SequenceMatcher
+
+# Sentence terminators with closing quotes/brackets and the whitespace after them,
+# or a line break
+BOUNDARY = re.compile(r"[.!?…]+[\"'”’»)\]]*\s+|\n\s*")
+LAST_WORD = re.compile(r"(\S+)$")
+
+# Words that end with a period without ending the sentence (lowercase, no final dot)
+ABBREVIATIONS = {
+    'mr', 'mrs', 'ms', 'dr', 'prof', 'st', 'vs', 'etc', 'e.g', 'i.e', 'no', 'fig',
+    'jr', 'sr', 'inc', 'ltd', 'co', 'approx', 'dept',
+    'vb', 'bkz', 'örn', 'sn', 'doç', 'yrd', 'av', 'müh', 'cad', 'sok', 'mah',
+}
+
+
+def _is_boundary(text: str, match) -> bool:
+    found = match.group()
+    if '\n' in found or found[0] != '.' or found.rstrip()[-1:] in '!?…':
+        return True
+    if text[match.end()].islower():
+        return False  # "3. sınıf", "approx. ten"
+    word = LAST_WORD.search(text, 0, match.start())
+    if word is None:
+        return True
+    word = word.group(1).lower()
+    return word not in ABBREVIATIONS and not (len(word) == 1 and word.isalpha())
+
+
+def split_sentences(text: str) -> list:
+    """
+    Split text into sentences. Each keeps the whitespace after it, so
+    ''.join(split_sentences(text)) == text.
+    """
+    parts = []
+    start = 0
+    for match in BOUNDARY.finditer(text):
+        if match.end() >= len(text):
+            break
+        if _is_boundary(text, match):
+            parts.append(text[start:match.end()])
+            start = match.end()
+    if start < len(text):
+        parts.append(text[start:])
+    return parts
+
+
+def _split_at_spaces(sentence: str, max_chars: int) -> list:
+    """Cut a sentence longer than max_chars at spaces (hard cut if there are none)."""
+    pieces = []
+    while len(sentence) > max_chars:
+        cut = sentence.rfind(' ', 0, max_chars) + 1 or max_chars
+        pieces.append(sentence[:cut])
+        sentence = sentence[cut:]
+    if sentence:
+        pieces.append(sentence)
+    return pieces
+
+
+def _pieces(sentences: list, max_chars: int) -> list:
+    return [piece for sentence in sentences for piece in _split_at_spaces(sentence, max_chars)]
+
+
+def _group(pieces: list, max_chars: int) -> list:
+    """Group consecutive pieces into tuples of at most max_chars characters."""
+    groups = []
+    current = []
+    size = 0
+    for piece in pieces:
+        if current and size + len(piece) > max_chars:
+            groups.append(tuple(current))
+            current = []
+            size = 0
+        current.append(piece)
+        size += len(piece)
+    if current:
+        groups.append(tuple(current))
+    return groups
+
+
+def chunk_sentences(sentences: list, max_chars: int) -> list:
+    """Group consecutive sentences into chunks of at most max_chars characters."""
+    return [''.join(group) for group in _group(_pieces(sentences, max_chars), max_chars)]
+
+
+def rechunk(previous: list, sentences: list, max_chars: int) -> list:
+    """
+    Group sentences like chunk_sentences(), but keep every chunk of the
+    previous grouping whose sentences are all unchanged (ignoring
+    surrounding whitespace), so an edit only regroups the sentences around it.
+    
+    Args:
+        previous: the groups returned by the last call (or [])
+    Returns:
+        list of tuples of pieces; ''.join(group) is the chunk text
+    """
+    pieces = _pieces(sentences, max_chars)
+    old = [piece for group in previous for piece in group]
+    # Index of the first piece of the chunk every old piece belongs to, and its size
+    starts, sizes = [], []
+    for group in previous:
+        starts.extend([len(starts)] * len(group))
+        sizes.extend([len(group)] * len(group))
+    
+    groups = []
+    loose = []
+    matcher = SequenceMatcher(None, [p.strip() for p in old], [p.strip() for p in pieces],
+                              autojunk=False)
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag != 'equal':
+            loose.extend(pieces[j1:j2])
+            continue
+        i, j = i1, j1
+        while i < i2:
+            if starts[i] == i and i + sizes[i] <= i2:
+                groups.extend(_group(loose, max_chars))
+                loose = []
+                groups.append(tuple(pieces[j:j + sizes[i]]))
+                i, j = i + sizes[i], j + sizes[i]
+            else:
+                loose.append(pieces[j])
+                i, j = i + 1, j + 1
+    groups.extend(_group(loose, max_chars))
+    return groups
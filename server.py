@@ -0,0 +1,274 @@
+"""
+Local HTTP API over TranslationService, for other tools on the same machine.
+
+Endpoints (JSON in, JSON out):
+    POST /translate        {"text": "..."}         -> result dict
+    POST /translate_batch  {"texts": ["...", ...]} -> {"results": [...]}
+    GET  /stats            service, cache, backend and coalescing counters
+    GET  /ping
+
+Identical texts that are already being translated for another caller are
+not sent again: later callers wait for the same result (singleflight).
+
+Usage:
+    python main.py --serve --port 8766
+"""
+
+import json
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from translator import TranslationService, make_error
+
+# Largest accepted request body in bytes
+MAX_BODY = 1 << 20
+
+
+class _Call:
+    """One in-flight piece of work other callers can wait for."""
+
+    __slots__ = ('done', 'result')
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+
+
+class Singleflight:
+    """
+    Coalesces identical concurrent work: the first caller of a key runs it
+    and callers arriving before it finishes get the same result.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.calls = {}
+        self.leaders = 0
+        self.shared = 0
+
+    def claim(self, keys) -> tuple:
+        """Split keys into ({key: call} this caller must finish, {key: call} to wait for)."""
+        owned, waiting = {}, {}
+        with self.lock:
+            for key in keys:
+                if key in owned or key in waiting:
+                    continue
+                call = self.calls.get(key)
+                if call is None:
+                    owned[key] = self.calls[key] = _Call()
+                    self.leaders += 1
+                else:
+                    waiting[key] = call
+                    self.shared += 1
+        return owned, waiting
+
+    def finish(self, key, call: _Call, result):
+        """Publish the result of an owned call and wake its waiters."""
+        call.result = result
+        with self.lock:
+            if self.calls.get(key) is call:
+                del self.calls[key]
+        call.done.set()
+
+    def stats(self) -> dict:
+        return {'leaders': self.leaders, 'coalesced': self.shared, 'in_flight': len(self.calls)}
+
+
+class TranslationRequestHandler(BaseHTTPRequestHandler):
+    """Request handler for the local API."""
+
+    protocol_version = 'HTTP/1.1'  # Keep-alive
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        if self.path == '/ping':
+            self.send_json(200, {'ok': True})
+        elif self.path == '/stats':
+            self.send_json(200, self.server.stats())
+        else:
+            self.send_json(404, {'error': 'Not found'})
+
+    def do_POST(self):
+        payload = self.read_json()
+        if payload is None:
+            return
+
+        if self.path == '/translate':
+            text = payload.get('text')
+            if not isinstance(text, str):
+                self.send_json(400, {'error': "'text' must be a string"})
+                return
+            self.send_json(200, self.server.translate_texts([text])[0])
+        elif self.path == '/translate_batch':
+            texts = payload.get('texts')
+            if not isinstance(texts, list) or not all(isinstance(t, str) for t in texts):
+                self.send_json(400, {'error': "'texts' must be a list of strings"})
+                return
+            self.send_json(200, {'results': self.server.translate_texts(texts)})
+        else:
+            self.send_json(404, {'error': 'Not found'})
+
+    def read_json(self):
+        """Read the JSON request body; sends the error response and returns None if invalid."""
+        header = self.headers.get('Content-Length')
+        try:
+            length = int(header) if header is not None else -1
+        except ValueError:
+            length = -1
+        if length < 0 or length > MAX_BODY:
+            # The body is not read, so the connection cannot be reused
+            self.close_connection = True
+        if header is None:
+            self.send_json(411, {'error': 'Content-Length required'})
+            return None
+        if length < 0:
+            self.send_json(400, {'error': 'Invalid Content-Length'})
+            return None
+        if length > MAX_BODY:
+            self.send_json(413, {'error': 'Request too large'})
+            return None
+        # Browsers cannot send this cross-site without a preflight we never answer
+        if not self.headers.get('Content-Type', '').startswith('application/json'):
+            self.rfile.read(length)
+            self.send_json(415, {'error': 'Content-Type must be application/json'})
+            return None
+        try:
+            payload = json.loads(self.rfile.read(length).decode('utf-8'))
+        except ValueError:
+            self.send_json(400, {'error': 'Invalid JSON'})
+            return None
+        if not isinstance(payload, dict):
+            self.send_json(400, {'error': 'Expected a JSON object'})
+            return None
+        return payload
+
+    def send_json(self, status: int, data: dict):
+        body = json.dumps(data, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class TranslationServer(ThreadingHTTPServer):
+    """Threaded HTTP server sharing one TranslationService (and its cache)."""
+
+    daemon_threads = True
+    request_queue_size = 128  # Many clients connect at once
+
+    def __init__(self, service: TranslationService, host: str = '127.0.0.1',
+                 port: int = 0, coalesce: bool = True):
+        super().__init__((host, port), TranslationRequestHandler)
+        self.service = service
+        self.coalesce = coalesce
+        self.flights = Singleflight()
+        self.lock = threading.Lock()
+        self.requests = 0
+        self.texts = 0
+        self.thread = None
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def handle_error(self, request, client_address):
+        # Clients that hang up early are not an error here
+        if isinstance(sys.exc_info()[1], ConnectionError):
+            return
+        super().handle_error(request, client_address)
+
+    def _translate(self, texts: list) -> list:
+        if len(texts) == 1:
+            # translate() keeps the configured mode and latency listeners
+            return [self.service.translate(texts[0])]
+        return self.service.translate_many(texts)
+
+    def translate_texts(self, texts: list) -> list:
+        """Translate texts, sharing work with identical in-flight requests."""
+        with self.lock:
+            self.requests += 1
+            self.texts += len(texts)
+        if not texts:
+            return []
+        if not self.coalesce:
+            return self._translate(texts)
+
+        service = self.service
+        keys = [service.cache.make_key(text, service.primary_language) for text in texts]
+        owned, waiting = self.flights.claim(keys)
+        results = {}
+        if owned:
+            own_texts = {}
+            for key, text in zip(keys, texts):
+                if key in owned:
+                    own_texts.setdefault(key, text)
+            translated = None
+            try:
+                translated = self._translate(list(own_texts.values()))
+            except Exception as e:
+                translated = [make_error(str(e))] * len(own_texts)
+            finally:
+                # Never leave waiters hanging, whatever happened above
+                if translated is None:
+                    translated = [make_error('Translation failed')] * len(own_texts)
+                for key, result in zip(own_texts, translated):
+                    results[key] = result
+                    self.flights.finish(key, owned[key], result)
+        for key, call in waiting.items():
+            call.done.wait()
+            results[key] = call.result
+        return [results[key] for key in keys]
+
+    def stats(self) -> dict:
+        return {
+            'requests': self.requests,
+            'texts': self.texts,
+            'coalescing': self.flights.stats(),
+            'service': dict(self.service.stats),
+            'cache': self.service.cache.stats(),
+            'backend': self.service.backend.stats(),
+        }
+
+    def start(self) -> str:
+        """Serve in a background thread and return the base URL."""
+        self.thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self.thread.start()
+        return self.url
+
+    def stop(self):
+        """Stop serving."""
+        self.shutdown()
+        self.server_close()
+
+
+def run(args, primary_language: str) -> int:
+    """Serve until interrupted; returns an exit code."""
+    service = TranslationService(primary_language)
+    try:
+        server = TranslationServer(service, args.host, args.port, not args.no_coalesce)
+    except OSError as e:
+        print(f"Sunucu başlatılamadı: {e}")
+        return 2
+    if server.server_address[0] not in ('127.0.0.1', '::1', 'localhost'):
+        print("Uyarı: sunucu yerel ağ dışına açık, kimlik doğrulama yok!")
+    try:
+        service.warm_up()
+    except Exception:
+        pass  # The first request retries the import/connection
+    print(f"Çeviri sunucusu: {server.url} (durdurmak için Ctrl+C)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        if service.has_backend:
+            service.backend.close()
+        service.cache.close()
+    return 0
@@ -207,11 +207,11 @@ class SetupWizard:
 
 def run_setup_if_needed() -> dict:
     """Run setup wizard if no settings exist, otherwise load existing."""
-    from config import get_config_path, load_settings
+    from config import get_config_path, SETTINGS
     
     config_path = get_config_path()
     if not config_path.exists():
         wizard = SetupWizard()
         return wizard.run()
     else:
-        return load_settings()
+        return SETTINGS
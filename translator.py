@@ -1,14 +1,214 @@
-"""Google Translate API wrapper with smart language detection."""
+"""Translation service with smart language detection."""
 
-from googletrans import Translator
+import asyncio
+import re
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+
+from backends import GuardedBackend, TranslationBackend, create_backend
+from breaker import CircuitBreaker
+from cache import TranslationCache
+from detector import LanguageDetector
+from dictionary import OfflineDictionary, dictionary_path, is_single_word
+from fuzzy import TranslationMemory
+from metrics import metrics
+from sentences import chunk_sentences, rechunk, split_sentences
+from config import (
+    TRANSLATION_MODE,
+    LONG_TEXT_CHARS,
+    LONG_TEXT_CHUNK_CHARS,
+    LONG_TEXT_CONCURRENCY,
+    FUZZY_MEMORY_ENTRIES,
+    FUZZY_MIN_SIMILARITY,
+    FUZZY_SKIP_SIMILARITY,
+    OFFLINE_DETECTION,
+    OFFLINE_DETECTION_THRESHOLD,
+    OFFLINE_DICTIONARY,
+    DICTIONARY_PATH,
+    BACKEND,
+    BACKEND_URL,
+    BACKEND_CONNECT_TIMEOUT,
+    BACKEND_READ_TIMEOUT,
+    RETRY_ATTEMPTS,
+    RETRY_BASE_MS,
+    RETRY_MAX_MS,
+    BREAKER_FAILURE_THRESHOLD,
+    BREAKER_RESET_SECONDS,
+    HEDGE_URLS,
+    HEDGE_PERCENTILE,
+    HEDGE_MIN_DELAY_MS,
+    HEDGE_MAX_EXTRA,
+    BATCH_MAX_CHARS,
+    BATCH_MAX_ITEMS,
+    BATCH_CONCURRENCY,
+)
+
+# Translation modes:
+# - 'detect': detect() first, then translate() (two round trips)
+# - 'single': translate with auto detection, flip to English only if needed
+# - 'speculative': like 'single' but sends the English flip in parallel
+TRANSLATION_MODES = ('detect', 'single', 'speculative')
+
+# Words for the word-by-word offline fallback
+WORD_PATTERN = re.compile(r"[^\W\d_]+(?:['’-][^\W\d_]+)*")
+
+# An English dictionary hit is dropped when another language is this many
+# times more likely for the word ("pain", "main" are French too)
+DICTIONARY_MIN_SUPPORT = 0.25
+
+
+def make_result(translated: str, source_lang: str, target_lang: str) -> dict:
+    """Build a successful translation result."""
+    return {
+        'translated': translated,
+        'source_lang': source_lang,
+        'target_lang': target_lang,
+        'detected_lang': source_lang,
+        'success': True,
+        'error': None
+    }
+
+
+def make_error(message: str) -> dict:
+    """Build a failed translation result."""
+    return {
+        'translated': '',
+        'source_lang': '',
+        'target_lang': '',
+        'detected_lang': '',
+        'success': False,
+        'error': message
+    }
+
+
+def chunk_texts(items: list, max_chars: int, max_items: int):
+    """Split (key, text) items into batches under the size limits."""
+    batch = []
+    size = 0
+    for key, text in items:
+        if batch and (size + len(text) > max_chars or len(batch) >= max_items):
+            yield batch
+            batch = []
+            size = 0
+        batch.append((key, text))
+        size += len(text)
+    if batch:
+        yield batch
 
 
 class TranslationService:
-    """Handles translation requests using Google Translate."""
+    """Handles translation requests through a pluggable backend."""
     
-    def __init__(self, primary_language: str = 'tr'):
-        self.translator = Translator()
+    def __init__(self, primary_language: str = 'tr', cache: TranslationCache = None,
+                 mode: str = TRANSLATION_MODE, backend: TranslationBackend = None):
+        self._backend = backend
+        self._owns_backend = backend is None  # Built here, so release() may close it
+        self._init_lock = threading.Lock()
+        # Held while the mapped dictionary is read, so release() never unmaps it mid-lookup
+        self._dictionary_lock = threading.Lock()
+        # Guards the configured backend; an injected backend is used as is
+        self.breaker = CircuitBreaker(BREAKER_FAILURE_THRESHOLD, BREAKER_RESET_SECONDS)
         self.primary_language = primary_language
+        self.cache = cache if cache is not None else TranslationCache()
+        self.mode = mode if mode in TRANSLATION_MODES else 'single'
+        self.offline_detection = OFFLINE_DETECTION
+        self.detection_threshold = OFFLINE_DETECTION_THRESHOLD
+        self._detector = None
+        self.offline_dictionary = OFFLINE_DICTIONARY
+        self._dictionary = None
+        self._dictionary_opened = False
+        self._executor = None
+        self._batch_executor = None
+        # Near duplicates of past inputs (None when off)
+        self.memory = (TranslationMemory(FUZZY_MEMORY_ENTRIES, FUZZY_MIN_SIMILARITY)
+                       if FUZZY_MEMORY_ENTRIES > 0 else None)
+        self.fuzzy_skip_similarity = FUZZY_SKIP_SIMILARITY
+        self.stats = {'offline_detections': 0, 'network_detections': 0, 'dictionary_hits': 0,
+                      'offline_fallbacks': 0, 'chunks_sent': 0, 'chunks_reused': 0,
+                      'fuzzy_hits': 0, 'dictionary_rejected': 0}
+        # Chunk grouping of the last long text, kept stable across edits
+        self._long_chunks = []
+        # Called with the backend time in seconds after every network translation
+        self.latency_listeners = []
+    
+    @property
+    def backend(self) -> TranslationBackend:
+        """Configured backend, built on first use (and again after release())."""
+        if self._backend is None:
+            with self._init_lock:
+                if self._backend is None:
+                    self._backend = GuardedBackend(self.build_backend(), self.breaker,
+                                                   RETRY_ATTEMPTS, RETRY_BASE_MS / 1000,
+                                                   RETRY_MAX_MS / 1000)
+        return self._backend
+    
+    @property
+    def has_backend(self) -> bool:
+        """The backend exists (checking does not build it)."""
+        return self._backend is not None
+    
+    def build_backend(self) -> TranslationBackend:
+        """Create the backend from the settings."""
+        return create_backend(
+            BACKEND, BACKEND_URL, BACKEND_CONNECT_TIMEOUT, BACKEND_READ_TIMEOUT,
+            HEDGE_URLS, HEDGE_PERCENTILE, HEDGE_MIN_DELAY_MS / 1000, HEDGE_MAX_EXTRA)
+    
+    def release(self, cache_floor: int):
+        """
+        Free what an idle app does not need: close the configured backend
+        (its clients and connections; rebuilt on next use), shrink the
+        memory cache to cache_floor entries and unmap the offline dictionary.
+        Call it on the engine loop when the backend has async connections.
+        """
+        with self._init_lock:
+            backend = self._backend if self._owns_backend else None
+            if backend is not None:
+                self._backend = None
+            with self._dictionary_lock:
+                dictionary, self._dictionary = self._dictionary, None
+                self._dictionary_opened = False
+                if dictionary is not None:
+                    dictionary.close()
+            executor, self._executor = self._executor, None
+            batch_executor, self._batch_executor = self._batch_executor, None
+        if backend is not None:
+            backend.close()
+        for pool in (executor, batch_executor):
+            if pool is not None:
+                pool.shutdown(wait=False)
+        self._long_chunks = []
+        self.cache.trim(cache_floor)
+    
+    def warm_up(self):
+        """Build the backend and detector ahead of the first request."""
+        self.backend.warm_up()
+        if self.offline_detection:
+            self.detector
+        if self.offline_dictionary:
+            self.dictionary
+    
+    @property
+    def detector(self) -> LanguageDetector:
+        """Offline language detector, built on first use."""
+        if self._detector is None:
+            self._detector = LanguageDetector()
+        return self._detector
+    
+    @property
+    def dictionary(self):
+        """Offline word dictionary, mapped on first use (None if not installed)."""
+        if not self._dictionary_opened:
+            with self._init_lock:
+                if not self._dictionary_opened:
+                    path = DICTIONARY_PATH or dictionary_path(self.primary_language)
+                    try:
+                        self._dictionary = OfflineDictionary(path)
+                    except (OSError, ValueError):
+                        self._dictionary = None
+                    self._dictionary_opened = True
+        return self._dictionary
     
     def translate(self, text: str) -> dict:
         """
@@ -20,50 +220,596 @@ class TranslationService:
             dict with translated text and metadata
         """
         if not text or not text.strip():
-            return {
-                'translated': '',
-                'source_lang': '',
-                'target_lang': '',
-                'detected_lang': '',
-                'success': False,
-                'error': 'Empty text'
-            }
+            return make_error('Empty text')
+        
+        cache_key = self.cache.make_key(text, self.primary_language)
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
+        known = self.lookup_dictionary(text)
+        if known is not None:
+            return known
+        
+        near = self.skip_network(text)
+        if near is not None:
+            return near
+        
+        try:
+            source_lang = self.detect_offline(text)
+            started = time.perf_counter()
+            if source_lang:
+                # Confident offline detection: one request with a known source
+                self.stats['offline_detections'] += 1
+                translated, detected_lang, target_lang = self._translate_from(text, source_lang)
+            else:
+                self.stats['network_detections'] += 1
+                if self.mode == 'detect':
+                    translated, detected_lang, target_lang = self._translate_detect_first(text)
+                elif self.mode == 'speculative':
+                    translated, detected_lang, target_lang = self._translate_speculative(text)
+                else:
+                    translated, detected_lang, target_lang = self._translate_single(text)
+            
+            elapsed = time.perf_counter() - started
+            metrics.record('translate', elapsed)
+            for listener in self.latency_listeners:
+                listener(elapsed)
+            
+            response = make_result(translated, detected_lang, target_lang)
+            self.cache.put(cache_key, response)
+            self.memorize(text, response)
+            return response
+        except Exception as e:
+            return self.offline_result(text, e)
+    
+    async def atranslate(self, text: str) -> dict:
+        """Async version of translate() for the asyncio engine."""
+        if not text or not text.strip():
+            return make_error('Empty text')
+        
+        cache_key = self.cache.make_key(text, self.primary_language)
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
+        known = self.lookup_dictionary(text)
+        if known is not None:
+            return known
+        
+        near = self.skip_network(text)
+        if near is not None:
+            return near
         
         try:
-            # First, detect the language
-            detected = self.translator.detect(text)
-            detected_lang = detected.lang if detected else 'en'
+            source_lang = self.detect_offline(text)
+            started = time.perf_counter()
+            if source_lang:
+                self.stats['offline_detections'] += 1
+            else:
+                self.stats['network_detections'] += 1
+                if self.mode == 'detect':
+                    with metrics.span('detect'):
+                        source_lang = (await self.backend.adetect(text)).lang
             
-            # Smart target selection
-            if detected_lang == self.primary_language:
-                target_lang = 'en'
+            if source_lang:
+                target_lang = self.target_for(source_lang)
+                result = await self.backend.atranslate(text, src=source_lang, dest=target_lang)
+                translated, detected_lang = result.text, source_lang
             else:
-                target_lang = self.primary_language
+                translated, detected_lang, target_lang = await self._atranslate_auto(text)
             
-            # Perform translation
-            result = self.translator.translate(
-                text,
-                src=detected_lang,
-                dest=target_lang
-            )
+            elapsed = time.perf_counter() - started
+            metrics.record('translate', elapsed)
+            for listener in self.latency_listeners:
+                listener(elapsed)
             
-            return {
-                'translated': result.text,
-                'source_lang': detected_lang,
-                'target_lang': target_lang,
-                'detected_lang': detected_lang,
-                'success': True,
-                'error': None
-            }
+            response = make_result(translated, detected_lang, target_lang)
+            self.cache.put(cache_key, response)
+            self.memorize(text, response)
+            return response
+        except asyncio.CancelledError:
+            raise
         except Exception as e:
-            return {
-                'translated': '',
-                'source_lang': '',
-                'target_lang': '',
-                'detected_lang': '',
-                'success': False,
-                'error': str(e)
-            }
+            return self.offline_result(text, e)
+    
+    def is_long(self, text: str) -> bool:
+        """Long inputs go through atranslate_long() in the window."""
+        return LONG_TEXT_CHARS > 0 and len(text.strip()) >= LONG_TEXT_CHARS
+    
+    async def atranslate_long(self, text: str, on_part=None,
+                              concurrency: int = LONG_TEXT_CONCURRENCY,
+                              timeout: float = None) -> dict:
+        """
+        Translate a long text in sentence chunks, concurrently, in one direction.
+        on_part(result) is called with the translation of the leading
+        chunks finished so far (in order, marked with 'progress': (done,
+        total)) whenever it grows. timeout applies to every chunk request.
+        
+        Chunks are diffed against the previous long text, so after an edit
+        only the chunks around the changed sentences miss the cache.
+        
+        Returns:
+            result dict of the whole text
+        """
+        if not text or not text.strip():
+            return make_error('Empty text')
+        
+        cache_key = self.cache.make_key(text, self.primary_language)
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
+        self._long_chunks = rechunk(self._long_chunks, split_sentences(text.strip()),
+                                    LONG_TEXT_CHUNK_CHARS)
+        chunks = [''.join(group) for group in self._long_chunks]
+        parts = [None] * len(chunks)
+        ready = 0
+        started = time.perf_counter()
+        
+        def publish():
+            nonlocal ready
+            flushed = ready
+            while ready < len(parts) and parts[ready] is not None:
+                ready += 1
+            if on_part is None or ready == flushed or ready == len(parts):
+                return
+            if not flushed:
+                metrics.record('long_text_first_part', time.perf_counter() - started)
+            partial = make_result(''.join(parts[:ready]).strip(), source_lang, target_lang)
+            partial['progress'] = (ready, len(parts))
+            on_part(partial)
+        
+        source_lang = self.detect_offline(text)
+        if source_lang:
+            self.stats['offline_detections'] += 1
+            target_lang = self.target_for(source_lang)
+        else:
+            # The first chunk, sent with auto detection, fixes the direction of the rest
+            try:
+                first = await asyncio.wait_for(self.atranslate(chunks[0].strip()), timeout)
+            except asyncio.TimeoutError:
+                return make_error('Request timed out')
+            if not first['success']:
+                return first
+            if first.get('offline'):
+                # Backend unreachable: gloss the whole text, not just its first chunk
+                return self.gloss(text) or first
+            source_lang, target_lang = first['source_lang'], first['target_lang']
+            parts[0] = first['translated'] + chunks[0][len(chunks[0].rstrip()):]
+            publish()
+        
+        limit = asyncio.Semaphore(max(1, concurrency))
+        
+        async def run(index):
+            async with limit:
+                parts[index] = await self._atranslate_chunk(
+                    chunks[index], source_lang, target_lang, timeout)
+            publish()
+        
+        tasks = [asyncio.ensure_future(run(index))
+                 for index in range(len(chunks)) if parts[index] is None]
+        try:
+            await asyncio.gather(*tasks)
+        except asyncio.TimeoutError:
+            return make_error('Request timed out')
+        except Exception as e:
+            return self.offline_result(text, e)
+        finally:
+            for task in tasks:
+                task.cancel()
+        
+        metrics.record('translate_long', time.perf_counter() - started)
+        response = make_result(''.join(parts).strip(), source_lang, target_lang)
+        self.cache.put(cache_key, response)
+        self.memorize(text, response)
+        return response
+    
+    async def _atranslate_chunk(self, chunk: str, source_lang: str, target_lang: str,
+                                timeout: float = None) -> str:
+        """Translate one chunk in a fixed direction, keeping its surrounding whitespace."""
+        core = chunk.strip()
+        if not core:
+            return chunk
+        lead = chunk[:len(chunk) - len(chunk.lstrip())]
+        trail = chunk[len(chunk.rstrip()):]
+        key = self.cache.make_key(core, self.primary_language, f"{source_lang}>{target_lang}")
+        cached = self.cache.get(key)
+        if cached is None:
+            self.stats['chunks_sent'] += 1
+            result = await asyncio.wait_for(
+                self.backend.atranslate(core, dest=target_lang, src=source_lang), timeout)
+            cached = make_result(result.text, source_lang, target_lang)
+            self.cache.put(key, cached)
+        else:
+            self.stats['chunks_reused'] += 1
+        return lead + cached['translated'] + trail
+    
+    async def _atranslate_auto(self, text: str):
+        """Async 'single'/'speculative' path with automatic source detection."""
+        flipped = None
+        if self.mode == 'speculative':
+            flipped = asyncio.ensure_future(self.backend.atranslate(text, dest='en'))
+        try:
+            result = await self.backend.atranslate(text, dest=self.primary_language)
+            if result.src != self.primary_language:
+                return result.text, result.src, self.primary_language
+            
+            if flipped is None:
+                flipped = asyncio.ensure_future(
+                    self.backend.atranslate(text, src=result.src, dest='en'))
+            return (await flipped).text, result.src, 'en'
+        finally:
+            if flipped is not None and not flipped.done():
+                flipped.cancel()
+    
+    def translate_many(self, texts: list, max_chars: int = BATCH_MAX_CHARS,
+                       max_items: int = BATCH_MAX_ITEMS,
+                       concurrency: int = BATCH_CONCURRENCY) -> list:
+        """
+        Translate many texts with the same smart direction as translate().
+        Duplicates are sent once, cache hits are served first and the rest
+        goes out in size-limited batches with bounded concurrency. Texts
+        longer than max_chars are sent as sentence chunks and joined again.
+        
+        Returns:
+            list of result dicts in input order (failures are per item and
+            never replaced by an offline gloss)
+        """
+        keys = [self.cache.make_key(text, self.primary_language) for text in texts]
+        results = {}
+        pending = {}
+        for key, text in zip(keys, texts):
+            if key in results or key in pending:
+                continue
+            if not text or not text.strip():
+                results[key] = make_error('Empty text')
+                continue
+            cached = self.cache.get(key)
+            if cached is None:
+                cached = self.lookup_dictionary(text)
+            if cached is None:
+                cached = self.skip_network(text)
+            if cached is not None:
+                results[key] = cached
+            else:
+                pending[key] = text
+        
+        # Over the backend's request limit: send in sentence chunks, each
+        # batched (and cached) like a text of its own
+        oversized = {}
+        for key, text in list(pending.items()):
+            if len(text) <= max_chars:
+                continue
+            del pending[key]
+            parts = []
+            for chunk in chunk_sentences(split_sentences(text), max_chars):
+                core = chunk.strip()
+                lead = chunk[:len(chunk) - len(chunk.lstrip())]
+                trail = chunk[len(chunk.rstrip()):] if core else ''
+                part_key = self.cache.make_key(core, self.primary_language) if core else None
+                parts.append((part_key, lead, trail))
+                if part_key is None or part_key in results or part_key in pending:
+                    continue
+                cached = self.cache.get(part_key)
+                if cached is not None:
+                    results[part_key] = cached
+                else:
+                    pending[part_key] = core
+            oversized[key] = (text, parts)
+        
+        # Group by direction: known source languages go out with a fixed
+        # target, the rest is sent with src=auto to the primary language
+        groups = defaultdict(list)
+        for key, text in pending.items():
+            source_lang = self.detect_offline(text)
+            if source_lang:
+                groups[(source_lang, self.target_for(source_lang))].append((key, text))
+            else:
+                groups[('auto', self.primary_language)].append((key, text))
+        
+        batches = [(src, dest, batch)
+                   for (src, dest), items in groups.items()
+                   for batch in chunk_texts(items, max_chars, max_items)]
+        flips = self._run_batches(batches, results, concurrency)
+        
+        # Auto-detected texts that were already in the primary language
+        if flips:
+            batches = [(self.primary_language, 'en', batch)
+                       for batch in chunk_texts(flips, max_chars, max_items)]
+            self._run_batches(batches, results, concurrency)
+        
+        for key, (text, parts) in oversized.items():
+            results[key] = self._join_parts(text, parts, results)
+        return [results[key] for key in keys]
+    
+    def _join_parts(self, text: str, parts: list, results: dict) -> dict:
+        """Join the translated chunks of an oversized text (failed if any chunk failed)."""
+        translated = []
+        first = None
+        for part_key, lead, trail in parts:
+            if part_key is None:
+                translated.append(lead)
+                continue
+            result = results[part_key]
+            if not result['success']:
+                return make_error(result['error'])
+            first = first or result
+            translated.append(lead + result['translated'] + trail)
+        response = make_result(''.join(translated).strip(), first['source_lang'],
+                               first['target_lang'])
+        self.cache.put(self.cache.make_key(text, self.primary_language), response)
+        self.memorize(text, response)
+        return response
+    
+    def _run_batches(self, batches: list, results: dict, concurrency: int) -> list:
+        """Run batches concurrently, fill results and return items to flip to English."""
+        flips = []
+        if not batches:
+            return flips
+        
+        for future, (src, dest, batch) in self._send_batches(batches, concurrency):
+            try:
+                translations = future.result()
+                if len(translations) != len(batch):
+                    raise ValueError('Backend returned a wrong number of results')
+            except Exception as e:
+                # No offline gloss here: bulk callers must see the failure
+                for key, text in batch:
+                    results[key] = make_error(str(e))
+                continue
+            
+            for (key, text), translation in zip(batch, translations):
+                detected_lang = translation.src if src == 'auto' else src
+                if src == 'auto' and detected_lang == self.primary_language:
+                    flips.append((key, text))
+                    continue
+                response = make_result(translation.text, detected_lang, dest)
+                self.cache.put(key, response)
+                self.memorize(text, response)
+                results[key] = response
+        return flips
+    
+    @property
+    def batch_executor(self) -> ThreadPoolExecutor:
+        """Long-lived batch workers, so their backend clients and connections are reused."""
+        if self._batch_executor is None:
+            with self._init_lock:
+                if self._batch_executor is None:
+                    self._batch_executor = ThreadPoolExecutor(
+                        max_workers=max(1, BATCH_CONCURRENCY), thread_name_prefix='batch')
+        return self._batch_executor
+    
+    def _send_batches(self, batches: list, concurrency: int):
+        """Yield (finished future, batch) with at most `concurrency` batches in flight."""
+        def send(src, dest, batch):
+            return self.backend.translate_batch([text for _, text in batch], dest=dest, src=src)
+        
+        if concurrency <= 1 or len(batches) == 1:
+            # In the calling thread: no hand-off, and its own client is reused
+            for item in batches:
+                future = Future()
+                try:
+                    future.set_result(send(*item))
+                except Exception as e:
+                    future.set_exception(e)
+                yield future, item
+            return
+        
+        waiting = iter(batches)
+        running = {}
+        for item in waiting:
+            running[self.batch_executor.submit(send, *item)] = item
+            if len(running) >= concurrency:
+                break
+        while running:
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                item = running.pop(future)
+                following = next(waiting, None)
+                if following is not None:
+                    running[self.batch_executor.submit(send, *following)] = following
+                yield future, item
+    
+    def cached(self, text: str, disk: bool = False):
+        """Return the cached (memory, or also disk) or dictionary result for text, or None (no network)."""
+        if not text or not text.strip():
+            return None
+        key = self.cache.make_key(text, self.primary_language)
+        cached = self.cache.peek(key, disk)
+        if cached is None:
+            cached = self.lookup_dictionary(text)
+        return cached
+    
+    def remember(self, text: str, translated: str, source_lang: str, target_lang: str):
+        """Cache a translation known from elsewhere (e.g. the history)."""
+        result = make_result(translated, source_lang, target_lang)
+        self.cache.put(self.cache.make_key(text, self.primary_language), result)
+        self.memorize(text, result)
+        return result
+    
+    def memorize(self, text: str, result: dict):
+        """Add a network translation to the fuzzy memory."""
+        if self.memory is not None:
+            self.memory.add(text, result)
+    
+    def fuzzy_result(self, text: str, min_similarity: float = None):
+        """
+        Translation of the most similar remembered input (no network), or None.
+        The result carries 'fuzzy': (similarity, remembered input).
+        """
+        if self.memory is None or not text or not text.strip():
+            return None
+        with metrics.span('fuzzy_lookup'):
+            match = self.memory.match(text, min_similarity)
+        if match is None:
+            return None
+        result = make_result(match.translated, match.source_lang, match.target_lang)
+        result['fuzzy'] = (match.similarity, match.text)
+        return result
+    
+    def skip_network(self, text: str):
+        """A fuzzy result close enough to answer without the network, or None."""
+        if self.fuzzy_skip_similarity <= 0:
+            return None
+        near = self.fuzzy_result(text, self.fuzzy_skip_similarity)
+        if near is not None:
+            self.stats['fuzzy_hits'] += 1
+        return near
+    
+    def lookup_dictionary(self, text: str):
+        """Answer a single word from the offline dictionary, or None."""
+        if not self.offline_dictionary or self.primary_language == 'en' or not is_single_word(text):
+            return None
+        dictionary = self.dictionary
+        if dictionary is None:
+            return None
+        
+        word = text.strip()
+        found = []
+        with self._dictionary_lock, metrics.span('dictionary_lookup'):
+            if self._dictionary is not dictionary:
+                return None  # Released meanwhile
+            for source_lang, target_lang in ((self.primary_language, 'en'),
+                                             ('en', self.primary_language)):
+                translated = dictionary.lookup(word, source_lang, target_lang)
+                if translated:
+                    found.append((translated, source_lang, target_lang))
+        if len(found) > 1:
+            # A headword in both languages: only answer if the detector is sure
+            source_lang = self.detect_offline(word)
+            found = [entry for entry in found if entry[1] == source_lang]
+        if len(found) != 1:
+            return None
+        
+        translated, source_lang, target_lang = found[0]
+        if not self.agrees_with_detector(word, source_lang):
+            self.stats['dictionary_rejected'] += 1
+            return None
+        if word[0].isupper() and translated[0].islower():
+            translated = translated[0].upper() + translated[1:]
+        self.stats['dictionary_hits'] += 1
+        return make_result(translated, source_lang, target_lang)
+    
+    def agrees_with_detector(self, word: str, source_lang: str) -> bool:
+        """False if the detector points to another language for a dictionary hit."""
+        detected = self.detect_offline(word)
+        if detected and detected != source_lang:
+            return False
+        if source_lang != 'en':
+            # Single-word posteriors are too noisy to veto the primary language
+            return True
+        # English headwords are often words of other languages too
+        with metrics.span('detect_offline'):
+            return self.detector.support(word, 'en') >= DICTIONARY_MIN_SUPPORT
+    
+    def offline_result(self, text: str, error: Exception) -> dict:
+        """Result for a failed network translation: an offline gloss if possible, else the error."""
+        glossed = self.gloss(text)
+        if glossed is None:
+            return make_error(str(error))
+        self.stats['offline_fallbacks'] += 1
+        return glossed
+    
+    def gloss(self, text: str):
+        """
+        Word-by-word translation from the offline dictionary, for when the
+        network is unavailable. The result is marked 'offline' and never cached.
+        """
+        if not self.offline_dictionary or self.primary_language == 'en':
+            return None
+        dictionary = self.dictionary
+        if dictionary is None:
+            return None
+        
+        directions = ((self.primary_language, 'en'), ('en', self.primary_language))
+        source_lang = self.detect_offline(text)
+        if source_lang:
+            directions = [d for d in directions if d[0] == source_lang]
+        
+        best = None
+        with self._dictionary_lock:
+            if self._dictionary is not dictionary:
+                return None  # Released meanwhile
+            for source_lang, target_lang in directions:
+                found = []
+                
+                def replace(match):
+                    translated = dictionary.lookup(match.group(), source_lang, target_lang)
+                    if not translated:
+                        return match.group()
+                    found.append(translated)
+                    return translated.split(', ')[0]
+                
+                glossed = WORD_PATTERN.sub(replace, text.strip())
+                if found and (best is None or len(found) > best[0]):
+                    best = (len(found), glossed, source_lang, target_lang)
+        if best is None:
+            return None
+        result = make_result(*best[1:])
+        result['offline'] = True
+        return result
+    
+    def detect_offline(self, text: str):
+        """Return the language code if the offline detector is confident, else None."""
+        if not self.offline_detection:
+            return None
+        with metrics.span('detect_offline'):
+            detected = self.detector.detect(text)
+        if detected.confidence >= self.detection_threshold:
+            return detected.lang
+        return None
+    
+    def target_for(self, source_lang: str) -> str:
+        """Smart target selection for a source language."""
+        if source_lang == self.primary_language:
+            return 'en'
+        return self.primary_language
+    
+    def _translate_from(self, text: str, source_lang: str):
+        """Translate from a known source language."""
+        target_lang = self.target_for(source_lang)
+        result = self.backend.translate(text, src=source_lang, dest=target_lang)
+        return result.text, source_lang, target_lang
+    
+    def _translate_detect_first(self, text: str):
+        """Detect the language, then translate (two round trips)."""
+        with metrics.span('detect'):
+            source_lang = self.backend.detect(text).lang
+        return self._translate_from(text, source_lang)
+    
+    def _translate_single(self, text: str):
+        """
+        Translate to primary_language with automatic source detection.
+        Only if the source turns out to be primary_language, a second
+        request flips the target to English.
+        """
+        result = self.backend.translate(text, dest=self.primary_language)
+        detected_lang = result.src
+        if detected_lang != self.primary_language:
+            return result.text, detected_lang, self.primary_language
+        
+        result = self.backend.translate(text, src=detected_lang, dest='en')
+        return result.text, detected_lang, 'en'
+    
+    def _translate_speculative(self, text: str):
+        """Send both target directions in parallel and keep the matching one."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=2)
+        
+        flipped = self._executor.submit(self.backend.translate, text, dest='en')
+        try:
+            result = self.backend.translate(text, dest=self.primary_language)
+        except Exception:
+            flipped.cancel()
+            raise
+        
+        detected_lang = result.src
+        if detected_lang != self.primary_language:
+            flipped.cancel()
+            return result.text, detected_lang, self.primary_language
+        
+        return flipped.result().text, detected_lang, 'en'
     
     def get_language_name(self, code: str) -> str:
         """Convert language code to Turkish name."""
@@ -92,6 +838,12 @@ class TranslationService:
             'hu': 'Macarca',
             'ro': 'Rumence',
             'uk': 'Ukraynaca',
+            'bg': 'Bulgarca',
+            'be': 'Belarusça',
+            'sr': 'Sırpça',
+            'mk': 'Makedonca',
+            'fa': 'Farsça',
+            'ur': 'Urduca',
             'ms': 'Malayca',
         }
         return languages.get(code, code.upper())
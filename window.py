@@ -1,11 +1,31 @@
 """Main window for Quick Translator using Tkinter with Modern UI."""
 
 import tkinter as tk
-import threading
 import ctypes
-from ctypes import windll, byref, c_int, c_bool
-from translator import TranslationService
-from config import WINDOW_WIDTH, WINDOW_HEIGHT, COLORS, PRIMARY_LANGUAGE
+import threading
+from ctypes import byref, c_int, c_bool
+from autocomplete import HistoryIndex
+from dispatcher import TkDispatcher
+from memory import IdleTrimmer, rss_bytes
+from scheduler import AdaptiveDebouncer
+from metrics import metrics
+from config import (
+    WINDOW_WIDTH, WINDOW_HEIGHT, COLORS, PRIMARY_LANGUAGE,
+    ADAPTIVE_DEBOUNCE, DEBOUNCE_MS, DEBOUNCE_MIN_MS, DEBOUNCE_MAX_MS,
+    SPECULATIVE_PREFETCH, PREFETCH_BUDGET_PER_MINUTE,
+    AUTOCOMPLETE_SUGGESTIONS, AUTOCOMPLETE_MAX_ENTRIES, get_data_path,
+    HISTORY_ENABLED, HISTORY_SEARCH_RESULTS,
+    KEEP_ALIVE_INTERVAL, KEEP_ALIVE_BUDGET_PER_HOUR,
+    IDLE_TRIM_MINUTES, IDLE_CACHE_FLOOR,
+)
+
+# Windows API (None elsewhere, e.g. headless benchmarks under a virtual display)
+windll = getattr(ctypes, 'windll', None)
+
+# Autocomplete history snapshot in the config directory
+HISTORY_INDEX_FILE = 'history_index.bin'
+# Pause in typing before the history is searched (Ctrl+F mode)
+HISTORY_SEARCH_DELAY_MS = 80
 
 # Windows API Constants
 ACCENT_ENABLE_BLURBEHIND = 3
@@ -28,6 +48,8 @@ class WINDOWCOMPOSITIONATTRIBDATA(ctypes.Structure):
     ]
 
 def apply_acrylic(hwnd, color=0x2d2d2d): # ABGR format usually, but here just hex
+    if windll is None:
+        return
     # Enable Acrylic Blur
     policy = ACCENT_POLICY()
     policy.AccentState = ACCENT_ENABLE_ACRYLICBLURBEHIND
@@ -80,18 +102,143 @@ class TranslatorWindow:
     """Main translator window - frameless, dark theme with modern effects."""
     
     def __init__(self):
-        self.translator = TranslationService(PRIMARY_LANGUAGE)
+        self.dispatcher = TkDispatcher()
+        if ADAPTIVE_DEBOUNCE:
+            self.debouncer = AdaptiveDebouncer(DEBOUNCE_MIN_MS, DEBOUNCE_MAX_MS, DEBOUNCE_MS)
+        else:
+            self.debouncer = AdaptiveDebouncer(DEBOUNCE_MS, DEBOUNCE_MS, DEBOUNCE_MS)
+        # Translation services are built on first use or by warm_up()
+        self._translator = None
+        self._engine = None
+        self._pipeline = None
+        self.prefetcher = None
+        self.services_lock = threading.Lock()
+        # Frees memory while the window stays hidden; everything is rebuilt on use
+        self.trimmer = IdleTrimmer(IDLE_TRIM_MINUTES * 60)
+        self.history = None
+        if AUTOCOMPLETE_SUGGESTIONS > 0:
+            self.history = HistoryIndex(max_entries=AUTOCOMPLETE_MAX_ENTRIES)
+            self.trimmer.add(self.history.trim)
+        self.saved_history = None  # Translation history, opened by warm_up()
+        self.memory_loaded = False  # Fuzzy memory filled from the history (on show, after trims)
+        self.history_mode = False  # Ctrl+F: the input searches the history
+        self.history_results = []
+        self.suggestions = []
+        self.suggestion_labels = []
+        self.selected_suggestion = -1
+        self.shown_text = None  # Input whose successful result is on screen
+        self.shown_result = None
+        self.result_shown = False
         self.typing_timer = None
         self.root = None
         self.is_visible = False
         self.hwnd = None
         self.bg_color = COLORS['background']
         self.copy_button = None
+        self.stats_window = None
+        self.offline_label = None
+        self.online_timer = None
+        
+    @property
+    def translator(self):
+        if self._translator is None:
+            self.build_services()
+        return self._translator
+        
+    @property
+    def engine(self):
+        if self._engine is None:
+            self.build_services()
+        return self._engine
+        
+    @property
+    def pipeline(self):
+        if self._pipeline is None:
+            self.build_services()
+        return self._pipeline
+        
+    def build_services(self):
+        """Import and create the translation stack (idempotent, any thread)."""
+        with self.services_lock:
+            if self._translator is not None:
+                return
+            from translator import TranslationService
+            from engine import TranslationEngine
+            from pipeline import RequestPipeline
+            
+            translator = TranslationService(PRIMARY_LANGUAGE)
+            translator.latency_listeners.append(self.debouncer.record_latency)
+            translator.breaker.listeners.append(self.on_circuit_change)
+            self._engine = TranslationEngine(translator)
+            self._pipeline = RequestPipeline(self._engine, self.on_translation_done)
+            if SPECULATIVE_PREFETCH:
+                from prefetch import SpeculativePrefetcher
+                self.prefetcher = SpeculativePrefetcher(
+                    self._engine, self._pipeline.idle, PREFETCH_BUDGET_PER_MINUTE)
+            self._translator = translator
+            self.trimmer.add(lambda: self._engine.release(IDLE_CACHE_FLOOR).result(timeout=5))
+            if translator.memory is not None:
+                self.trimmer.add(self.release_memory)
+        self.register_stats()
+        
+    def warm_up(self):
+        """Build services, backend and detector, and start the engine loop."""
+        with metrics.span('warm_up'):
+            self.translator.warm_up()
+            self.engine.start()
+            if self.history is not None:
+                self.history.load(get_data_path(HISTORY_INDEX_FILE))
+            if HISTORY_ENABLED:
+                from history import TranslationHistory
+                self.saved_history = TranslationHistory()
+                self.trimmer.add(self.saved_history.trim)
+                metrics.add_stats('history', self.saved_history.stats)
+        self.engine.prewarm()
+        self.engine.start_keep_alive(KEEP_ALIVE_INTERVAL, KEEP_ALIVE_BUDGET_PER_HOUR)
+        
+    def load_memory(self):
+        """Fill the fuzzy memory with the newest history entries, oldest first (background thread)."""
+        memory = self._translator.memory
+        for entry in reversed(self.saved_history.search('', memory.max_entries)):
+            memory.add(entry['text'], dict(entry, success=True))
+        
+    def release_memory(self):
+        """Idle trim: empty the fuzzy memory; the next show loads it again."""
+        self._translator.memory.clear()
+        self.memory_loaded = False
+        
+    def prewarm(self):
+        """Open or refresh the backend connection in the background (any thread)."""
+        engine = self._engine
+        if engine is not None and engine.loop is not None:
+            engine.prewarm()
+        
+    def register_stats(self):
+        """Expose component counters to the metrics export."""
+        metrics.add_stats('cache', self.translator.cache.stats)
+        metrics.add_stats('service', lambda: self.translator.stats)
+        metrics.add_stats('engine', lambda: self.engine.stats)
+        # Released while idle: exporting stats must not rebuild it
+        metrics.add_stats('backend', lambda: self.translator.backend.stats()
+                          if self.translator.has_backend else {})
+        metrics.add_stats('pipeline', lambda: self.pipeline.stats)
+        metrics.add_stats('debounce', self.debouncer.stats)
+        metrics.add_stats('memory', lambda: dict(self.trimmer.stats,
+                                                 rss_mb=(rss_bytes() or 0) / 2**20))
+        if self.history is not None:
+            metrics.add_stats('autocomplete', self.history.stats)
+        if self.translator.memory is not None:
+            metrics.add_stats('fuzzy', lambda: dict(self.translator.memory.stats,
+                                                    entries=len(self.translator.memory)))
+        if self.prefetcher:
+            metrics.add_stats('prefetch', lambda: dict(self.prefetcher.stats,
+                                                       hit_rate=self.prefetcher.hit_rate()))
         
     def create_window(self):
         """Create the main window."""
         self.root = tk.Tk()
         self.root.title("Quick Translator")
+        self.dispatcher.attach(self.root)
         
         # Frameless window
         self.root.overrideredirect(True)
@@ -113,8 +260,9 @@ class TranslatorWindow:
         main_frame.pack(fill=tk.BOTH, expand=True)
         
         # Input container
-        input_container = tk.Frame(main_frame, bg=COLORS['input_bg'], highlightthickness=1,
-                                   highlightbackground=COLORS['border'])
+        self.input_container = input_container = tk.Frame(
+            main_frame, bg=COLORS['input_bg'], highlightthickness=1,
+            highlightbackground=COLORS['border'])
         input_container.pack(fill=tk.X, padx=4)
         
         # Search input
@@ -134,6 +282,42 @@ class TranslatorWindow:
         )
         self.search_input.pack(fill=tk.X, ipady=10, padx=12, pady=2)
         
+        # Shown while the backend is unreachable (packed only then)
+        self.offline_label = tk.Label(
+            input_container,
+            text="● çevrimdışı",
+            font=('Segoe UI', 9),
+            fg=COLORS['warning'],
+            bg=COLORS['input_bg'],
+        )
+        
+        # Shown in history search mode (packed only then)
+        self.history_label = tk.Label(
+            input_container,
+            text="Geçmiş:",
+            font=('Segoe UI', 11),
+            fg=COLORS['text_secondary'],
+            bg=COLORS['input_bg'],
+        )
+        
+        # Autocomplete suggestions and history results (packed under the input only when there are any)
+        self.suggestion_frame = tk.Frame(main_frame, bg=COLORS['result_bg'])
+        rows = max(AUTOCOMPLETE_SUGGESTIONS, HISTORY_SEARCH_RESULTS if HISTORY_ENABLED else 0)
+        for index in range(max(0, rows)):
+            label = tk.Label(
+                self.suggestion_frame,
+                text="",
+                font=('Segoe UI', 11),
+                fg=COLORS['text'],
+                bg=COLORS['result_bg'],
+                anchor='w',
+                padx=12,
+                pady=3,
+                cursor="hand2",
+            )
+            label.bind('<Button-1>', lambda e, i=index: self.pick_suggestion(i))
+            self.suggestion_labels.append(label)
+        
         # Result frame
         self.result_frame = tk.Frame(main_frame, bg=COLORS['result_bg'])
         
@@ -185,17 +369,22 @@ class TranslatorWindow:
         self.source_info.pack(fill=tk.X, pady=(6, 0))
         
         # Bind keys
-        self.root.bind('<Escape>', lambda e: self.hide_window())
+        self.root.bind('<Escape>', self.on_escape)
         self.root.bind('<FocusOut>', self.on_focus_out)
-        self.search_input.bind('<Return>', lambda e: self.perform_translation())
+        self.search_input.bind('<Return>', self.on_return)
+        self.search_input.bind('<Down>', lambda e: self.move_suggestion(1))
+        self.search_input.bind('<Up>', lambda e: self.move_suggestion(-1))
+        self.search_input.bind('<Tab>', self.on_tab)
+        self.search_input.bind('<Control-f>', lambda e: self.set_history_mode(not self.history_mode))
         
         # Get HWND for Windows API calls
         self.root.update_idletasks()
-        self.hwnd = windll.user32.GetParent(self.root.winfo_id())
-        
-        # Apply Windows effects
-        apply_acrylic(self.hwnd)
-        set_rounded_corners(self.hwnd)
+        if windll is not None:
+            self.hwnd = windll.user32.GetParent(self.root.winfo_id())
+            
+            # Apply Windows effects
+            apply_acrylic(self.hwnd)
+            set_rounded_corners(self.hwnd)
         
         # Start hidden
         self.root.withdraw()
@@ -207,41 +396,288 @@ class TranslatorWindow:
         """Handle text input changes with debounce."""
         if self.typing_timer:
             self.root.after_cancel(self.typing_timer)
+            self.typing_timer = None
             
-        text = self.search_var.get().strip()
+        raw_text = self.search_var.get()
+        text = raw_text.strip()
+        if self.history_mode:
+            self.typing_timer = self.root.after(
+                HISTORY_SEARCH_DELAY_MS if text else 0, lambda: self.update_history_results(text))
+            return
+        self.update_suggestions(text)
         if text:
-            self.typing_timer = self.root.after(400, self.perform_translation)
+            metrics.mark('keystroke')
+            self.debouncer.on_keystroke()
+            cached = self.translator.cached(text)
+            if cached is not None:
+                # Already translated: show it right away, no request needed
+                self.debouncer.next_delay(cached=True)
+                self.pipeline.cancel()
+                if self.prefetcher:
+                    # Only a pause makes it a final lookup, not every cached prefix
+                    self.typing_timer = self.root.after(
+                        self.debouncer.default_delay, lambda: self.on_cached_lookup(text))
+                self.show_result(cached)
+                return
+            near = self.translator.fuzzy_result(text)
+            if near is not None:
+                # A similar input was translated before: show it while the real
+                # one comes, superseding results for earlier input still on the way
+                self.show_result(near, self.pipeline.cancel())
+            if self.prefetcher:
+                self.prefetcher.on_input(raw_text)
+            delay = self.debouncer.next_delay()
+            self.typing_timer = self.root.after(delay, self.on_debounce)
         else:
+            if self._pipeline is not None:
+                self._pipeline.cancel()
             self.result_frame.pack_forget()
+            self.result_shown = False
+            self.shown_text = None
             self.adjust_height(False)
             
+    def update_suggestions(self, text: str):
+        """Show the best history completions of text with their cached translations."""
+        suggestions = []
+        if self.history is not None and text:
+            with metrics.span('autocomplete'):
+                suggestions = self.history.complete(text, AUTOCOMPLETE_SUGGESTIONS)
+        if not suggestions and not self.suggestions:
+            return
+        lines = []
+        missing = []  # Not in memory: looked up on disk off the Tk thread
+        for index, shown in enumerate(suggestions):
+            cached = self.translator.cached(shown)
+            if cached is not None and cached['success']:
+                shown = f"{shown}   →   {cached['translated']}"
+            else:
+                missing.append(index)
+            lines.append(shown)
+        self.show_suggestions(suggestions, lines)
+        if missing:
+            future = self.engine.lookup([suggestions[index] for index in missing])
+            future.add_done_callback(lambda done: self.dispatcher.post(
+                lambda: self.fill_suggestions(suggestions, missing, done)))
+        
+    def fill_suggestions(self, suggestions: list, indexes: list, future):
+        """Add translations found on disk, if the rows still show these suggestions."""
+        if self.suggestions is not suggestions or future.cancelled() or future.exception():
+            return
+        for index, cached in zip(indexes, future.result()):
+            if cached is not None and cached['success']:
+                self.suggestion_labels[index].config(
+                    text=f"{suggestions[index]}   →   {cached['translated']}")
+        
+    def update_history_results(self, text: str):
+        """Search the history for text on its own thread (no network); results come back later."""
+        self.typing_timer = None
+        metrics.mark('history_search')
+
+        def found(entries):
+            metrics.record_since('history_search', 'history_search', clear=True)
+            self.dispatcher.post(lambda: self.show_history_results(text, entries))
+        self.saved_history.search_async(text, HISTORY_SEARCH_RESULTS, found)
+        
+    def show_history_results(self, text: str, entries: list):
+        """Show the newest history entries matching text, unless the input changed since."""
+        if not self.history_mode or self.search_var.get().strip() != text:
+            return
+        self.history_results = entries
+        self.show_suggestions([entry['text'] for entry in entries],
+                              [f"{entry['text']}   →   {entry['translated']}" for entry in entries])
+        
+    def show_suggestions(self, suggestions: list, lines: list):
+        """Fill the rows under the input (suggestions are the texts they stand for)."""
+        self.suggestions = suggestions
+        self.selected_suggestion = -1
+        
+        for index, label in enumerate(self.suggestion_labels):
+            if index >= len(lines):
+                label.pack_forget()
+                continue
+            label.config(text=lines[index], bg=COLORS['result_bg'])
+            label.pack(fill=tk.X)
+        
+        if suggestions:
+            self.suggestion_frame.pack(fill=tk.X, padx=4, after=self.input_container)
+        else:
+            self.suggestion_frame.pack_forget()
+        self.adjust_height(self.result_shown)
+        
+    def move_suggestion(self, step: int):
+        """Move the suggestion highlight with the arrow keys."""
+        if not self.suggestions:
+            return
+        self.selected_suggestion = max(-1, min(len(self.suggestions) - 1,
+                                               self.selected_suggestion + step))
+        for index, label in enumerate(self.suggestion_labels):
+            selected = index == self.selected_suggestion
+            label.config(bg=COLORS['input_bg'] if selected else COLORS['result_bg'])
+        return 'break'
+        
+    def pick_suggestion(self, index: int):
+        """Put a suggestion into the input (its translation comes from the cache)."""
+        if not 0 <= index < len(self.suggestions):
+            return
+        text = self.suggestions[index]
+        if self.history_mode:
+            entry = self.history_results[index]
+            # Cached first, so the input change shows it without a request
+            self.translator.remember(entry['text'], entry['translated'],
+                                     entry['source_lang'], entry['target_lang'])
+            self.set_history_mode(False)
+        self.search_var.set(text)
+        self.search_input.icursor(tk.END)
+        self.search_input.focus_set()
+        
+    def set_history_mode(self, enabled: bool):
+        """Switch the input between translating and searching the history."""
+        if enabled and self.saved_history is None:
+            return 'break'  # Not opened (yet, or history_enabled is off)
+        self.history_mode = enabled
+        if self.typing_timer:
+            self.root.after_cancel(self.typing_timer)
+            self.typing_timer = None
+        if self._pipeline is not None:
+            self._pipeline.cancel()
+        self.result_frame.pack_forget()
+        self.result_shown = False
+        self.history_results = []
+        self.show_suggestions([], [])
+        if enabled:
+            self.history_label.pack(side=tk.LEFT, padx=(12, 0), before=self.search_input)
+        else:
+            self.history_label.pack_forget()
+        # Empty input: the newest entries in history mode, nothing otherwise
+        self.search_var.set("")
+        return 'break'
+        
+    def on_escape(self, event=None):
+        if self.history_mode:
+            self.set_history_mode(False)
+        else:
+            self.hide_window()
+        
+    def on_return(self, event=None):
+        if self.selected_suggestion >= 0:
+            self.pick_suggestion(self.selected_suggestion)
+        elif self.history_mode:
+            self.pick_suggestion(0)
+        else:
+            self.perform_translation()
+        
+    def on_tab(self, event=None):
+        if self.suggestions:
+            self.pick_suggestion(max(0, self.selected_suggestion))
+            return 'break'
+            
+    def on_debounce(self):
+        """Debounce timer fired."""
+        self.typing_timer = None
+        metrics.record_since('keystroke', 'keystroke_to_debounce')
+        self.debouncer.on_fire()
+        self.perform_translation()
+        
+    def on_cached_lookup(self, text):
+        """The user paused on an input answered from the cache."""
+        self.typing_timer = None
+        self.prefetcher.on_lookup(text)
+        
     def perform_translation(self):
         """Perform the translation."""
         text = self.search_var.get().strip()
         if not text:
             return
             
-        def translate():
-            result = self.translator.translate(text)
-            self.root.after(0, lambda: self.show_result(result))
-            
-        threading.Thread(target=translate, daemon=True).start()
+        if self.typing_timer:
+            self.root.after_cancel(self.typing_timer)
+            self.typing_timer = None
+            self.debouncer.on_fire()
+        if self.prefetcher:
+            self.prefetcher.on_lookup(text)
+        self.pipeline.submit(text)
+        
+    def on_translation_done(self, generation, result):
+        """Called from the engine thread when a result is ready."""
+        self.dispatcher.post(lambda: self.show_result(result, generation))
         
-    def show_result(self, result):
+    def show_result(self, result, generation=None):
         """Show translation result."""
+        if generation is not None and not self.pipeline.is_current(generation):
+            self.pipeline.record_stale()
+            return
+            
+        with metrics.span('render'):
+            self.render_result(result)
+        if 'progress' not in result:
+            metrics.record_since('keystroke', 'keystroke_to_render')
+        
+    def render_result(self, result):
+        """Update the result widgets."""
         if result['success']:
             self.translated_label.config(text=result['translated'])
+            self.shown_text = self.search_var.get().strip()
+            self.shown_result = result
             
             source_name = self.translator.get_language_name(result['source_lang'])
             target_name = self.translator.get_language_name(result['target_lang'])
-            self.source_info.config(text=f"{source_name} → {target_name}")
+            if result.get('offline'):
+                # Word-by-word gloss: not worth remembering as a translation
+                self.shown_text = None
+                self.source_info.config(text=f"{source_name} → {target_name} · çevrimdışı sözlük")
+            elif 'progress' in result:
+                # Leading sentences of a long text; the rest is still coming
+                self.shown_text = None
+                done, total = result['progress']
+                self.source_info.config(text=f"{source_name} → {target_name} · {done}/{total}")
+            elif 'fuzzy' in result:
+                # Translation of a similar input, not of this one
+                self.shown_text = None
+                similarity, similar = result['fuzzy']
+                self.source_info.config(
+                    text=f"{source_name} → {target_name} · ≈%{similarity * 100:.0f} «{similar}»")
+            else:
+                self.source_info.config(text=f"{source_name} → {target_name}")
         else:
             self.translated_label.config(text="Çeviri yapılamadı")
             self.source_info.config(text=result.get('error', 'Bilinmeyen hata'))
+            self.shown_text = None
             
         self.result_frame.pack(fill=tk.X, pady=(10, 0), padx=4)
+        self.result_shown = True
         self.adjust_height(True)
 
+    def on_circuit_change(self, state: str):
+        """Called from any thread when the backend circuit opens or closes."""
+        self.dispatcher.post(lambda: self.show_offline(state != 'closed'))
+        
+    def show_offline(self, offline: bool):
+        """Show or hide the offline indicator and keep probing while it is shown."""
+        if self.offline_label is None:
+            return
+        if offline:
+            self.offline_label.pack(side=tk.RIGHT, padx=(0, 10), before=self.search_input)
+            if self.online_timer is None:
+                self.schedule_online_check()
+        else:
+            self.offline_label.pack_forget()
+            if self.online_timer is not None:
+                self.root.after_cancel(self.online_timer)
+                self.online_timer = None
+                
+    def schedule_online_check(self):
+        delay = max(1.0, self.translator.breaker.retry_in())
+        self.online_timer = self.root.after(int(delay * 1000), self.check_online)
+        
+    def check_online(self):
+        """Probe the backend (through prewarm) while the window is open and offline."""
+        self.online_timer = None
+        # Hidden: the hotkey prewarm probes on the next show
+        if not self.is_visible or not self.translator.breaker.is_open:
+            return
+        self.prewarm()
+        self.schedule_online_check()
+        
     def copy_to_clipboard(self):
         """Copy translated text to clipboard."""
         text = self.translated_label.cget("text")
@@ -265,6 +701,9 @@ class TranslatorWindow:
             new_height = max(160, required_height)
         else:
             new_height = WINDOW_HEIGHT
+        if self.suggestions:
+            self.root.update_idletasks()
+            new_height += self.suggestion_frame.winfo_reqheight()
             
         geo = self.root.geometry()
         parts = geo.split('+')
@@ -276,12 +715,14 @@ class TranslatorWindow:
         alpha = 0.0
         self.root.attributes('-alpha', alpha)
         self.root.deiconify()
+        metrics.record_since('hotkey', 'hotkey_to_visible')
         
         def fade():
             nonlocal alpha
             alpha += 0.15
             if alpha >= 0.95:
                 self.root.attributes('-alpha', 0.95)
+                metrics.record_since('hotkey', 'hotkey_to_shown', clear=True)
                 # Ensure focus after animation
                 force_foreground(self.hwnd)
                 self.search_input.focus_force()
@@ -293,8 +734,11 @@ class TranslatorWindow:
         
     def show_window(self):
         """Show the window centered on screen."""
+        if self.history_mode:
+            self.set_history_mode(False)
         self.search_var.set("")
         self.result_frame.pack_forget()
+        self.result_shown = False
         
         # Reset position
         x = (self.screen_width - WINDOW_WIDTH) // 2
@@ -302,7 +746,15 @@ class TranslatorWindow:
         self.root.geometry(f"{WINDOW_WIDTH}x{WINDOW_HEIGHT}+{x}+{y}")
         
         self.is_visible = True
+        self.trimmer.cancel()
+        if (not self.memory_loaded and self.saved_history is not None
+                and self._translator is not None and self._translator.memory is not None):
+            self.memory_loaded = True
+            threading.Thread(target=self.load_memory, name='memory-load', daemon=True).start()
         self.animate_open()
+        if self._translator is not None and self._translator.breaker.is_open:
+            if self.online_timer is None:
+                self.schedule_online_check()
         
         # Force focus immediately too
         force_foreground(self.hwnd)
@@ -311,8 +763,29 @@ class TranslatorWindow:
         
     def hide_window(self):
         """Hide the window."""
+        if self._pipeline is not None:
+            self._pipeline.cancel()
         self.root.withdraw()
         self.is_visible = False
+        self.remember_input()
+        self.trimmer.schedule()
+        
+    def remember_input(self):
+        """Add the last successfully translated input to the history and autocomplete index."""
+        if not self.shown_text:
+            return
+        if self.saved_history is not None:
+            self.saved_history.add(self.shown_text, self.shown_result)
+        if self.history is not None:
+            self.history.record(self.shown_text)
+            threading.Thread(target=self.save_history, daemon=True).start()
+        self.shown_text = None
+        
+    def save_history(self):
+        try:
+            self.history.save(get_data_path(HISTORY_INDEX_FILE))
+        except OSError:
+            pass
         
     def on_focus_out(self, event):
         """Hide window when focus is lost."""
@@ -328,6 +801,38 @@ class TranslatorWindow:
         except:
             pass
             
+    def show_stats(self):
+        """Show a live metrics summary window."""
+        if self.stats_window is not None and self.stats_window.winfo_exists():
+            self.stats_window.lift()
+            return
+            
+        self.stats_window = tk.Toplevel(self.root)
+        self.stats_window.title("Quick Translator - İstatistikler")
+        self.stats_window.configure(bg=COLORS['background'])
+        label = tk.Label(
+            self.stats_window,
+            font=('Consolas', 10),
+            fg=COLORS['text'],
+            bg=COLORS['background'],
+            justify='left',
+            anchor='nw',
+            padx=12,
+            pady=10,
+        )
+        label.pack(fill=tk.BOTH, expand=True)
+        
+        def refresh():
+            if not self.stats_window.winfo_exists():
+                return
+            if metrics.enabled:
+                label.config(text=metrics.summary() or "Henüz ölçüm yok")
+            else:
+                label.config(text="Metrikler kapalı (settings.json: metrics_enabled)")
+            self.stats_window.after(1000, refresh)
+            
+        refresh()
+        
     def toggle_window(self):
         """Toggle window visibility."""
         if self.is_visible: